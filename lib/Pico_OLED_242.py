@@ -1,29 +1,166 @@
 import framebuf
+import uasyncio as asyncio
 import utime
 from machine import I2C, SPI, Pin
 
+from lib.glyph_cache import GlyphCache
 from lib.hardware_config import (
+    OLED_CONTRAST,
     OLED_CS_PIN,
     OLED_DC_PIN,
+    OLED_GLYPH_CACHE,
+    OLED_I2C_ADDR,
+    OLED_I2C_FREQ,
+    OLED_I2C_ID,
+    OLED_I2C_SCL_PIN,
+    OLED_I2C_SDA_PIN,
+    OLED_INTERFACE,
     OLED_MOSI_PIN,
     OLED_RST_PIN,
     OLED_SCK_PIN,
+    OLED_SHADOW_FRAME,
+    OLED_SPI_DMA,
+    OLED_TRANSFER_MODE,
 )
+from lib.spi_dma import make_spi_dma
 
 Device_SPI = 1
 Device_I2C = 0
-SET_DISP = 0xAE
 
-Device = Device_SPI if Device_SPI == 1 else Device_I2C
+Device = Device_I2C if OLED_INTERFACE == "i2c" else Device_SPI
+
+# I2C control bytes (Co=0): everything after them is commands / display data
+I2C_CMD_PREFIX = b"\x00"
+I2C_DATA_PREFIX = b"\x40"
+
+# Power-on command sequence, sent as one batch
+INIT_CMDS = bytes(
+    (
+        0xAE,  # Turn off the display
+        0x00,  # Set low column address
+        0x10,  # Set high column address
+        0x20,  # Set memory addressing mode
+        0x00,  # Horizontal addressing mode
+        0xC8,  # Set COM scan direction
+        0xA6,  # Set normal/inverse display
+        0xA8,  # Set multiplex ratio
+        0x3F,  # Set ratio to 63
+        0xD3,  # Set display offset
+        0x00,  # Offset value is 0
+        0xD5,  # Set display clock divide ratio/oscillator frequency
+        0x80,  # Default divide ratio
+        0xD9,  # Set pre-charge period
+        0x22,  # Default value
+        0xDA,  # Set COM pin configuration
+        0x12,  # Default configuration
+        0xDB,  # Set VCOMH
+        0x40,  # Default value
+        0xA1,  # Set segment remap
+        0x81,  # Set contrast
+        OLED_CONTRAST,  # Full brightness level
+        0xAF,  # Turn on the display
+    )
+)
+
+
+# show() transfer modes
+TRANSFER_BYTE = "byte"  # Legacy: one write_data() per byte
+TRANSFER_PAGE = "page"  # One burst per 128-byte page
+TRANSFER_FRAME = "frame"  # One burst for the whole 1 KB frame
+
+# Bytes a window is worth before a neighbour is merged into it instead
+# (six address commands plus the chip-select/DC turnaround).
+WINDOW_COST = 8
+
+
+class Frame:
+    """Pixels to send plus the dirty, blanking and power state taken with them."""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.view = memoryview(buf)
+        self.dirty = 0
+        self.spans_left = bytearray(8)
+        self.spans_right = bytearray(8)
+        # Rows to send as black, per page, within columns blank_x0..x1-1
+        self.blank_rows = bytearray(8)
+        self.blank_x0 = 0
+        self.blank_x1 = 0
+        self.panel_on = True
+        self.contrast = OLED_CONTRAST
 
 
 class OLED_2inch42(framebuf.FrameBuffer):
-    def __init__(self):
+    def __init__(
+        self,
+        transfer_mode=OLED_TRANSFER_MODE,
+        shadow_frame=OLED_SHADOW_FRAME,
+        dma=None,
+        glyph_cache=OLED_GLYPH_CACHE,
+    ):
         self.width = 128
         self.height = 64
         self.white = 0xFFFF
         self.black = 0x0000
+        self.transfer_mode = transfer_mode
 
+        self.init_bus(dma)
+        # Preallocated command batches, filled in place before sending
+        self.cmd1 = bytearray(1)
+        self.cmd2 = bytearray(2)
+        self.window_cmds = bytearray(b"\x21\x00\x7f\x22\x00\x07")
+        self.init_us = 0
+        self.buffer = bytearray(self.height * self.width // 8)
+        self.view = memoryview(self.buffer)
+        # Bit n set = page n changed since the last show(); the changed
+        # columns of that page are dirty_x0[n] <= col < dirty_x1[n].
+        self.dirty_pages = 0
+        self.dirty_x0 = bytearray(8)
+        self.dirty_x1 = bytearray(8)
+        # Frame reused by show(), so a flush allocates nothing
+        self.frame = Frame(self.buffer)
+        # show_async() sends from a copy of the buffer taken here.
+        # snapshot_busy is set while it is suspended on it; resend collects
+        # the pages sent newer than that copy, which it may still send over,
+        # to mark dirty again once it is done.
+        self.snapshot = Frame(bytearray(len(self.buffer)))
+        self.snapshot_busy, self.resend = False, 0
+        # One-shot blanking for the next show(): blank() turns the panel
+        # off, blank_region() sends a rectangle as black. The show() after
+        # that restores both; the buffer itself is never touched.
+        self.panel_on = True  # as last sent; owned by whoever sends frames
+        self.panel_dark = False  # the last frame taken left the panel off
+        self.panel_off_pending = False
+        self.blank_pending = False
+        self.blank_rows = bytearray(8)
+        self.blank_x0 = 0
+        self.blank_x1 = 0
+        self.blank_rect = (0, 0, 0, 0)
+        self.blanked = None
+        # Persistent power state, applied by the next show() like blank():
+        # asleep keeps the panel off until wake(); brightness is the wanted
+        # contrast, self.contrast the one last sent.
+        self.asleep = False
+        self.brightness = OLED_CONTRAST
+        self.brightness_taken = OLED_CONTRAST
+        self.contrast = OLED_CONTRAST
+        # Set by DisplayService while it owns the transport on Core 1;
+        # show() then hands frames over instead of sending them itself.
+        self.flusher = None
+        # Staging area for windows narrower than the panel
+        self.scratch = memoryview(bytearray(self.height * self.width // 8))
+        # Optional copy of what the panel currently shows. show() then only
+        # sends the bytes that differ from it.
+        self.shadow = bytearray(len(self.buffer)) if shadow_frame else None
+        self.shadow_stale = True
+        # Pre-rendered digits that text_scaled() blits instead of scaling
+        self.glyphs = GlyphCache() if glyph_cache else None
+        super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        self.init_display()
+        self.resync()
+
+    def init_bus(self, dma):
+        """Sets up the pins and the SPI or I2C transport."""
         self.cs = Pin(OLED_CS_PIN, Pin.OUT)
         self.rst = Pin(OLED_RST_PIN, Pin.OUT)
         self.dc = Pin(OLED_DC_PIN, Pin.OUT)
@@ -42,29 +179,147 @@ class OLED_2inch42(framebuf.FrameBuffer):
                 miso=None,
             )
             self.dc(1)
+            # Bursts go out by DMA; every other bus access waits for it first
+            if dma is None and OLED_SPI_DMA:
+                dma = make_spi_dma()
         else:
             self.dc(0)
             self.cs(0)
-            self.i2c = I2C(0, scl=Pin(9), sda=Pin(8), freq=1000000)
+            self.i2c = I2C(
+                OLED_I2C_ID,
+                scl=Pin(OLED_I2C_SCL_PIN),
+                sda=Pin(OLED_I2C_SDA_PIN),
+                freq=OLED_I2C_FREQ,
+            )
             self.temp = bytearray(2)
-        self.buffer = bytearray(self.height * self.width // 8)
-        super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
-        self.init_display()
+            dma = None
+        self.dma = dma
+
+    # Drawing primitives (mark the area they touch, then draw)
+
+    def invalidate(self):
+        """Flags the whole panel for the next show()."""
+        self.dirty_pages = 0xFF
+        for page in range(8):
+            self.dirty_x0[page] = 0
+            self.dirty_x1[page] = self.width
+
+    def resync(self):
+        """Forgets what the panel shows; the next show() sends every byte."""
+        self.shadow_stale = True
+        self.invalidate()
+
+    def mark_dirty(self, x, y, w, h):
+        """Flags the page/column window covering a rectangle."""
+        left = max(x, 0)
+        right = min(x + w, self.width)
+        top = max(y, 0)
+        bottom = min(y + h, self.height) - 1
+        if right <= left or bottom < top:
+            return
+        for page in range(top >> 3, (bottom >> 3) + 1):
+            bit = 1 << page
+            if self.dirty_pages & bit:
+                self.dirty_x0[page] = min(self.dirty_x0[page], left)
+                self.dirty_x1[page] = max(self.dirty_x1[page], right)
+            else:
+                self.dirty_pages |= bit
+                self.dirty_x0[page] = left
+                self.dirty_x1[page] = right
+
+    def fill(self, c):
+        self.invalidate()
+        super().fill(c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        self.mark_dirty(x, y, w, h)
+        super().rect(x, y, w, h, c, f)
+
+    def line(self, x1, y1, x2, y2, c):
+        left, top = min(x1, x2), min(y1, y2)
+        self.mark_dirty(left, top, max(x1, x2) - left + 1, max(y1, y2) - top + 1)
+        super().line(x1, y1, x2, y2, c)
+
+    def copy_page_span(self, src_page, dst_page, left, right):
+        """Copies columns left..right-1 of one page onto another page."""
+        src = src_page * 128
+        dst = dst_page * 128
+        self.view[dst + left : dst + right] = self.view[src + left : src + right]
+        self.mark_dirty(left, dst_page * 8, right - left, 8)
+
+    def save_buffer(self, dst):
+        """Copies the whole buffer into dst (same size); nothing is sent."""
+        dst[:] = self.buffer
+
+    def read_pages(self, dst, page):
+        """Copies whole pages, from page on, into dst (128 bytes per page)."""
+        start = page * 128
+        dst[:] = self.view[start : start + len(dst)]
+
+    def restore_buffer(self, src):
+        """Copies a buffer saved by save_buffer() back for the next show()."""
+        self.view[:] = src
+        self.invalidate()
+
+    def blit_pages(self, data, x, page, width):
+        """Copies page-aligned MONO_VLSB bytes (width columns per page) to
+        column x of a page, one slice per page. Clipped to the panel."""
+        left = max(x, 0)
+        right = min(x + width, self.width)
+        if right <= left:
+            return
+        for row in range(len(data) // width):
+            dst_page = page + row
+            if 0 <= dst_page < 8:
+                src = row * width - x
+                dst = dst_page * 128
+                self.view[dst + left : dst + right] = data[src + left : src + right]
+        self.mark_dirty(left, page * 8, right - left, len(data) // width * 8)
+
+    def text_scaled(self, s, x, y, scale):
+        size = 8 * scale
+        self.mark_dirty(x, y, len(s) * size, size)
+        digits = self.glyphs.get(scale) if self.glyphs is not None else None
+        if digits is None:
+            super().text_scaled(s, x, y, scale)
+            return
+        for ch in s:
+            value = ord(ch) - 48
+            if 0 <= value <= 9:
+                # Key 0: only lit pixels are copied, like drawn text
+                self.blit(digits[value], x, y, 0)
+            else:
+                super().text_scaled(ch, x, y, scale)
+            x += size
+
+    def wait_dma(self):
+        """Blocks until a DMA burst in flight has been sent."""
+        if self.dma is not None:
+            self.dma.wait()
 
     def write_cmd(self, cmd):
+        self.cmd1[0] = cmd
+        self.write_cmds(self.cmd1)
+
+    def write_cmds(self, seq):
+        """Sends a run of command bytes in a single transfer.
+
+        seq is any bytes-like object; callers with changing arguments fill
+        one of the preallocated command buffers rather than build a new one.
+        """
         if Device == Device_SPI:
+            self.wait_dma()
             self.cs(1)
             self.dc(0)
             self.cs(0)
-            self.spi.write(bytearray([cmd]))
+            self.spi.write(seq)
             self.cs(1)
         else:
-            self.temp[0] = 0x00  # Co=1, D/C#=0
-            self.temp[1] = cmd
-            self.i2c.writeto(0x3C, self.temp)
+            self.i2c.writevto(OLED_I2C_ADDR, (I2C_CMD_PREFIX, seq))
 
     def write_data(self, buf):
         if Device == Device_SPI:
+            self.wait_dma()
             self.cs(1)
             self.dc(1)
             self.cs(0)
@@ -73,52 +328,329 @@ class OLED_2inch42(framebuf.FrameBuffer):
         else:
             self.temp[0] = 0x40  # Co=1, D/C#=0
             self.temp[1] = buf
-            self.i2c.writeto(0x3C, self.temp)
+            self.i2c.writeto(OLED_I2C_ADDR, self.temp)
+
+    def write_burst(self, data):
+        """Sends a run of display data in a single transfer.
+
+        With DMA this returns once the transfer has started; CS stays low
+        until the next bus access has waited for it to finish.
+        """
+        if Device == Device_SPI:
+            self.wait_dma()
+            self.cs(1)
+            self.dc(1)
+            self.cs(0)
+            if self.dma is not None:
+                self.dma.start(data)
+                return
+            self.spi.write(data)
+            self.cs(1)
+        else:
+            # One transaction; writevto avoids copying data behind the prefix
+            self.i2c.writevto(OLED_I2C_ADDR, (I2C_DATA_PREFIX, data))
+
+    def write_window(self, col_start, col_end, page_start, page_end, data):
+        """Sets a column/page address window and streams data into it."""
+        cmds = self.window_cmds  # 0x21 column range, 0x22 page range
+        cmds[1] = col_start
+        cmds[2] = col_end
+        cmds[4] = page_start
+        cmds[5] = page_end
+        self.write_cmds(cmds)
+        self.write_burst(data)
+
+    def set_contrast(self, level):
+        self.cmd2[0] = 0x81
+        self.cmd2[1] = level
+        self.write_cmds(self.cmd2)
+        self.contrast = level
 
     def init_display(self):
         """Initialize display"""
+        start = utime.ticks_us()
         self.rst(1)
         utime.sleep(0.001)
         self.rst(0)
         utime.sleep(0.01)
         self.rst(1)
 
-        self.write_cmd(0xAE)  # Turn off the display
+        self.write_cmds(INIT_CMDS)
+        # Time taken to bring the panel up, reset pulse included
+        self.init_us = utime.ticks_diff(utime.ticks_us(), start)
 
-        self.write_cmd(0x00)  # Set low column address
-        self.write_cmd(0x10)  # Set high column address
+    # Power saving (the buffer is kept, so waking needs no redraw)
 
-        self.write_cmd(0x20)  # Set memory addressing mode
-        self.write_cmd(0x00)  # Horizontal addressing mode
+    def dim(self, level):
+        """Sets the contrast the next show() sends, in step with the frames."""
+        self.brightness = level
 
-        self.write_cmd(0xC8)  # Set COM scan direction
-        self.write_cmd(0xA6)  # Set normal/inverse display
+    def sleep(self):
+        """Turns the panel off from the next show() until wake()."""
+        self.asleep = True
 
-        self.write_cmd(0xA8)  # Set multiplex ratio
-        self.write_cmd(0x3F)  # Set ratio to 63
+    def wake(self):
+        """Turns a sleeping panel back on with the next show()."""
+        self.asleep = False
 
-        self.write_cmd(0xD3)  # Set display offset
-        self.write_cmd(0x00)  # Offset value is 0
+    # Blinking without redrawing
 
-        self.write_cmd(0xD5)  # Set display clock divide ratio/oscillator frequency
-        self.write_cmd(0x80)  # Default divide ratio
+    def blank(self):
+        """Turns the panel off for the next show(); the one after turns it
+        back on. Costs one command byte per phase."""
+        self.panel_off_pending = True
 
-        self.write_cmd(0xD9)  # Set pre-charge period
-        self.write_cmd(0x22)  # Default value
+    def blank_region(self, x, y, w, h):
+        """Shows a rectangle as black for the next show() only.
 
-        self.write_cmd(0xDA)  # Set COM pin configuration
-        self.write_cmd(0x12)  # Default configuration
+        The buffer keeps its pixels, so the following show() puts them back
+        by sending just the bytes that differ.
+        """
+        left = max(x, 0)
+        right = min(x + w, self.width)
+        top = max(y, 0)
+        bottom = min(y + h, self.height) - 1
+        if right <= left or bottom < top:
+            return
+        for page in range(8):
+            low = max(top - page * 8, 0)
+            high = min(bottom - page * 8, 7)
+            mask = 0
+            if low <= high:
+                mask = (0xFF << low) & (0xFF >> (7 - high))
+            self.blank_rows[page] = mask
+        self.blank_x0 = left
+        self.blank_x1 = right
+        self.blank_rect = (left, top, right - left, bottom - top + 1)
+        self.blank_pending = True
+        self.mark_dirty(*self.blank_rect)
 
-        self.write_cmd(0xDB)  # Set VCOMH
-        self.write_cmd(0x40)  # Default value
+    def needs_flush(self):
+        """True if a show() now would send anything."""
+        return bool(
+            self.dirty_pages
+            or self.panel_off_pending
+            or self.panel_dark != self.asleep
+            or self.brightness != self.brightness_taken
+            or self.blanked is not None
+        )
 
-        self.write_cmd(0xA1)  # Set segment remap
-        self.write_cmd(0xAF)  # Turn on the display
+    def show(self):
+        """Sends the areas modified since the last show() to the panel."""
+        if self.flusher is not None:
+            self.flusher.submit()
+            return
+        self.take_frame(self.frame)
+        if self.snapshot_busy:
+            self.resend |= self.frame.dirty
+        self.send_frame(self.frame)
 
-    def poweroff(self):
-        self.write_cmd(SET_DISP | 0x00)
+    async def show_async(self):
+        """Like show(), but yields to the event loop after every window.
 
-    def show(self):
+        Windows are capped at one page here, so a button press waits for at
+        most one page transfer instead of a whole frame.
+        """
+        if self.flusher is not None:
+            await self.flusher.submit_async()
+            return
+        if self.transfer_mode == TRANSFER_BYTE:
+            self.show()
+            return
+        # Drawing may continue while this is suspended, so the frame is a
+        # copy of the buffer taken with its dirty state: a half-drawn update
+        # never goes out, and what is drawn meanwhile goes to the next flush.
+        # A second show_async() while the copy is in flight makes its own.
+        owner = not self.snapshot_busy
+        frame = self.snapshot if owner else self.new_frame()
+        self.snapshot_busy = True
+        try:
+            frame.buf[:] = self.buffer
+            self.take_frame(frame)
+            if not owner:
+                self.resend |= frame.dirty
+            self._set_contrast(frame.contrast)
+            if not frame.panel_on:
+                self._set_panel(False)
+            for first, last, left, right in self._windows(frame, False):
+                self._send_window(frame, first, last, left, right)
+                if self.dma is not None:
+                    await self.dma.wait_async()
+                else:
+                    await asyncio.sleep_ms(0)
+            if frame.panel_on:
+                self._set_panel(True)
+        finally:
+            if owner:
+                self.snapshot_busy = False
+                for page in range(8):
+                    if self.resend & (1 << page):
+                        self.mark_dirty(0, page * 8, self.width, 8)
+                self.resend = 0
+
+    def new_frame(self):
+        """A Frame with its own pixel buffer, for handing frames elsewhere."""
+        return Frame(bytearray(len(self.buffer)))
+
+    def take_frame(self, frame):
+        """Moves the pending dirty, blanking and power state into frame, leaving
+        the buffer clean. Pixels are not copied; frame.buf is either
+        self.buffer or a copy the caller made."""
+        # Blanking lasts one frame; repaint what was blanked last time
+        if self.blanked is not None:
+            self.mark_dirty(*self.blanked)
+            self.blanked = None
+        frame.dirty = self.dirty_pages
+        self.dirty_pages = 0
+        frame.spans_left[:] = self.dirty_x0
+        frame.spans_right[:] = self.dirty_x1
+        dark = self.panel_off_pending or self.asleep
+        frame.panel_on = not dark
+        self.panel_dark = dark
+        self.panel_off_pending = False
+        frame.contrast = self.brightness
+        self.brightness_taken = self.brightness
+        if self.blank_pending:
+            frame.blank_rows[:] = self.blank_rows
+            frame.blank_x0 = self.blank_x0
+            frame.blank_x1 = self.blank_x1
+            self.blanked = self.blank_rect
+            self.blank_pending = False
+        elif frame.blank_x1:
+            for page in range(8):
+                frame.blank_rows[page] = 0
+            frame.blank_x0 = frame.blank_x1 = 0
+
+    def send_frame(self, frame):
+        """Sends a frame taken with take_frame() to the panel.
+
+        frame.buf need not be self.buffer: the Core-1 display service passes
+        the copy it was handed.
+        """
+        self._set_contrast(frame.contrast)
+        # Off before the data so it stays hidden, on after so it appears whole
+        if not frame.panel_on:
+            self._set_panel(False)
+        if self.transfer_mode == TRANSFER_BYTE:
+            self._show_bytes(frame.buf)
+        else:
+            merge = self.transfer_mode == TRANSFER_FRAME
+            for first, last, left, right in self._windows(frame, merge):
+                self._send_window(frame, first, last, left, right)
+        if frame.panel_on:
+            self._set_panel(True)
+
+    def _set_panel(self, on):
+        if on != self.panel_on:
+            self.write_cmd(0xAF if on else 0xAE)
+            self.panel_on = on
+
+    def _set_contrast(self, level):
+        if level != self.contrast:
+            self.set_contrast(level)
+
+    def _windows(self, frame, merge):
+        """Yields the (first, last, left, right) windows to send for the
+        dirty pages of a frame. With merge, neighbouring pages join one
+        window whenever the extra columns cost less than a second window."""
+        # Diff against the shadow only when it matches the panel
+        shadow = None if self.shadow_stale else self.shadow
+        self.shadow_stale = False
+
+        dirty = frame.dirty
+        first = last = -1
+        left = right = 0
+        for page in range(8):
+            if not dirty & (1 << page):
+                continue
+            segments = self._page_segments(
+                frame, shadow, page, frame.spans_left[page], frame.spans_right[page]
+            )
+            for x0, x1 in segments:
+                if first >= 0:
+                    if merge and page == last + 1:
+                        union_left, union_right = min(left, x0), max(right, x1)
+                        rows = page - first + 1
+                        merged = (union_right - union_left) * rows
+                        separate = (right - left) * (rows - 1) + WINDOW_COST + x1 - x0
+                        if merged <= separate:
+                            left, right, last = union_left, union_right, page
+                            continue
+                    yield first, last, left, right
+                first = last = page
+                left, right = x0, x1
+
+        if first >= 0:
+            yield first, last, left, right
+
+    def _page_segments(self, frame, shadow, page, left, right):
+        """Yields the column runs of a dirty page span that need sending."""
+        base = page * 128
+        buf = frame.buf
+        # Bytes in blank_x0..blank_x1-1 are sent with the blanked rows cleared
+        keep = ~frame.blank_rows[page] & 0xFF
+        blank_x0, blank_x1 = (frame.blank_x0, frame.blank_x1) if keep != 0xFF else (0, 0)
+
+        if shadow is None:
+            if self.shadow is not None:
+                self.shadow[base : base + 128] = buf[base : base + 128]
+                for i in range(base + blank_x0, base + blank_x1):
+                    self.shadow[i] &= keep
+            yield left, right
+            return
+
+        if blank_x0 == blank_x1 and (
+            buf[base + left : base + right] == shadow[base + left : base + right]
+        ):
+            return
+
+        # Runs separated by fewer unchanged bytes than a window costs are
+        # cheaper to send together.
+        run_start = -1
+        run_end = 0
+        for col in range(left, right):
+            i = base + col
+            value = buf[i] & keep if blank_x0 <= col < blank_x1 else buf[i]
+            if value != shadow[i]:
+                if run_start < 0:
+                    run_start = col
+                elif col - run_end >= WINDOW_COST:
+                    yield run_start, run_end
+                    run_start = col
+                run_end = col + 1
+                shadow[i] = value
+        if run_start >= 0:
+            yield run_start, run_end
+
+    def _send_window(self, frame, first_page, last_page, left, right):
+        """Streams columns left..right-1 of a page range from a frame."""
+        view = frame.view
+        width = right - left
+        blanked = frame.blank_x1 and any(frame.blank_rows[first_page : last_page + 1])
+        if width == self.width and not blanked:
+            data = view[first_page * 128 : (last_page + 1) * 128]
+        else:
+            scratch = self.scratch
+            size = 0
+            for page in range(first_page, last_page + 1):
+                start = page * 128 + left
+                scratch[size : size + width] = view[start : start + width]
+                keep = ~frame.blank_rows[page] & 0xFF
+                if keep != 0xFF:
+                    for col in range(
+                        max(left, frame.blank_x0), min(right, frame.blank_x1)
+                    ):
+                        scratch[size + col - left] &= keep
+                size += width
+            data = scratch[:size]
+        self.write_window(left, right - 1, first_page, last_page, data)
+
+    def _show_bytes(self, buf):
+        """Original byte-at-a-time transfer, kept for comparison.
+        Region blanking is not applied here."""
+        if self.shadow is not None:
+            self.shadow[:] = buf
+            self.shadow_stale = False
         for page in range(0, 8):
             self.write_cmd(0xB0 + page)
             self.write_cmd(0x04)
@@ -126,4 +658,24 @@ class OLED_2inch42(framebuf.FrameBuffer):
             if Device == Device_SPI:
                 self.dc(1)
             for num in range(0, 128):
-                self.write_data(self.buffer[page * 128 + num])
+                self.write_data(buf[page * 128 + num])
+
+    def measure_show(self, frames=20, mode=None):
+        """Returns the average time per full-frame show() in microseconds.
+
+        Pass a transfer mode to time it instead of the configured one, e.g.
+        compare measure_show(mode="byte") with measure_show(mode="frame").
+        """
+        previous_mode = self.transfer_mode
+        if mode is not None:
+            self.transfer_mode = mode
+        try:
+            start = utime.ticks_us()
+            for _ in range(frames):
+                self.resync()
+                self.show()
+            self.wait_dma()
+            elapsed = utime.ticks_diff(utime.ticks_us(), start)
+        finally:
+            self.transfer_mode = previous_mode
+        return elapsed // frames
@@ -11,7 +11,18 @@ from lib.hardware_config import (
 
 
 def shot_clock_beep():
-    """Plays the shot clock beep via Core 1."""
+    """Plays the whole shot clock beep, for a thread of its own."""
+    for _ in shot_clock_beep_chunks():
+        pass
+
+
+def shot_clock_beep_chunks():
+    """Plays the shot clock beep, yielding after every 1 KB chunk.
+
+    The Core-1 display service advances it one chunk at a time and sends
+    any waiting frame in between. Once the I2S buffer is full each write()
+    blocks for one chunk of audio, about 11 ms at 48 kHz 16-bit mono.
+    """
 
     audio_out = None
     try:
@@ -39,6 +50,7 @@ def shot_clock_beep():
                     break
 
                 audio_out.write(wav_buffer)
+                yield
 
     except Exception:
         pass  # Be silent on error (missing file, etc)
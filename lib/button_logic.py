@@ -96,23 +96,23 @@ async def _handle_make_shootout(state_machine, game, hw_module):
         await hw_module.render_shootout_stopwatch(state_machine, game, 0)
 
     elif state == State_Machine.SHOOTOUT_P1_WAIT:
-        game.shootout_start_tick = utime.ticks_ms()
+        game.shootout_start_tick = utime.ticks_us()
         state_machine.update_state(State_Machine.SHOOTOUT_P1_RUNNING)
 
     elif state == State_Machine.SHOOTOUT_P1_RUNNING:
-        game.p1_shootout_time = utime.ticks_diff(
-            utime.ticks_ms(), game.shootout_start_tick
+        game.p1_shootout_time = (
+            utime.ticks_diff(utime.ticks_us(), game.shootout_start_tick) // 1000
         )
         state_machine.update_state(State_Machine.SHOOTOUT_P2_WAIT)
         await hw_module.render_shootout_stopwatch(state_machine, game, 0)
 
     elif state == State_Machine.SHOOTOUT_P2_WAIT:
-        game.shootout_start_tick = utime.ticks_ms()
+        game.shootout_start_tick = utime.ticks_us()
         state_machine.update_state(State_Machine.SHOOTOUT_P2_RUNNING)
 
     elif state == State_Machine.SHOOTOUT_P2_RUNNING:
-        game.p2_shootout_time = utime.ticks_diff(
-            utime.ticks_ms(), game.shootout_start_tick
+        game.p2_shootout_time = (
+            utime.ticks_diff(utime.ticks_us(), game.shootout_start_tick) // 1000
         )
         # Render final time immediately to freeze display
         await hw_module.render_shootout_stopwatch(
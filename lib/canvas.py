@@ -0,0 +1,82 @@
+"""
+Base and overlay layers of the panel.
+
+The gameplay screen is the base layer. A menu or dialog drawn over it is an
+overlay: before it draws, the base pixels are copied aside, and dismissing
+it copies them back into the panel buffer instead of repainting the
+gameplay screen from scratch. What changed underneath in the meantime (the
+clocks, a score) is brought up to date by the widgets, see
+GameplayScreen.restore().
+
+A PageCache keeps the rendered pixels of screens that come back unchanged,
+such as the profile names, so showing one again is a copy rather than
+another round of text layout and scaling. It holds as many as fit its byte
+budget.
+"""
+
+PANEL_BYTES = 128 * 64 // 8
+
+
+class Canvas:
+    def __init__(self, size=PANEL_BYTES):
+        # Preallocated, so opening an overlay allocates nothing
+        self.base = bytearray(size)
+        self.saved = False
+
+    def cover(self, oled):
+        """Saves the base layer before an overlay draws over it. Only the
+        first overlay saves; one opened over another keeps that copy."""
+        if not self.saved:
+            oled.save_buffer(self.base)
+            self.saved = True
+
+    def uncover(self, oled):
+        """Puts the saved base layer back. False if there is none."""
+        if not self.saved:
+            return False
+        oled.restore_buffer(self.base)
+        self.saved = False
+        return True
+
+    def drop(self):
+        """Forgets the saved base, e.g. when a new screen replaces it."""
+        self.saved = False
+
+
+class PageCache:
+    """Rendered pixels of whole pages, kept per content key. Once another
+    entry would go over the byte budget, the least recently used one makes
+    room and its buffer is reused."""
+
+    def __init__(self, first_page, pages, budget):
+        self.first_page = first_page
+        self.size = pages * 128
+        self.capacity = budget // self.size
+        self.entries = {}
+        # Keys from least to most recently used
+        self.order = []
+
+    def draw(self, oled, key):
+        """Copies the pixels cached for key into the buffer. False if there
+        are none, in which case the caller draws and store()s them."""
+        data = self.entries.get(key)
+        if data is None:
+            return False
+        oled.blit_pages(data, 0, self.first_page, 128)
+        self.order.remove(key)
+        self.order.append(key)
+        return True
+
+    def store(self, oled, key):
+        """Caches the pages as they are drawn now as the pixels of key."""
+        if not self.capacity:
+            return
+        data = self.entries.get(key)
+        if data is None:
+            if len(self.order) < self.capacity:
+                data = bytearray(self.size)
+            else:
+                data = self.entries.pop(self.order.pop(0))
+            self.entries[key] = data
+            self.order.append(key)
+        oled.read_pages(data, self.first_page)
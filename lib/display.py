@@ -1,10 +1,16 @@
+from lib import layouts
+from lib.fonts import SEVEN_SEGMENT
 from lib.hardware_config import DISPLAY_REGIONS
+from lib.regions import get_rect
 
 # Low Level Helpers
+# Regions are given either as a lib.regions handle or by name.
 
 
 def get_region(key):
     """Safe lookup for regions."""
+    if isinstance(key, int):
+        return get_rect(key)
     return DISPLAY_REGIONS.get(key, (0, 0, 0, 0))
 
 
@@ -17,6 +23,7 @@ class TextOptions:
         clear=True,
         x_offset=0,
         y_offset=0,
+        font=None,
     ):
         self.font_size = font_size
         self.align = align
@@ -24,25 +31,46 @@ class TextOptions:
         self.clear = clear
         self.x_offset = x_offset
         self.y_offset = y_offset
+        # A lib.fonts BitmapFont to draw with instead of the scaled ROM font
+        self.font = font
 
 
 DEFAULT_OPTIONS = TextOptions()
 
+# Shared options for the render path, so a redraw builds no TextOptions.
+# Treat them as read-only; pass x_offset to draw_text_in_region() instead.
+TEXT_CENTER = DEFAULT_OPTIONS
+TEXT_LEFT = TextOptions(align="left")
+TEXT_RIGHT = TextOptions(align="right")
+CLOCK_DIGIT = TextOptions(font=SEVEN_SEGMENT)
 
-def draw_text_in_region(oled, region_key, text, options=DEFAULT_OPTIONS):
+# Interned number strings: drawing a digit or score formats nothing
+NUMBERS = tuple(str(n) for n in range(100))
+DIGITS = NUMBERS[:10]
+TWO_DIGITS = tuple(f"{n:02d}" for n in range(100))
+
+
+def number_str(n):
+    """str(n), from the table for 0-99."""
+    return NUMBERS[n] if 0 <= n < 100 else str(n)
+
+
+def draw_text_in_region(oled, region_key, text, options=DEFAULT_OPTIONS, x_offset=0):
     """
     Draws text aligned within a specific region.
-    Uses TextOptions for styling and behavior configuration.
+    Uses TextOptions for styling and behavior configuration; x_offset is
+    added to the options' own offset.
     """
     x, y, w, h = get_region(region_key)
-    x += options.x_offset
+    x += options.x_offset + x_offset
     y += options.y_offset
 
     if options.clear:
         oled.rect(x, y, w, h, oled.black, True)
 
+    font = options.font
     # Calculate text dimensions (approximate based on font size)
-    char_w = 8 * options.font_size
+    char_w = 8 * options.font_size if font is None else font.width
     text_w = len(str(text)) * char_w
 
     # Calculate X position
@@ -54,15 +82,42 @@ def draw_text_in_region(oled, region_key, text, options=DEFAULT_OPTIONS):
         draw_x = x
 
     # Calculate Y position (vertically centered)
-    char_h = 8 * options.font_size
+    char_h = 8 * options.font_size if font is None else font.height
     draw_y = y + (h - char_h) // 2
 
-    oled.text_scaled(str(text), int(draw_x), int(draw_y), options.font_size)
+    if font is None:
+        oled.text_scaled(str(text), int(draw_x), int(draw_y), options.font_size)
+    else:
+        # Bitmap fonts are page-aligned: copy each glyph in whole pages
+        page = int(draw_y) >> 3
+        for ch in str(text):
+            oled.blit_pages(font.glyph(ch), int(draw_x), page, char_w)
+            draw_x += char_w
 
     if options.send_payload:
         oled.show()
 
 
+def draw_layout(oled, handle):
+    """Draws static text compiled into lib/layouts.py, where
+    draw_text_in_region() would put it, without measuring anything."""
+    steps = layouts.STEPS
+    texts = layouts.TEXTS
+    first = layouts.FIRST
+    for i in range(first[handle], first[handle + 1]):
+        base = i * layouts.FIELDS
+        if steps[base + 2]:
+            oled.rect(
+                steps[base],
+                steps[base + 1],
+                steps[base + 2],
+                steps[base + 3],
+                oled.black,
+                True,
+            )
+        oled.text_scaled(texts[i], steps[base + 4], steps[base + 5], steps[base + 6])
+
+
 def draw_rect_in_region(
     oled, region_key, fill=True, send_payload=False, clear=True, x_offset=0
 ):
@@ -87,12 +142,30 @@ def draw_rect_in_region(
         oled.show()
 
 
+def clear_region(oled, region):
+    """Clears one section without sending it (no argument tuple to build)."""
+    x, y, width, height = get_region(region)
+    if width:
+        oled.rect(x, y, width, height, oled.black, True)
+
+
 def display_clear(oled, *regions, send_payload=True):
     """Clears specified sections of the OLED display."""
     for region in regions:
-        if region in DISPLAY_REGIONS:
-            x, y, width, height = DISPLAY_REGIONS[region]
-            oled.rect(x, y, width, height, oled.black, True)
+        clear_region(oled, region)
+
+    if send_payload:
+        oled.show()
+
+
+def display_blank(oled, region, send_payload=True):
+    """Shows a section as blank for one flush without erasing it.
+
+    The following flush puts the pixels back, so blinking costs no redraw.
+    """
+    x, y, width, height = get_region(region)
+    if width:
+        oled.blank_region(x, y, width, height)
 
     if send_payload:
         oled.show()
@@ -100,6 +173,8 @@ def display_clear(oled, *regions, send_payload=True):
 
 def process_timer_duration(duration):
     """Formats duration as a string with leading zeros."""
+    if 0 <= duration < 100:
+        return TWO_DIGITS[duration]
     return f"{duration:02d}"
 
 
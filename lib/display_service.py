@@ -0,0 +1,132 @@
+"""
+Core-1 display flush service.
+
+Core 0 keeps drawing into the OLED buffer. show() copies the finished frame
+into a hand-off slot under a lock and returns. A persistent loop on Core 1
+swaps that slot with the buffer it sends from, then streams the dirty
+windows while Core 0 carries on with the game. Core 1 can host only one
+thread, so the same loop also plays the shot clock beep, one short chunk at
+a time between frames: a frame handed over mid-beep waits for one chunk,
+not for the rest of the beep.
+"""
+
+import _thread
+
+import uasyncio as asyncio
+import utime
+
+
+class DisplayService:
+    def __init__(self, oled):
+        self.oled = oled
+        self.lock = _thread.allocate_lock()
+        # Hand-off slot: filled by Core 0, swapped out by Core 1, both under
+        # the lock. pending is True while it holds a frame not yet taken.
+        self.handoff = oled.new_frame()
+        self.pending = False
+        # Frame being sent; only the Core-1 loop touches it.
+        self.sending = oled.new_frame()
+        self.job = None
+        self.running = False
+        self.active = False
+        self.frames_submitted = 0
+        self.frames_sent = 0
+
+    # Core 0 side
+
+    def start(self):
+        """Starts the Core-1 loop and routes oled.show() through it."""
+        self.running = True
+        self.oled.flusher = self
+        _thread.start_new_thread(self.run, ())
+
+    def stop(self):
+        """Ends the Core-1 loop once the pending frame is out and hands the
+        transport back to show()."""
+        self.running = False
+        while self.active:
+            utime.sleep_ms(1)
+        self.oled.flusher = None
+
+    def submit(self):
+        """Hands the current frame to Core 1.
+
+        Waits while the previous frame is still in the slot, so frames are
+        never dropped or merged.
+        """
+        while not self._try_submit():
+            utime.sleep_us(100)
+
+    async def submit_async(self):
+        """Like submit(), but yields to the event loop while waiting."""
+        while not self._try_submit():
+            await asyncio.sleep_ms(1)
+
+    def post(self, job):
+        """Queues a job to run on Core 1 between frames.
+
+        A job is an iterator; the loop advances it one step at a time and
+        sends any handed-over frame before the next step, so each step must
+        be well under a frame interval. Returns False if the previous job
+        has not started yet.
+        """
+        with self.lock:
+            if self.job is not None:
+                return False
+            self.job = job
+        return True
+
+    def _try_submit(self):
+        oled = self.oled
+        if not oled.needs_flush():
+            return True
+        with self.lock:
+            if self.pending:
+                return False
+            self.handoff.buf[:] = oled.buffer
+            oled.take_frame(self.handoff)
+            self.pending = True
+            self.frames_submitted += 1
+        return True
+
+    # Core 1 side
+
+    def run(self):
+        """Core-1 loop: sends handed-off frames first, then steps the posted
+        job. A job started before stop() still runs to the end."""
+        self.active = True
+        job = None
+        try:
+            while True:
+                if self._take_frame():
+                    self.oled.send_frame(self.sending)
+                    self.frames_sent += 1
+                    continue
+                if job is None:
+                    if not self.running:
+                        break
+                    job = self._take_job()
+                    if job is None:
+                        utime.sleep_ms(1)
+                        continue
+                try:
+                    next(job)
+                except StopIteration:
+                    job = None
+        finally:
+            self.active = False
+
+    def _take_frame(self):
+        """Swaps the hand-off slot with the sending buffer if it is full."""
+        with self.lock:
+            if not self.pending:
+                return False
+            self.handoff, self.sending = self.sending, self.handoff
+            self.pending = False
+        return True
+
+    def _take_job(self):
+        with self.lock:
+            job = self.job
+            self.job = None
+        return job
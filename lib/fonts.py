@@ -0,0 +1,66 @@
+"""
+Page-aligned bitmap fonts.
+
+Glyphs are stored the way the panel stores pixels: MONO_VLSB, one byte per
+column per 8-pixel page, pages top to bottom. A glyph drawn at a page
+boundary is therefore a straight copy of each page row into the OLED buffer
+(see OLED_2inch42.blit_pages), with no per-pixel work at all.
+"""
+
+
+class BitmapFont:
+    def __init__(self, width, height, glyphs):
+        self.width = width
+        self.height = height  # a multiple of 8
+        self.pages = height // 8
+        # char -> memoryview of pages * width bytes; slicing it copies nothing
+        self.glyphs = glyphs
+        self.blank = memoryview(bytes(self.pages * width))
+
+    def glyph(self, ch):
+        """The bytes for a character; unknown characters draw as blank."""
+        return self.glyphs.get(ch, self.blank)
+
+
+# Seven-segment digits for the shot clock, 32x56 (7 pages).
+# Segment rectangles (x, y, w, h), with a gap at each corner.
+SEGMENTS = {
+    "a": (5, 0, 22, 5),
+    "b": (27, 5, 5, 21),
+    "c": (27, 30, 5, 21),
+    "d": (5, 51, 22, 5),
+    "e": (0, 30, 5, 21),
+    "f": (0, 5, 5, 21),
+    "g": (5, 26, 22, 4),
+}
+DIGIT_SEGMENTS = {
+    "0": "abcdef",
+    "1": "bc",
+    "2": "abdeg",
+    "3": "abcdg",
+    "4": "bcfg",
+    "5": "acdfg",
+    "6": "acdefg",
+    "7": "abc",
+    "8": "abcdefg",
+    "9": "abcdfg",
+}
+
+
+def _render_segments(names, width, height):
+    data = bytearray(width * height // 8)
+    for name in names:
+        x, y, w, h = SEGMENTS[name]
+        for row in range(y, y + h):
+            bit = 1 << (row & 7)
+            base = (row >> 3) * width
+            for col in range(x, x + w):
+                data[base + col] |= bit
+    return memoryview(bytes(data))
+
+
+SEVEN_SEGMENT = BitmapFont(
+    32,
+    56,
+    {ch: _render_segments(names, 32, 56) for ch, names in DIGIT_SEGMENTS.items()},
+)
@@ -0,0 +1,77 @@
+"""
+Frame coalescing in front of the display.
+
+Render code flushes whenever it finishes a piece of the screen: a
+display_clear() or draw_rect_in_region() with send_payload left on, the
+show_async() at the end of a screen, a clock refresh racing a shot clock
+tick. With the scheduler in front, show() and show_async() only ask for a
+frame. One flush task sends it once the rest of the event-loop turn has
+drawn, and no sooner than OLED_FRAME_INTERVAL_MS after the previous frame,
+so the panel gets one frame however many times a turn asked for it.
+
+show_async() still returns only once the frame it asked for is out, so
+callers that order work after a flush (the beep after a shot clock tick)
+keep that order. requests - flushes counts the flushes saved. Any other
+attribute is passed through to the display behind the scheduler.
+"""
+
+import uasyncio as asyncio
+import utime
+
+from lib.hardware_config import OLED_FRAME_INTERVAL_MS
+
+
+class FrameScheduler:
+    def __init__(self, oled, interval_ms=OLED_FRAME_INTERVAL_MS):
+        self.oled = oled
+        self.interval_ms = interval_ms
+        # Drawing goes straight to the display, not through __getattr__
+        self.rect = oled.rect
+        self.line = oled.line
+        self.text_scaled = oled.text_scaled
+        self.blit_pages = oled.blit_pages
+        self.fill = oled.fill
+        self.wanted = asyncio.Event()
+        self.sent = asyncio.Event()
+        self.last_flush = utime.ticks_ms()
+        # Frames taken by the flush task and frames it has finished; a frame
+        # asked for now is the one after frames_taken
+        self.frames_taken = 0
+        self.frames_done = 0
+        # Flushes asked for by render code, and frames actually flushed
+        self.requests = 0
+        self.flushes = 0
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined here: the display's own
+        return getattr(self.oled, name)
+
+    def show(self):
+        """Asks for a frame; the flush task sends it."""
+        self.requests += 1
+        self.wanted.set()
+
+    async def show_async(self):
+        """Asks for a frame and waits until it has been sent."""
+        self.show()
+        frame = self.frames_taken + 1
+        while self.frames_done < frame:
+            await self.sent.wait()
+
+    async def run(self):
+        """The flush task. Start it before anything awaits show_async()."""
+        oled = self.oled
+        while True:
+            await self.wanted.wait()
+            # Let the tasks that are ready draw first; then keep to the rate
+            idle = utime.ticks_diff(utime.ticks_ms(), self.last_flush)
+            await asyncio.sleep_ms(max(self.interval_ms - idle, 0))
+            self.wanted.clear()
+            self.frames_taken += 1
+            if oled.needs_flush():
+                self.flushes += 1
+                await oled.show_async()
+            self.last_flush = utime.ticks_ms()
+            self.frames_done = self.frames_taken
+            self.sent.set()
+            self.sent.clear()
@@ -0,0 +1,40 @@
+"""
+Pre-rendered digit glyphs.
+
+text_scaled() scales the 8x8 ROM font up pixel by pixel on every call. Here
+the digits 0-9 are rendered once per scale into small FrameBuffers, so the
+driver can blit them instead. Scales are taken in order of preference and
+skipped when they would push the cache over its byte budget.
+"""
+
+import framebuf
+
+from lib.hardware_config import OLED_GLYPH_BUDGET, OLED_GLYPH_SCALES
+
+DIGITS = "0123456789"
+
+
+class GlyphCache:
+    def __init__(self, scales=OLED_GLYPH_SCALES, budget=OLED_GLYPH_BUDGET):
+        # scale -> list of ten FrameBuffers, indexed by digit value
+        self.tables = {}
+        self.size_bytes = 0
+        for scale in scales:
+            size = 8 * scale
+            need = len(DIGITS) * size * ((size + 7) // 8)
+            if self.size_bytes + need > budget:
+                continue
+            self.tables[scale] = [self._render(ch, scale) for ch in DIGITS]
+            self.size_bytes += need
+
+    @staticmethod
+    def _render(ch, scale):
+        size = 8 * scale
+        buf = bytearray(size * ((size + 7) // 8))
+        glyph = framebuf.FrameBuffer(buf, size, size, framebuf.MONO_VLSB)
+        glyph.text_scaled(ch, 0, 0, scale)
+        return glyph
+
+    def get(self, scale):
+        """The digit glyphs for a scale, or None if it is not cached."""
+        return self.tables.get(scale)
@@ -11,6 +11,52 @@ OLED_RST_PIN = 4
 OLED_CS_PIN = 5
 OLED_DC_PIN = 6
 
+# OLED Interface: "spi" (pins above) or "i2c" (pins below)
+OLED_INTERFACE = "spi"
+OLED_I2C_ID = 0
+OLED_I2C_SCL_PIN = 9
+OLED_I2C_SDA_PIN = 8
+OLED_I2C_ADDR = 0x3C
+OLED_I2C_FREQ = 1000000
+
+# OLED Transfer Settings
+# "frame": one burst per frame, "page": one burst per page,
+# "byte": legacy per-byte writes (useful for timing comparisons).
+OLED_TRANSFER_MODE = "frame"
+# Keep a 1 KB copy of the panel contents and only send bytes that changed.
+OLED_SHADOW_FRAME = True
+# Send frames from a persistent Core-1 thread (which then also plays the beep).
+OLED_CORE1_FLUSH = True
+# Stream SPI bursts with DMA so show() returns while the bytes go out.
+# Needs a firmware with rp2.DMA; the addresses below are for the RP2350.
+OLED_SPI_DMA = False
+OLED_SPI_BASE = 0x40080000  # SPI0 register block
+OLED_SPI_TX_DREQ = 24  # DREQ_SPI0_TX
+# Digits 0-9 are pre-rendered at these text scales (in order of preference)
+# and blitted instead of scaled, as long as they fit the byte budget.
+OLED_GLYPH_CACHE = True
+OLED_GLYPH_SCALES = (3, 2)
+OLED_GLYPH_BUDGET = 8 * 1024
+# Profile names already shown (768 bytes each) are copied back instead of
+# redrawn. Past this budget the least recently shown one is dropped.
+OLED_PROFILE_CACHE_BUDGET = 2 * 768
+
+# Coalesce the flushes render code asks for into one frame per event-loop
+# turn, sent at most once per OLED_FRAME_INTERVAL_MS.
+OLED_FRAME_SCHEDULER = True
+OLED_FRAME_INTERVAL_MS = 20
+# Frame rate of the running shootout stopwatch, which has a task of its own
+STOPWATCH_FPS = 50
+
+# OLED Power Management
+# Contrast while in use (0x7F is the SSD1309 reset value) and once dimmed.
+OLED_CONTRAST = 0x7F
+OLED_DIM_CONTRAST = 0x08
+# Milliseconds without a button press before dimming / switching the panel
+# off. 0 disables that step. Never applied while a clock is running.
+OLED_DIM_TIMEOUT_MS = 2 * 60 * 1000
+OLED_OFF_TIMEOUT_MS = 10 * 60 * 1000
+
 # Audio Settings
 I2S_ID = 0
 I2S_SCK_PIN = 11
@@ -44,7 +90,7 @@ DISPLAY_REGIONS = {
     "p2_timeout_counter_1": (76, 58, 4, 4),
     "p2_timeout_counter_2": (84, 58, 4, 4),
     "p2_timeout_single": (80, 58, 4, 4),
-    "p2_timeouts": (77, 58, 12, 4),
+    "p2_timeouts": (76, 58, 12, 4),
     "shot_clock_full": (0, 0, 128, 56),
     "shot_clock_digit_1": (0, 0, 64, 56),
     "shot_clock_digit_2": (64, 0, 64, 56),
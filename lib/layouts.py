@@ -0,0 +1,206 @@
+"""
+Precomputed placement of the static text.
+
+Generated by tools/compile_layouts.py from hardware_config.DISPLAY_REGIONS;
+do not edit. Each handle is a run of steps, one per line of text: the rect
+to clear (no clear when its width is 0), then the text's position and scale.
+See display.draw_layout().
+"""
+
+from array import array
+
+FIELDS = 7  # per step: clear x, y, w, h, then text x, y, scale
+
+# Handles, in step order
+PROFILE_TITLE = 0
+PROFILE_APA = 1
+PROFILE_BCA = 2
+PROFILE_WNT = 3
+PROFILE_ULTIMATE_POOL = 4
+PROFILE_TIMEOUTS_MODE = 5
+SKILL_LEVEL_PLAYER_1 = 6
+SKILL_LEVEL_PLAYER_2 = 7
+SKILL_LEVEL_LABEL = 8
+GAME_TYPE_TITLE = 9
+GAME_TYPE_8_BALL = 10
+GAME_TYPE_9_BALL = 11
+WNT_TARGET_TITLE = 12
+VICTORY_TITLE = 13
+VICTORY_WINNER_1 = 14
+VICTORY_WINNER_2 = 15
+MENU_HEADER = 16
+EXIT_CONFIRMATION = 17
+TIMEOUTS_MODE_TITLE = 18
+SHOOTOUT_PLAYER_1 = 19
+SHOOTOUT_PLAYER_2 = 20
+TIME_TO_BEAT = 21
+CONFIRM_WIN = 22
+CONFIRM_LOSS = 23
+SHOOTOUT_ANNOUNCEMENT = 24
+
+# First step of each handle; the last entry ends the last handle
+FIRST = array(
+    "h",
+    [
+        0,
+        1,
+        2,
+        3,
+        4,
+        6,
+        8,
+        9,
+        10,
+        11,
+        12,
+        13,
+        14,
+        15,
+        16,
+        17,
+        18,
+        20,
+        21,
+        22,
+        23,
+        24,
+        25,
+        26,
+        27,
+        29,
+    ],
+)
+
+# FIELDS values per step, the steps in handle order
+# fmt: off
+STEPS = array("h", [
+    # PROFILE_TITLE
+    0, 0, 128, 20, 16, 6, 1,
+    # PROFILE_APA
+    0, 30, 128, 24, 28, 30, 3,
+    # PROFILE_BCA
+    0, 30, 128, 24, 28, 30, 3,
+    # PROFILE_WNT
+    0, 30, 128, 24, 28, 30, 3,
+    # PROFILE_ULTIMATE_POOL
+    0, 30, 128, 16, 0, 30, 2,
+    0, 48, 128, 16, 32, 48, 2,
+    # PROFILE_TIMEOUTS_MODE
+    0, 30, 128, 16, 0, 30, 2,
+    0, 48, 128, 16, 32, 48, 2,
+    # SKILL_LEVEL_PLAYER_1
+    0, 10, 128, 8, 32, 10, 1,
+    # SKILL_LEVEL_PLAYER_2
+    0, 10, 128, 8, 32, 10, 1,
+    # SKILL_LEVEL_LABEL
+    0, 25, 128, 8, 16, 25, 1,
+    # GAME_TYPE_TITLE
+    0, 10, 128, 8, 16, 10, 1,
+    # GAME_TYPE_8_BALL
+    0, 30, 128, 16, 16, 30, 2,
+    # GAME_TYPE_9_BALL
+    0, 30, 128, 16, 16, 30, 2,
+    # WNT_TARGET_TITLE
+    0, 10, 128, 8, 36, 10, 1,
+    # VICTORY_TITLE
+    0, 10, 128, 16, 0, 10, 2,
+    # VICTORY_WINNER_1
+    0, 35, 128, 16, 0, 35, 2,
+    # VICTORY_WINNER_2
+    0, 35, 128, 16, 0, 35, 2,
+    # MENU_HEADER
+    0, 2, 64, 16, 0, 2, 2,
+    66, 2, 64, 16, 66, 2, 2,
+    # EXIT_CONFIRMATION
+    0, 0, 128, 56, 12, 24, 1,
+    # TIMEOUTS_MODE_TITLE
+    12, 56, 104, 8, 12, 56, 1,
+    # SHOOTOUT_PLAYER_1
+    0, -2, 128, 20, 0, 0, 2,
+    # SHOOTOUT_PLAYER_2
+    0, -2, 128, 20, 0, 0, 2,
+    # TIME_TO_BEAT
+    0, 44, 128, 12, 16, 46, 1,
+    # CONFIRM_WIN
+    0, 0, 0, 0, 16, 22, 1,
+    # CONFIRM_LOSS
+    0, 0, 0, 0, 12, 22, 1,
+    # SHOOTOUT_ANNOUNCEMENT
+    0, 0, 0, 0, 16, 8, 2,
+    0, 0, 0, 0, 0, 28, 2,
+])
+# fmt: on
+# The text of each step
+TEXTS = (
+    # PROFILE_TITLE
+    "Select Game:",
+    # PROFILE_APA
+    "APA",
+    # PROFILE_BCA
+    "BCA",
+    # PROFILE_WNT
+    "WNT",
+    # PROFILE_ULTIMATE_POOL
+    "Ultimate",
+    "Pool",
+    # PROFILE_TIMEOUTS_MODE
+    "Timeouts",
+    "Mode",
+    # SKILL_LEVEL_PLAYER_1
+    "Player 1",
+    # SKILL_LEVEL_PLAYER_2
+    "Player 2",
+    # SKILL_LEVEL_LABEL
+    "Skill Level:",
+    # GAME_TYPE_TITLE
+    "Select Game:",
+    # GAME_TYPE_8_BALL
+    "8-Ball",
+    # GAME_TYPE_9_BALL
+    "9-Ball",
+    # WNT_TARGET_TITLE
+    "Race to",
+    # VICTORY_TITLE
+    "VICTORY!",
+    # VICTORY_WINNER_1
+    "Player 1",
+    # VICTORY_WINNER_2
+    "Player 2",
+    # MENU_HEADER
+    "Game",
+    "Menu",
+    # EXIT_CONFIRMATION
+    "Are you sure?",
+    # TIMEOUTS_MODE_TITLE
+    "Timeouts Mode",
+    # SHOOTOUT_PLAYER_1
+    "Player 1",
+    # SHOOTOUT_PLAYER_2
+    "Player 2",
+    # TIME_TO_BEAT
+    "Time to beat",
+    # CONFIRM_WIN
+    "Confirm Win?",
+    # CONFIRM_LOSS
+    "Confirm Loss?",
+    # SHOOTOUT_ANNOUNCEMENT
+    "6 Ball",
+    "Shootout",
+)
+
+PROFILE_NAMES = {
+    "APA": PROFILE_APA,
+    "BCA": PROFILE_BCA,
+    "Timeouts Mode": PROFILE_TIMEOUTS_MODE,
+    "Ultimate Pool": PROFILE_ULTIMATE_POOL,
+    "WNT": PROFILE_WNT,
+}
+MESSAGES = {
+    ("Confirm Win?", 1): CONFIRM_WIN,
+    ("Confirm Loss?", 1): CONFIRM_LOSS,
+    ("6 Ball\nShootout", 2): SHOOTOUT_ANNOUNCEMENT,
+}
+SKILL_LEVEL_PLAYERS = (SKILL_LEVEL_PLAYER_1, SKILL_LEVEL_PLAYER_2)
+GAME_TYPES = (GAME_TYPE_8_BALL, GAME_TYPE_9_BALL)
+VICTORY_WINNERS = (VICTORY_WINNER_1, VICTORY_WINNER_2)
+SHOOTOUT_PLAYERS = (SHOOTOUT_PLAYER_1, SHOOTOUT_PLAYER_2)
@@ -114,6 +114,9 @@ class State_Machine:
 class Game_Stats:
     def __init__(self):
         self.speaker_muted = False
+        # lib.canvas.PageCache of the profile names, created by the UI on
+        # first use; the pixels outlive a match, so reset() keeps it
+        self.profile_pixels = None
         self.rules_config = {}
         self._load_rules()
         self._set_defaults()
@@ -133,7 +136,6 @@ class Game_Stats:
         self.profile_based_countdown = 0
         self.countdown = 0
         self.match_countdown = 1800
-        self.prev_match_countdown = None
         self.match_timer_running = False
         self.extension_duration = 0
         self.extension_available = True
@@ -168,6 +170,8 @@ class Game_Stats:
         self.selected_profile = None
         self.timeouts_only = False
         self.winner = 0  # 0: No winner yet, 1: Player 1, 2: Player 2
+        # lib.ui_widgets.GameplayScreen, created by the UI on first use
+        self.gameplay_screen = None
         self._set_menu_defaults()
 
         # New State Tracking Variables
@@ -175,9 +179,16 @@ class Game_Stats:
         self.temp_setting_value = None
 
         # Shootout Stats
+        self._set_shootout_defaults()
+
+    def _set_shootout_defaults(self):
+        """Sets the default values for the shootout."""
+        # Times in ms, measured from a utime.ticks_us() start tick
         self.p1_shootout_time = 0
         self.p2_shootout_time = 0
         self.shootout_start_tick = 0
+        # Shooter the stopwatch screen was drawn for; 0 = redraw all
+        self.stopwatch_shooter = 0
 
     def _set_menu_defaults(self):
         """Sets the default values for the menu."""
@@ -190,6 +201,8 @@ class Game_Stats:
             self.speaker_muted,
         ]
         self.current_menu_index = 0
+        # Index the menu lines on screen were drawn for; None = redraw all
+        self.menu_rendered_index = None
         self.current_menu_selection = [
             None,
             self.menu_items[self.current_menu_index],
@@ -0,0 +1,165 @@
+"""
+Numeric readouts that redraw only the digits that changed.
+
+A Layout says where the characters of a readout go and which digit of the
+value each digit cell shows. A NumericField remembers the digits it last
+drew, so drawing a new value redraws only the cells whose digit differs.
+When a readout switches layout (a score gaining a digit, the match clock
+dropping its minutes tens below 10:00) the field clears the areas of the
+old and new layouts and draws it in full, fixed characters included.
+"""
+
+from array import array
+
+from lib import display
+
+NO_DIGIT = 255  # a cell that holds no known digit
+FIELDS = 6  # per cell: clear x, y, w, h, then the glyph origin x, y
+
+
+class Layout:
+    def __init__(self, rects, chars, places, area, options=display.TEXT_CENTER):
+        """rects: one (x, y, w, h) cell per character, cleared before it is
+        drawn; the glyph is placed in it as draw_text_in_region would.
+        chars: the characters, with '0' for the digit cells (e.g. "00:00").
+        places: per character the (divisor, base) picking its digit,
+        value // divisor % base, or None for a fixed character.
+        area: the (x, y, w, h) cleared when a field switches to or from the
+        layout.
+        """
+        self.chars = chars
+        self.places = places
+        self.area = area
+        self.options = options
+        self.count = len(chars)
+        font = options.font
+        char_w = 8 * options.font_size if font is None else font.width
+        char_h = 8 * options.font_size if font is None else font.height
+        cells: list = []
+        for x, y, w, h in rects:
+            if options.align == "center":
+                draw_x = x + (w - char_w) // 2
+            elif options.align == "right":
+                draw_x = x + w - char_w
+            else:
+                draw_x = x
+            cells.extend((x, y, w, h, draw_x, y + (h - char_h) // 2))
+        self.cells = array("h", cells)
+
+
+def _offset_rect(region, options, x_offset=0):
+    x, y, w, h = display.get_region(region)
+    return (x + options.x_offset + x_offset, y + options.y_offset, w, h)
+
+
+def region_layout(regions, chars, places, area, options=display.TEXT_CENTER):
+    """A Layout with one region per character and a region (or None) as
+    its area."""
+    rects = [_offset_rect(region, options) for region in regions]
+    area_rect = (0, 0, 0, 0) if area is None else display.get_region(area)
+    return Layout(rects, chars, places, area_rect, options)
+
+
+def text_layout(region, chars, places, options=display.TEXT_CENTER, x_offset=0):
+    """A Layout drawing the characters where draw_text_in_region would draw
+    them as one string, in one-character cells. Its area is the region,
+    widened to the text where that sticks out."""
+    left, y, w, h = _offset_rect(region, options, x_offset)
+    font = options.font
+    char_w = 8 * options.font_size if font is None else font.width
+    text_w = len(chars) * char_w
+    x = left
+    if options.align == "center":
+        x += (w - text_w) // 2
+    elif options.align == "right":
+        x += w - text_w
+    rects = [(x + i * char_w, y, char_w, h) for i in range(len(chars))]
+    right = max(left + w, x + text_w)
+    left = min(left, x)
+    return Layout(rects, chars, places, (left, y, right - left, h), options)
+
+
+def number_places(digits):
+    """The places of a plain number with that many digits."""
+    return tuple((10 ** (digits - 1 - i), 10) for i in range(digits))
+
+
+class NumericField:
+    def __init__(self, size):
+        # Digit drawn in each cell, NO_DIGIT where unknown
+        self.digits = bytearray(size)
+        self.layout = None
+        self.value = None
+
+    def invalidate(self):
+        """Forgets what is on screen; the next draw() draws in full."""
+        self.layout = None
+        self.value = None
+
+    def sync(self, layout, value):
+        """Records value as already drawn in layout, drawing nothing."""
+        self.layout = layout
+        self.value = value
+        places = layout.places
+        for i in range(layout.count):
+            place = places[i]
+            if place is not None:
+                self.digits[i] = value // place[0] % place[1]
+
+    def draw(self, oled, layout, value):
+        """Draws value, redrawing only the digit cells that changed.
+
+        Returns True if the field switched layout and was drawn in full.
+        Drawing only; the caller flushes.
+        """
+        digits = self.digits
+        switched = layout is not self.layout
+        if switched:
+            # The old layout may reach further, e.g. a score losing a digit
+            old = self.layout
+            if old is not None:
+                self._clear_area(oled, old)
+            self._clear_area(oled, layout)
+            for i in range(layout.count):
+                digits[i] = NO_DIGIT
+            self.layout = layout
+        places = layout.places
+        for i in range(layout.count):
+            place = places[i]
+            if place is None:
+                if switched:
+                    self._draw_cell(oled, layout, i, layout.chars[i])
+                continue
+            digit = value // place[0] % place[1]
+            if digit != digits[i]:
+                self._draw_cell(oled, layout, i, display.DIGITS[digit])
+                digits[i] = digit
+        self.value = value
+        return switched
+
+    def _clear_area(self, oled, layout):
+        x, y, w, h = layout.area
+        if w:
+            oled.rect(x, y, w, h, oled.black, True)
+
+    def _draw_cell(self, oled, layout, i, ch):
+        cells = layout.cells
+        base = i * FIELDS
+        options = layout.options
+        if options.clear:
+            oled.rect(
+                cells[base],
+                cells[base + 1],
+                cells[base + 2],
+                cells[base + 3],
+                oled.black,
+                True,
+            )
+        x = cells[base + 4]
+        y = cells[base + 5]
+        font = options.font
+        if font is None:
+            oled.text_scaled(ch, x, y, options.font_size)
+        else:
+            # Bitmap fonts are page-aligned, see draw_text_in_region
+            oled.blit_pages(font.glyph(ch), x, y >> 3, font.width)
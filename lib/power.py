@@ -0,0 +1,66 @@
+"""
+Inactivity dimming and panel power-down.
+
+The OLED is the largest drain on battery builds. After OLED_DIM_TIMEOUT_MS
+without a button press the contrast steps down, and after OLED_OFF_TIMEOUT_MS
+the panel is switched off. The framebuffer is left alone, so waking up is a
+command or two and nothing is redrawn.
+"""
+
+from lib.hardware_config import (
+    OLED_CONTRAST,
+    OLED_DIM_CONTRAST,
+    OLED_DIM_TIMEOUT_MS,
+    OLED_OFF_TIMEOUT_MS,
+)
+
+# Power levels, in the order the panel steps through them
+AWAKE = 0
+DIMMED = 1
+ASLEEP = 2
+
+
+class PowerManager:
+    def __init__(self, oled, dim_ms=OLED_DIM_TIMEOUT_MS, off_ms=OLED_OFF_TIMEOUT_MS):
+        self.oled = oled
+        self.dim_ms = dim_ms
+        self.off_ms = off_ms
+        self.level = AWAKE
+
+    async def update(self, idle_ms, hold=False):
+        """Steps the panel down once it has been idle long enough.
+
+        hold keeps it at full brightness, e.g. while a clock is running.
+        """
+        if hold:
+            await self.wake()
+            return
+        if self.off_ms and idle_ms >= self.off_ms:
+            level = ASLEEP
+        elif self.dim_ms and idle_ms >= self.dim_ms:
+            level = DIMMED
+        else:
+            return
+        if level > self.level:
+            await self._apply(level)
+
+    async def wake(self):
+        """Restores full brightness.
+
+        Returns True if the panel was off, so the press that woke it can be
+        dropped instead of acting on a screen the player could not see.
+        """
+        was_off = self.level == ASLEEP
+        if self.level != AWAKE:
+            await self._apply(AWAKE)
+        return was_off
+
+    async def _apply(self, level):
+        oled = self.oled
+        if level == ASLEEP:
+            oled.sleep()
+        else:
+            oled.wake()
+            oled.dim(OLED_DIM_CONTRAST if level == DIMMED else OLED_CONTRAST)
+        self.level = level
+        await oled.show_async()
@@ -0,0 +1,201 @@
+"""
+Display regions compiled to integer handles.
+
+Each DISPLAY_REGIONS entry gets a constant (its name in upper case) whose
+value indexes NAMES and the region's (x, y, width, height) tuple, which
+get_rect() returns. Hot render paths pass these handles, so finding a rect
+is a tuple index rather than building and hashing a string key. The
+display helpers still accept the names.
+"""
+
+from lib.hardware_config import DISPLAY_REGIONS
+
+# Handles, in DISPLAY_REGIONS order
+EVERYTHING = 0
+PROFILE_TITLE_SELECTION = 1
+PROFILE_SELECTION = 2
+CONFIRMATION_MESSAGE = 3
+PROFILE_SELECTION_VALUE = 4
+PROFILE_SELECTION_ALT_VALUE = 5
+PROFILE_SELECTION_ALT_VALUE_2 = 6
+SKILL_LEVEL_PLAYER = 7
+SKILL_LEVEL_LABEL = 8
+SKILL_LEVEL_VALUE = 9
+GAME_TYPE_TITLE = 10
+GAME_TYPE_VALUE = 11
+WNT_TARGET_TITLE = 12
+WNT_TARGET_VALUE = 13
+VICTORY_TITLE = 14
+VICTORY_WINNER = 15
+P1_TIMEOUT_COUNTER_1 = 16
+P1_TIMEOUT_COUNTER_2 = 17
+P1_TIMEOUT_SINGLE = 18
+P1_TIMEOUTS = 19
+P2_TIMEOUT_COUNTER_1 = 20
+P2_TIMEOUT_COUNTER_2 = 21
+P2_TIMEOUT_SINGLE = 22
+P2_TIMEOUTS = 23
+SHOT_CLOCK_FULL = 24
+SHOT_CLOCK_DIGIT_1 = 25
+SHOT_CLOCK_DIGIT_2 = 26
+MATCH_CLOCK_FULL = 27
+MATCH_CLOCK_FULL_S = 28
+MATCH_CLOCK_DIGIT_1 = 29
+MATCH_CLOCK_DIGIT_2 = 30
+MATCH_CLOCK_DIGIT_3 = 31
+MATCH_CLOCK_DIGIT_4 = 32
+MATCH_CLOCK_DIGIT_2_S = 33
+MATCH_CLOCK_DIGIT_3_S = 34
+MATCH_CLOCK_DIGIT_4_S = 35
+MATCH_CLOCK_COLON = 36
+MATCH_CLOCK_COLON_S = 37
+TIMEOUTS_MODE_TITLE = 38
+UP_INDICATOR_1 = 39
+UP_INDICATOR_2 = 40
+UP_INDICATOR_1_S = 41
+UP_INDICATOR_2_S = 42
+MENU_SELECTOR = 43
+MENU_ITEMS = 44
+MENU_LINE_PREV = 45
+MENU_LINE_CURR = 46
+MENU_LINE_NEXT = 47
+MENU_CURSOR = 48
+MENU_HEADER_LEFT = 49
+MENU_HEADER_RIGHT = 50
+MENU_SEPARATOR_TOP = 51
+MENU_SEPARATOR_BOTTOM = 52
+MENU_VALUE_COUNTER = 53
+MENU_VALUE_BOOL = 54
+P1_SCORE = 55
+P1_SEPARATOR = 56
+P1_TARGET = 57
+P2_SCORE = 58
+P2_SEPARATOR = 59
+P2_TARGET = 60
+UP_P1_SCORE = 61
+UP_P1_SEPARATOR = 62
+UP_P1_TARGET = 63
+UP_P2_SCORE = 64
+UP_P2_SEPARATOR = 65
+UP_P2_TARGET = 66
+UP_SHOOTOUT_CURRENT_SHOOTER = 67
+UP_SHOOTOUT_STOP_WATCH = 68
+UP_SHOOTOUT_P1_TITLE = 69
+UP_SHOOTOUT_P1_TIME = 70
+SHOOTER_INDICATOR_1 = 71
+SHOOTER_INDICATOR_2 = 72
+SCORELINE_RACK = 73
+SCORELINE_INNING = 74
+
+NAMES = (
+    "everything",
+    "profile_title_selection",
+    "profile_selection",
+    "confirmation_message",
+    "profile_selection_value",
+    "profile_selection_alt_value",
+    "profile_selection_alt_value_2",
+    "skill_level_player",
+    "skill_level_label",
+    "skill_level_value",
+    "game_type_title",
+    "game_type_value",
+    "wnt_target_title",
+    "wnt_target_value",
+    "victory_title",
+    "victory_winner",
+    "p1_timeout_counter_1",
+    "p1_timeout_counter_2",
+    "p1_timeout_single",
+    "p1_timeouts",
+    "p2_timeout_counter_1",
+    "p2_timeout_counter_2",
+    "p2_timeout_single",
+    "p2_timeouts",
+    "shot_clock_full",
+    "shot_clock_digit_1",
+    "shot_clock_digit_2",
+    "match_clock_full",
+    "match_clock_full_s",
+    "match_clock_digit_1",
+    "match_clock_digit_2",
+    "match_clock_digit_3",
+    "match_clock_digit_4",
+    "match_clock_digit_2_s",
+    "match_clock_digit_3_s",
+    "match_clock_digit_4_s",
+    "match_clock_colon",
+    "match_clock_colon_s",
+    "timeouts_mode_title",
+    "up_indicator_1",
+    "up_indicator_2",
+    "up_indicator_1_s",
+    "up_indicator_2_s",
+    "menu_selector",
+    "menu_items",
+    "menu_line_prev",
+    "menu_line_curr",
+    "menu_line_next",
+    "menu_cursor",
+    "menu_header_left",
+    "menu_header_right",
+    "menu_separator_top",
+    "menu_separator_bottom",
+    "menu_value_counter",
+    "menu_value_bool",
+    "p1_score",
+    "p1_separator",
+    "p1_target",
+    "p2_score",
+    "p2_separator",
+    "p2_target",
+    "up_p1_score",
+    "up_p1_separator",
+    "up_p1_target",
+    "up_p2_score",
+    "up_p2_separator",
+    "up_p2_target",
+    "up_shootout_current_shooter",
+    "up_shootout_stop_watch",
+    "up_shootout_p1_title",
+    "up_shootout_p1_time",
+    "shooter_indicator_1",
+    "shooter_indicator_2",
+    "scoreline_rack",
+    "scoreline_inning",
+)
+
+# Handle groups for code that used to build keys at runtime
+MATCH_CLOCK_DIGITS = (
+    MATCH_CLOCK_DIGIT_1,
+    MATCH_CLOCK_DIGIT_2,
+    MATCH_CLOCK_DIGIT_3,
+    MATCH_CLOCK_DIGIT_4,
+)
+# Below 10:00 the minutes-tens digit is not drawn; its slot is never used.
+MATCH_CLOCK_DIGITS_S = (
+    MATCH_CLOCK_DIGIT_1,
+    MATCH_CLOCK_DIGIT_2_S,
+    MATCH_CLOCK_DIGIT_3_S,
+    MATCH_CLOCK_DIGIT_4_S,
+)
+# p1 score, separator, target, then the same for p2
+SCORELINE = (P1_SCORE, P1_SEPARATOR, P1_TARGET, P2_SCORE, P2_SEPARATOR, P2_TARGET)
+UP_SCORELINE = (
+    UP_P1_SCORE,
+    UP_P1_SEPARATOR,
+    UP_P1_TARGET,
+    UP_P2_SCORE,
+    UP_P2_SEPARATOR,
+    UP_P2_TARGET,
+)
+SHOT_CLOCK_DIGITS = (SHOT_CLOCK_DIGIT_1, SHOT_CLOCK_DIGIT_2)
+
+
+# The DISPLAY_REGIONS tuples by handle, so a lookup builds no new tuple
+_RECT_TUPLES = tuple(DISPLAY_REGIONS[name] for name in NAMES)
+
+
+def get_rect(handle):
+    """The (x, y, width, height) of a region handle."""
+    return _RECT_TUPLES[handle]
@@ -0,0 +1,76 @@
+"""
+DMA streaming for the OLED SPI bus.
+
+A burst is copied into a staging buffer and fed to the SPI TX FIFO by a DMA
+channel, so the caller gets the CPU back while the bytes go out. The DMA
+channel and register access are passed in, which lets tests drive SpiDma
+with stand-ins; make_spi_dma() builds the real rp2 version.
+"""
+
+import uasyncio as asyncio
+
+from lib.hardware_config import OLED_SPI_BASE, OLED_SPI_TX_DREQ
+
+# PL022 register offsets and status bits
+SPI_SSPDR = 0x008  # Data register (TX FIFO)
+SPI_SSPSR = 0x00C  # Status register
+SSPSR_BSY = 1 << 4  # Still shifting a frame out
+
+
+class SpiDma:
+    def __init__(self, dma, mem, spi_base=OLED_SPI_BASE, dreq=OLED_SPI_TX_DREQ):
+        self.dma = dma
+        self.mem = mem
+        self.data_reg = spi_base + SPI_SSPDR
+        self.status_reg = spi_base + SPI_SSPSR
+        # Bytes in, fixed FIFO address out, paced by the SPI TX request line
+        self.ctrl = dma.pack_ctrl(
+            size=0, inc_read=True, inc_write=False, treq_sel=dreq, irq_quiet=False
+        )
+        # The caller may redraw its buffer as soon as start() returns
+        self.staging = bytearray(1024)
+        self.done = asyncio.ThreadSafeFlag()
+        dma.irq(self._on_done)
+
+    def _on_done(self, dma):
+        self.done.set()
+
+    def start(self, data):
+        """Starts sending data and returns without waiting for it."""
+        self.wait()
+        count = len(data)
+        self.staging[:count] = data
+        # A transfer nobody awaited leaves the flag set; clear it so that
+        # wait_async() only wakes for this one
+        self.done.clear()
+        self.dma.config(
+            read=self.staging,
+            write=self.data_reg,
+            count=count,
+            ctrl=self.ctrl,
+            trigger=True,
+        )
+
+    def busy(self):
+        """True until the last byte has left the SPI shift register."""
+        return self.dma.active() or self.mem[self.status_reg] & SSPSR_BSY
+
+    def wait(self):
+        """Blocks until the bus is idle; call before touching CS/DC."""
+        while self.busy():
+            pass
+
+    async def wait_async(self):
+        """Yields to the event loop until the transfer completes."""
+        if self.dma.active():
+            await self.done.wait()
+        # The FIFO still drains a few bytes after the DMA finishes
+        self.wait()
+
+
+def make_spi_dma():
+    """Claims a DMA channel for the OLED SPI bus."""
+    import rp2
+    from machine import mem32
+
+    return SpiDma(rp2.DMA(), mem32)
@@ -1,10 +1,9 @@
-from lib.ui_components import (
-    display_timeouts,
-    render_match_timer,
-    render_scoreline,
-    render_ultimate_pool_shooter_indicators,
+from lib.ui_gameplay import (
+    draw_timer_display,
+    enter_idle_mode,
+    enter_shot_clock,
+    update_timer_display,
 )
-from lib.ui_gameplay import enter_idle_mode, enter_shot_clock, update_timer_display
 from lib.ui_screens import (
     render_exit_confirmation,
     render_game_type_selection,
@@ -19,10 +18,7 @@ from lib.ui_screens import (
 )
 
 __all__ = [
-    "display_timeouts",
-    "render_match_timer",
-    "render_scoreline",
-    "render_ultimate_pool_shooter_indicators",
+    "draw_timer_display",
     "enter_idle_mode",
     "enter_shot_clock",
     "update_timer_display",
@@ -37,6 +33,3 @@ __all__ = [
     "render_victory",
     "render_wnt_target_selection",
 ]
-
-# Legacy alias for internal helper if needed
-_render_ultimate_pool_shooter_indicators = render_ultimate_pool_shooter_indicators
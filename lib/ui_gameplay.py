@@ -1,48 +1,38 @@
-from lib import display
+from lib import display, regions
 from lib.models import State_Machine
-from lib.ui_components import render_scoreline, render_ultimate_pool_shooter_indicators
+from lib.ui_widgets import ALL, gameplay_screen
 
 # Gameplay Transitions and Dynamic Updates
 
+FULL_CLEAR_STATES = (
+    State_Machine.APA_GAME_TYPE_SELECTION,
+    State_Machine.PROFILE_SELECTION,
+    State_Machine.MENU,
+)
+
 
 async def enter_idle_mode(state_machine, game, oled):
     prev_state = state_machine.state
+    game.menu_rendered_index = None
     state_machine.update_state(State_Machine.SHOT_CLOCK_IDLE)
 
-    if game.selected_profile == "Ultimate Pool":
-        if prev_state in [
-            State_Machine.APA_GAME_TYPE_SELECTION,
-            State_Machine.PROFILE_SELECTION,
-            State_Machine.MENU,
-        ]:
-            display.display_clear(oled, "everything")
+    screen = gameplay_screen(game)
+    # After a shot the gameplay screen is still up and render() diffs against
+    # it. Leaving a menu or dialog puts the gameplay screen under it back.
+    # Anything else starts from a cleared panel, in the same flush.
+    if screen.mounted != ALL and not screen.restore(oled):
+        if game.selected_profile == "Ultimate Pool":
+            if prev_state in FULL_CLEAR_STATES:
+                display.display_clear(oled, regions.EVERYTHING, send_payload=False)
+            else:
+                display.display_clear(oled, regions.SHOT_CLOCK_FULL, send_payload=False)
         else:
-            display.display_clear(oled, "shot_clock_full")
-    else:
-        display.display_clear(oled, "everything")
+            display.display_clear(oled, regions.EVERYTHING, send_payload=False)
+        screen.mount()
 
-    if game.timeouts_only:
-        game.countdown = game.profile_based_countdown
-        timer_str = display.process_timer_duration(game.countdown)
-        display.draw_text_in_region(
-            oled,
-            "shot_clock_digit_1",
-            timer_str[0],
-            display.TextOptions(font_size=8, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            oled,
-            "shot_clock_digit_2",
-            timer_str[1],
-            display.TextOptions(font_size=8, align="center", send_payload=False),
-        )
-    else:
+    if not game.timeouts_only:
         game.speaker_5_count = 4
 
-    render_scoreline(
-        oled, state_machine, game, send_payload=False, force_match_timer=True
-    )
-
     if game.break_shot:
         if game.selected_profile == "Ultimate Pool" and game.match_countdown < 600:
             game.countdown = 30
@@ -51,86 +41,23 @@ async def enter_idle_mode(state_machine, game, oled):
     else:
         game.countdown = game.profile_based_countdown
 
-    # Render Shot Clock Digits using regions
-    timer_str = display.process_timer_duration(game.countdown)
-    display.draw_text_in_region(
-        oled,
-        "shot_clock_digit_1",
-        timer_str[0],
-        display.TextOptions(font_size=8, align="center", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "shot_clock_digit_2",
-        timer_str[1],
-        display.TextOptions(font_size=8, align="center", send_payload=True),
-    )
+    # Paint what is not on screen yet: everything after a clear, only the
+    # changes otherwise
+    screen.render(oled, state_machine, game)
+    await oled.show_async()
 
 
 async def enter_shot_clock(state_machine, game, oled):
     state_machine.update_state(State_Machine.COUNTDOWN_IN_PROGRESS)
 
 
-async def update_timer_display(state_machine, game, oled):
-    if game.selected_profile == "Ultimate Pool":
-        # If we are in a state with an overlay message, DO NOT clear the full area
-        # as it would wipe the message. Only update match timer digits.
-        overlay_states = [
-            State_Machine.CONFIRM_RACK_END,
-            State_Machine.MENU,
-            State_Machine.EDITING_VALUE,
-            State_Machine.EXIT_MATCH_CONFIRMATION,
-            State_Machine.SHOOTOUT_ANNOUNCEMENT,
-            State_Machine.SHOOTOUT_P1_WAIT,
-            State_Machine.SHOOTOUT_P1_RUNNING,
-            State_Machine.SHOOTOUT_P2_WAIT,
-            State_Machine.SHOOTOUT_P2_RUNNING,
-        ]
+def draw_timer_display(state_machine, game, oled):
+    """Repaints whatever changed on the gameplay screen (the clocks, in
+    practice). Nothing is drawn while another screen covers it. Drawing
+    only; the caller flushes."""
+    gameplay_screen(game).render(oled, state_machine, game)
 
-        if state_machine.state not in overlay_states:
-            # Clear and update shot clock
-            timer_str = display.process_timer_duration(game.countdown)
-            display.draw_text_in_region(
-                oled,
-                "shot_clock_digit_1",
-                timer_str[0],
-                display.TextOptions(font_size=8, align="center", send_payload=False),
-            )
-            display.draw_text_in_region(
-                oled,
-                "shot_clock_digit_2",
-                timer_str[1],
-                display.TextOptions(font_size=8, align="center", send_payload=False),
-            )
 
-        # Always update match timer (helper handles individual digit clearing)
-        # EXCEPT in Menu or Exit Confirmation states to prevent overwriting them.
-        no_match_timer_states = [
-            State_Machine.MENU,
-            State_Machine.EDITING_VALUE,
-            State_Machine.EXIT_MATCH_CONFIRMATION,
-            State_Machine.SHOOTOUT_ANNOUNCEMENT,
-            State_Machine.SHOOTOUT_P1_WAIT,
-            State_Machine.SHOOTOUT_P1_RUNNING,
-            State_Machine.SHOOTOUT_P2_WAIT,
-            State_Machine.SHOOTOUT_P2_RUNNING,
-        ]
-        if state_machine.state not in no_match_timer_states:
-            render_ultimate_pool_shooter_indicators(oled, state_machine, game, False)
-            oled.show()
-        else:
-            oled.show()
-    else:
-        timer_str = display.process_timer_duration(game.countdown)
-        display.draw_text_in_region(
-            oled,
-            "shot_clock_digit_1",
-            timer_str[0],
-            display.TextOptions(font_size=8, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            oled,
-            "shot_clock_digit_2",
-            timer_str[1],
-            display.TextOptions(font_size=8, align="center", send_payload=True),
-        )
+async def update_timer_display(state_machine, game, oled):
+    draw_timer_display(state_machine, game, oled)
+    await oled.show_async()
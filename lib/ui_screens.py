@@ -1,149 +1,167 @@
-from lib import display
-from lib.ui_components import render_scoreline
+from lib import display, layouts
+from lib.canvas import PageCache
+from lib.hardware_config import OLED_PROFILE_CACHE_BUDGET
+from lib.numeric_field import NumericField, text_layout
+from lib.ui_widgets import MATCH_ROW, SCORES, gameplay_screen
 
 # Full Screen Screens/Dialogs
 
+# First page of the profile names, below the "Select Game:" title
+PROFILE_PAGE = 2
+
+# Shootout stopwatch, SS.CC from milliseconds; SSS.CC from 100 s on
+STOPWATCH_OPTIONS = display.TextOptions(font_size=2, align="center")
+STOPWATCH_LAYOUT = text_layout(
+    "up_shootout_stop_watch",
+    "00.00",
+    ((10000, 10), (1000, 10), None, (100, 10), (10, 10)),
+    STOPWATCH_OPTIONS,
+)
+STOPWATCH_WIDE_LAYOUT = text_layout(
+    "up_shootout_stop_watch",
+    "000.00",
+    ((100000, 10), (10000, 10), (1000, 10), None, (100, 10), (10, 10)),
+    STOPWATCH_OPTIONS,
+)
+_stopwatch = NumericField(6)
+
+
+def _stopwatch_layout(ms):
+    return STOPWATCH_WIDE_LAYOUT if ms >= 100000 else STOPWATCH_LAYOUT
+
 
 async def render_profile_selection(state_machine, game, oled, clear_all=False):
-    region = "everything" if clear_all else "profile_selection"
-    display.display_clear(oled, region, send_payload=False)
+    gameplay_screen(game).unmount()
+    if clear_all:
+        display.display_clear(oled, "everything", send_payload=False)
 
     profile_list = game.profile_names
     idx = game.profile_selection_index
     name = profile_list[idx]
 
+    display.draw_layout(oled, layouts.PROFILE_TITLE)
+    # A name shown before is copied back whole, its blank rows included,
+    # so it needs no clear
+    cache = _profile_pixels(game)
+    if not cache.draw(oled, name):
+        display.display_clear(oled, "profile_selection", send_payload=False)
+        _draw_profile_name(oled, name)
+        cache.store(oled, name)
+
+    await oled.show_async()
+
+
+def _profile_pixels(game):
+    """The game's cache of the profile names, created on first use."""
+    cache = game.profile_pixels
+    if cache is None:
+        cache = game.profile_pixels = PageCache(
+            PROFILE_PAGE, 8 - PROFILE_PAGE, OLED_PROFILE_CACHE_BUDGET
+        )
+    return cache
+
+
+def _draw_profile_name(oled, name):
+    handle = layouts.PROFILE_NAMES.get(name)
+    if handle is not None:
+        display.draw_layout(oled, handle)
+        return
+    # A profile tools/compile_layouts.py does not know about yet
     display.draw_text_in_region(
         oled,
-        "profile_title_selection",
-        "Select Game:",
-        display.TextOptions(align="center", send_payload=False),
+        "profile_selection_value",
+        str(name),
+        display.TextOptions(font_size=3, align="center", send_payload=False),
     )
-    if str(name) == "Ultimate Pool":
-        display.draw_text_in_region(
-            oled,
-            "profile_selection_alt_value",
-            "Ultimate",
-            display.TextOptions(font_size=2, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            oled,
-            "profile_selection_alt_value_2",
-            "Pool",
-            display.TextOptions(font_size=2, align="center", send_payload=True),
-        )
-    elif str(name) == "Timeouts Mode":
-        display.draw_text_in_region(
-            oled,
-            "profile_selection_alt_value",
-            "Timeouts",
-            display.TextOptions(font_size=2, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            oled,
-            "profile_selection_alt_value_2",
-            "Mode",
-            display.TextOptions(font_size=2, align="center", send_payload=True),
-        )
-    else:
-        display.draw_text_in_region(
-            oled,
-            "profile_selection_value",
-            str(name),
-            display.TextOptions(font_size=3, align="center", send_payload=True),
-        )
 
 
 async def render_skill_level_selection(state_machine, game, oled, player_num):
     """Renders the skill level selection screen for a player."""
+    gameplay_screen(game).unmount()
     display.display_clear(oled, "everything", send_payload=False)
 
-    display.draw_text_in_region(
-        oled,
-        "skill_level_player",
-        f"Player {player_num}",
-        display.TextOptions(align="center", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "skill_level_label",
-        "Skill Level:",
-        display.TextOptions(align="center", send_payload=False),
-    )
+    display.draw_layout(oled, layouts.SKILL_LEVEL_PLAYERS[player_num - 1])
+    display.draw_layout(oled, layouts.SKILL_LEVEL_LABEL)
 
     sl = game.temp_setting_value
     display.draw_text_in_region(
         oled,
         "skill_level_value",
         str(sl),
-        display.TextOptions(font_size=3, align="center", send_payload=True),
+        display.TextOptions(font_size=3, align="center", send_payload=False),
     )
+    await oled.show_async()
 
 
 async def render_game_type_selection(state_machine, game, oled):
     """Renders the game type selection screen (8-Ball or 9-Ball)."""
+    gameplay_screen(game).unmount()
     display.display_clear(oled, "everything", send_payload=False)
 
-    display.draw_text_in_region(
-        oled,
-        "game_type_title",
-        "Select Game:",
-        display.TextOptions(align="center", send_payload=False),
-    )
-
+    display.draw_layout(oled, layouts.GAME_TYPE_TITLE)
     # temp_setting_value: 0 for 8-Ball, 1 for 9-Ball
-    game_type = "9-Ball" if game.temp_setting_value == 1 else "8-Ball"
-    display.draw_text_in_region(
-        oled,
-        "game_type_value",
-        game_type,
-        display.TextOptions(font_size=2, align="center", send_payload=True),
-    )
+    game_type = 1 if game.temp_setting_value == 1 else 0
+    display.draw_layout(oled, layouts.GAME_TYPES[game_type])
+    await oled.show_async()
 
 
 async def render_wnt_target_selection(state_machine, game, oled):
     """Renders the WNT target selection screen."""
+    gameplay_screen(game).unmount()
     display.display_clear(oled, "everything", send_payload=False)
 
-    display.draw_text_in_region(
-        oled,
-        "wnt_target_title",
-        "Race to",
-        display.TextOptions(align="center", send_payload=False),
-    )
+    display.draw_layout(oled, layouts.WNT_TARGET_TITLE)
 
     target = game.temp_setting_value
     display.draw_text_in_region(
         oled,
         "wnt_target_value",
         str(target),
-        display.TextOptions(font_size=3, align="center", send_payload=True),
+        display.TextOptions(font_size=3, align="center", send_payload=False),
     )
+    await oled.show_async()
 
 
 async def render_victory(state_machine, game, oled, winner_num):
     """Renders the victory screen."""
+    gameplay_screen(game).unmount()
+    game.stopwatch_shooter = 0
     display.display_clear(oled, "everything", send_payload=False)
 
-    display.draw_text_in_region(
-        oled,
-        "victory_title",
-        "VICTORY!",
-        display.TextOptions(font_size=2, align="center", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "victory_winner",
-        f"Player {winner_num}",
-        display.TextOptions(font_size=2, align="center", send_payload=False),
-    )
+    display.draw_layout(oled, layouts.VICTORY_TITLE)
+    display.draw_layout(oled, layouts.VICTORY_WINNERS[winner_num - 1])
 
-    oled.show()
+    await oled.show_async()
 
 
 async def render_message(state_machine, game, oled, message, font_size=1):
     """Renders a generic message on the screen (e.g. for Confirmation)."""
+    screen = gameplay_screen(game)
+    screen.overlay(oled)
+    game.stopwatch_shooter = 0
     display.display_clear(oled, "everything", send_payload=False)
 
+    # The messages the game shows are laid out offline (lib/layouts.py)
+    handle = layouts.MESSAGES.get((message, font_size))
+    if handle is not None:
+        display.draw_layout(oled, handle)
+    else:
+        _draw_message_lines(oled, message, font_size)
+
+    # Keep the bottom row live under the message (except during the shootout
+    # announcement): the running match clock, or the Timeouts Mode title
+    if not state_machine.shootout_announcement:
+        if game.timeouts_only:
+            screen.mount(SCORES)
+        elif game.selected_profile == "Ultimate Pool":
+            screen.mount(MATCH_ROW)
+        screen.render(oled, state_machine, game)
+
+    await oled.show_async()
+
+
+def _draw_message_lines(oled, message, font_size):
+    """Centers the lines of a message in the confirmation_message region."""
     rx, ry, rw, rh = display.get_region("confirmation_message")
 
     lines = message.split("\n")
@@ -170,146 +188,158 @@ async def render_message(state_machine, game, oled, message, font_size=1):
         oled.text_scaled(line, int(x_pos), int(y_pos), font_size)
         y_pos += line_height
 
-    # Re-render scoreline at the bottom (except during shootout announcement)
-    if not state_machine.shootout_announcement:
-        render_scoreline(
-            oled,
-            state_machine,
-            game,
-            False,
-            suppress_scores=True,
-            force_match_timer=True,
-        )
 
-    oled.show()
+def _menu_line_text(state_machine, game, index, current=False):
+    """Formats one menu line, showing the pending value while editing."""
+    name = game.menu_items[index]
+    val = game.menu_values[index]
+    if current and state_machine.editing_value:
+        val = game.temp_setting_value
+    return name if val is None else f"{name}:{val}"
 
 
-async def render_menu(state_machine, game, oled):
-    """Renders the game menu. Handles both navigation and editing modes."""
+def _draw_menu_line(oled, region, text):
+    display.draw_text_in_region(
+        oled, region, text, display.TextOptions(align="left", send_payload=False)
+    )
+
+
+def _shift_menu_line(oled, src_region, dst_region):
+    """Moves an already drawn menu line to another (page-aligned) line slot."""
+    x, src_y, w, _ = display.get_region(src_region)
+    dst_y = display.get_region(dst_region)[1]
+    oled.copy_page_span(src_y // 8, dst_y // 8, x, x + w)
+
+
+def _scroll_menu(state_machine, game, oled, step):
+    """Shifts the kept menu lines by one slot and draws the revealed one.
+
+    Returns False when the lines on screen cannot be reused.
+    """
+    shown = game.menu_rendered_index
+    count = len(game.menu_items)
+    index = game.current_menu_index
+    if shown is None or count < 3 or index != (shown + step) % count:
+        return False
+
+    if step > 0:
+        _shift_menu_line(oled, "menu_line_curr", "menu_line_prev")
+        _shift_menu_line(oled, "menu_line_next", "menu_line_curr")
+        new_region, new_index = "menu_line_next", (index + 1) % count
+    else:
+        _shift_menu_line(oled, "menu_line_curr", "menu_line_next")
+        _shift_menu_line(oled, "menu_line_prev", "menu_line_curr")
+        new_region, new_index = "menu_line_prev", (index - 1) % count
+    _draw_menu_line(oled, new_region, _menu_line_text(state_machine, game, new_index))
+    return True
+
+
+def _draw_full_menu(state_machine, game, oled):
+    count = len(game.menu_items)
+    prev_idx = (game.current_menu_index - 1) % count
+    next_idx = (game.current_menu_index + 1) % count
+
     # 1. Clear the entire buffer but DON'T send to hardware yet
     display.display_clear(oled, "everything", send_payload=False)
 
     # 2. Draw static Header
-    display.draw_text_in_region(
-        oled,
-        "menu_header_left",
-        "Game",
-        display.TextOptions(font_size=2, align="left", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "menu_header_right",
-        "Menu",
-        display.TextOptions(font_size=2, align="left", send_payload=False),
-    )
+    display.draw_layout(oled, layouts.MENU_HEADER)
     display.draw_rect_in_region(oled, "menu_separator_top", fill=True, send_payload=False)
     display.draw_rect_in_region(
         oled, "menu_separator_bottom", fill=True, send_payload=False
     )
 
-    # 3. Determine what values to show (Current values vs Temporary edit value)
-    prev_idx = (game.current_menu_index - 1) % len(game.menu_items)
-    next_idx = (game.current_menu_index + 1) % len(game.menu_items)
+    # 3. Draw the menu items (the current line shows the value being edited)
+    for region, index, current in (
+        ("menu_line_prev", prev_idx, False),
+        ("menu_line_curr", game.current_menu_index, True),
+        ("menu_line_next", next_idx, False),
+    ):
+        text = _menu_line_text(state_machine, game, index, current)
+        _draw_menu_line(oled, region, text)
 
-    val_prev = game.menu_values[prev_idx]
-    val_curr = (
-        game.temp_setting_value
-        if state_machine.editing_value
-        else game.menu_values[game.current_menu_index]
-    )
-    val_next = game.menu_values[next_idx]
+    # 4. Draw the cursor
+    display.draw_rect_in_region(oled, "menu_cursor", fill=True)
 
-    # Helper to format
-    def fmt(name, val):
-        return name if val is None else f"{name}:{val}"
 
-    # 4. Draw the menu items using dedicated regions
-    display.draw_text_in_region(
-        oled,
-        "menu_line_prev",
-        fmt(game.menu_items[prev_idx], val_prev),
-        display.TextOptions(align="left", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "menu_line_curr",
-        fmt(game.menu_items[game.current_menu_index], val_curr),
-        display.TextOptions(align="left", send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "menu_line_next",
-        fmt(game.menu_items[next_idx], val_next),
-        display.TextOptions(align="left", send_payload=False),
-    )
-
-    # 5. Draw the cursor
-    display.draw_rect_in_region(oled, "menu_cursor", fill=True)
+async def render_menu(state_machine, game, oled):
+    """Renders the game menu. Handles both navigation and editing modes.
+
+    While the menu stays on screen, Up/Down shift the two kept lines within
+    the buffer and draw only the revealed line; the header is left alone.
+    """
+    gameplay_screen(game).overlay(oled)
+    if game.menu_rendered_index == game.current_menu_index:
+        # Same position (editing): only the current line can have changed
+        _draw_menu_line(
+            oled,
+            "menu_line_curr",
+            _menu_line_text(state_machine, game, game.current_menu_index, True),
+        )
+    elif not (
+        _scroll_menu(state_machine, game, oled, 1)
+        or _scroll_menu(state_machine, game, oled, -1)
+    ):
+        _draw_full_menu(state_machine, game, oled)
 
-    oled.show()
+    game.menu_rendered_index = game.current_menu_index
+    await oled.show_async()
 
 
 async def render_exit_confirmation(state_machine, game, oled):
     """Renders the 'Are you sure?' confirmation screen for exiting the match."""
+    gameplay_screen(game).overlay(oled)
+    game.menu_rendered_index = None
     display.display_clear(oled, "everything", send_payload=False)
-    display.draw_text_in_region(
-        oled,
-        "confirmation_message",
-        "Are you sure?",
-        display.TextOptions(align="center", send_payload=False),
-    )
-    oled.show()
+    display.draw_layout(oled, layouts.EXIT_CONFIRMATION)
+    await oled.show_async()
 
 
 async def render_shootout_announcement(state_machine, game, oled, visible=True):
     """Renders the '6-ball shootout' announcement."""
     if not visible:
-        display.display_clear(oled, "everything")
+        # Panel off for one flush; the buffer keeps the message
+        oled.blank()
+        await oled.show_async()
         return
 
     await render_message(state_machine, game, oled, "6 Ball\nShootout", font_size=2)
 
 
 async def render_shootout_stopwatch(state_machine, game, oled, current_ms):
-    """Renders the shootout stopwatch and time-to-beat for P2."""
-    display.display_clear(oled, "everything", send_payload=False)
+    """Renders the shootout stopwatch and time-to-beat for P2.
+
+    While the same shooter is up only the stopwatch digits that changed are
+    redrawn; the titles and the time to beat stay in the buffer.
+    """
     current_shooter = 1
     if state_machine.shootout_p2_wait or state_machine.shootout_p2_running:
         current_shooter = 2
     current_ms = 0 if state_machine.shootout_p2_wait else current_ms
 
-    time_str = display.format_stopwatch(current_ms)
+    if game.stopwatch_shooter != current_shooter:
+        _draw_stopwatch_screen(state_machine, game, oled, current_shooter)
+        game.stopwatch_shooter = current_shooter
+
+    _stopwatch.draw(oled, _stopwatch_layout(current_ms), current_ms)
+    await oled.show_async()
+
+
+def _draw_stopwatch_screen(state_machine, game, oled, current_shooter):
+    gameplay_screen(game).unmount()
+    display.display_clear(oled, "everything", send_payload=False)
+    _stopwatch.invalidate()
+
     # Draw stopwatch slightly higher than center
-    display.draw_text_in_region(
-        oled,
-        "up_shootout_current_shooter",
-        f"Player {current_shooter}",
-        display.TextOptions(font_size=2, align="center", y_offset=-2, send_payload=False),
-    )
-    display.draw_text_in_region(
-        oled,
-        "up_shootout_stop_watch",
-        time_str,
-        display.TextOptions(font_size=2, align="center", send_payload=False),
-    )
+    display.draw_layout(oled, layouts.SHOOTOUT_PLAYERS[current_shooter - 1])
 
     # If it's P2's turn (WAIT or RUNNING), show P1's time to beat at the bottom
-    if (
-        state_machine.shootout_p2_wait or state_machine.shootout_p2_running
-    ) and game.p1_shootout_time > 0:
-        player_str = "Time to beat"
+    if current_shooter == 2 and game.p1_shootout_time > 0:
         beat_str = display.format_stopwatch(game.p1_shootout_time)
-        display.draw_text_in_region(
-            oled,
-            "up_shootout_p1_title",
-            player_str,
-            display.TextOptions(font_size=1, align="center", send_payload=False),
-        )
+        display.draw_layout(oled, layouts.TIME_TO_BEAT)
         display.draw_text_in_region(
             oled,
             "up_shootout_p1_time",
             beat_str,
             display.TextOptions(font_size=1, align="center", send_payload=False),
         )
-
-    oled.show()
@@ -0,0 +1,277 @@
+"""
+Retained widgets for the gameplay screen.
+
+Each widget is bound to the Game_Stats fields it shows and remembers the
+values it last painted with. GameplayScreen.render() walks the mounted
+widgets and repaints only those whose inputs changed, so a clock tick draws
+the digits that ticked and nothing else.
+
+A menu or dialog opens as an overlay (see lib/canvas.py): the gameplay
+pixels are saved and the screen unmounted, which is what keeps the clock
+ticks from drawing over it, so render code needs no lists of states.
+Closing the overlay puts the saved pixels back and renders, so only what
+changed underneath is repainted. Screens that replace the gameplay screen
+unmount it and drop the saved copy.
+"""
+
+from lib.canvas import Canvas
+from lib.display import number_str
+from lib.numeric_field import NumericField, number_places, text_layout
+from lib.ui_components import (
+    SCORED_PROFILES,
+    SHOT_CLOCK_LAYOUT,
+    clear_scores,
+    display_timeouts,
+    draw_scores,
+    draw_shooter_indicator,
+    draw_timeouts_title,
+    draw_up_indicators,
+    match_clock_layout,
+    score_placement,
+)
+
+# Widget bits, for GameplayScreen.mount()
+SHOT_CLOCK = 1
+SCORES = 2
+MATCH_CLOCK = 4
+SHOOTER = 8
+TIMEOUTS = 16
+ALL = SHOT_CLOCK | SCORES | MATCH_CLOCK | SHOOTER | TIMEOUTS
+# The Ultimate Pool bottom row, which keeps running under a message
+MATCH_ROW = MATCH_CLOCK | SHOOTER
+
+
+class Widget:
+    """A piece of the gameplay screen bound to some Game_Stats fields."""
+
+    def __init__(self, bit, fields):
+        self.bit = bit
+        self.fields = fields
+        # Field values at the last update; compared by value, so no allocation
+        self.seen = [None] * len(fields)
+        self.valid = False
+
+    def invalidate(self):
+        """Forces a full repaint on the next update."""
+        self.valid = False
+
+    def update(self, oled, state_machine, game):
+        """Repaints the widget if a bound field changed since the last update."""
+        fresh = not self.valid
+        dirty = fresh
+        seen = self.seen
+        fields = self.fields
+        for i in range(len(fields)):
+            value = getattr(game, fields[i])
+            if value != seen[i]:
+                seen[i] = value
+                dirty = True
+        self.valid = True
+        if dirty:
+            self.paint(oled, state_machine, game, fresh)
+
+    def paint(self, oled, state_machine, game, fresh):
+        """Draws the widget. fresh means nothing of it is on screen yet.
+        The base widget has nothing to draw."""
+        return False
+
+
+class ShotClockDigits(Widget):
+    def __init__(self):
+        super().__init__(SHOT_CLOCK, ("countdown",))
+        self.field = NumericField(2)
+
+    def paint(self, oled, state_machine, game, fresh):
+        if fresh:
+            self.field.invalidate()
+        if game.countdown >= 0:
+            # Only the digits that differ from the ones on screen are redrawn
+            self.field.draw(oled, SHOT_CLOCK_LAYOUT, game.countdown)
+
+
+class Scoreline(Widget):
+    def __init__(self):
+        super().__init__(
+            SCORES,
+            (
+                "player_1_score",
+                "player_1_target",
+                "player_2_score",
+                "player_2_target",
+                "selected_profile",
+                "timeouts_only",
+                "match_type",
+            ),
+        )
+        self.p1 = NumericField(3)
+        self.p2 = NumericField(3)
+        # What the separators and targets were drawn for
+        self.frame = None
+        self.layouts = {}
+
+    def paint(self, oled, state_machine, game, fresh):
+        if game.timeouts_only:
+            draw_timeouts_title(oled)
+            return
+        if game.selected_profile not in SCORED_PROFILES:
+            return
+        # Everything but a score changing (or P1's gaining a digit, which
+        # realigns it) leaves the separators and targets where they are
+        frame = (
+            game.selected_profile,
+            game.match_type,
+            game.player_1_target,
+            game.player_2_target,
+            game.player_1_score < 10,
+        )
+        p1 = self._layout(game, 1, game.player_1_score)
+        p2 = self._layout(game, 2, game.player_2_score)
+        if fresh or frame != self.frame:
+            if not fresh:
+                # The separators and targets move: clear where they were
+                clear_scores(oled, game)
+            draw_scores(oled, game)
+            self.frame = frame
+            self.p1.sync(p1, game.player_1_score)
+            self.p2.sync(p2, game.player_2_score)
+        else:
+            self.p1.draw(oled, p1, game.player_1_score)
+            self.p2.draw(oled, p2, game.player_2_score)
+
+    def _layout(self, game, player, score):
+        """The layout of a score, built once per placement and width."""
+        region, options, x_offset = score_placement(game, player)
+        digits = len(number_str(score))
+        key = (region, options, x_offset, digits)
+        layout = self.layouts.get(key)
+        if layout is None:
+            layout = text_layout(
+                region, "0" * digits, number_places(digits), options, x_offset
+            )
+            self.layouts[key] = layout
+        return layout
+
+
+class MatchClock(Widget):
+    def __init__(self, shooter):
+        super().__init__(MATCH_CLOCK, ("match_countdown", "selected_profile"))
+        self.shooter = shooter
+        self.field = NumericField(5)
+
+    def paint(self, oled, state_machine, game, fresh):
+        if game.selected_profile != "Ultimate Pool":
+            return
+        if fresh:
+            self.field.invalidate()
+        # Crossing 10:00 switches layout, which clears the strip and redraws
+        # it all
+        seconds = game.match_countdown
+        if self.field.draw(oled, match_clock_layout(seconds), seconds):
+            # The strip clear took the indicators in the gaps with it
+            self.shooter.invalidate()
+
+
+class ShooterIndicator(Widget):
+    def __init__(self):
+        super().__init__(SHOOTER, ("player_1_shooting", "selected_profile"))
+
+    def paint(self, oled, state_machine, game, fresh):
+        if game.timeouts_only or game.selected_profile not in SCORED_PROFILES:
+            return
+        if game.selected_profile == "Ultimate Pool":
+            draw_up_indicators(oled, game)
+        else:
+            draw_shooter_indicator(oled, game)
+
+
+class TimeoutPips(Widget):
+    def __init__(self):
+        super().__init__(
+            TIMEOUTS,
+            (
+                "player_1_timeouts_remaining",
+                "player_2_timeouts_remaining",
+                "selected_profile",
+            ),
+        )
+
+    def paint(self, oled, state_machine, game, fresh):
+        # Ultimate Pool has no timeouts; display_timeouts skips it
+        if not game.timeouts_only and game.selected_profile in SCORED_PROFILES:
+            display_timeouts(oled, game)
+
+
+class GameplayScreen:
+    """The widget tree of the gameplay screen."""
+
+    def __init__(self):
+        self.shot_clock = ShotClockDigits()
+        self.scores = Scoreline()
+        self.shooter = ShooterIndicator()
+        self.match_clock = MatchClock(self.shooter)
+        self.timeouts = TimeoutPips()
+        # Paint order: the match clock strip is cleared before the indicators
+        self.widgets = (
+            self.shot_clock,
+            self.scores,
+            self.match_clock,
+            self.shooter,
+            self.timeouts,
+        )
+        self.mounted = 0
+        self.canvas = Canvas()
+
+    def mount(self, mask=ALL):
+        """Puts the widgets in mask on screen, painting them in full on the
+        next render over whatever is there."""
+        self.mounted = mask
+        for widget in self.widgets:
+            if mask & widget.bit:
+                widget.invalidate()
+
+    def unmount(self):
+        """Takes the gameplay screen off the panel for a screen replacing it."""
+        self.mounted = 0
+        self.canvas.drop()
+
+    def overlay(self, oled):
+        """Opens an overlay over the gameplay screen, saving its pixels if it
+        is on the panel. Widgets mounted afterwards stay live on top."""
+        if self.mounted == ALL:
+            self.canvas.cover(oled)
+        self.mounted = 0
+
+    def restore(self, oled):
+        """Closes the overlay by putting the saved gameplay pixels back.
+
+        Returns False if there are none. The widgets then hold the values
+        those pixels show, so the next render repaints only what changed
+        underneath; the ones that stayed live drew over the overlay since,
+        so they repaint in full.
+        """
+        if not self.canvas.uncover(oled):
+            return False
+        live = self.mounted
+        self.mounted = ALL
+        for widget in self.widgets:
+            if live & widget.bit:
+                widget.invalidate()
+        return True
+
+    def render(self, oled, state_machine, game):
+        """Repaints the mounted widgets whose inputs changed. Drawing only;
+        the caller flushes."""
+        mounted = self.mounted
+        if not mounted:
+            return
+        for widget in self.widgets:
+            if mounted & widget.bit:
+                widget.update(oled, state_machine, game)
+
+
+def gameplay_screen(game):
+    """The game's GameplayScreen, created on first use."""
+    screen = game.gameplay_screen
+    if screen is None:
+        screen = game.gameplay_screen = GameplayScreen()
+    return screen
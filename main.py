@@ -6,77 +6,63 @@ import utime
 import lib.button_logic as logic
 
 # Internal Library Imports
-from lib import Pico_OLED_242, audio, display, ui
+from lib import Pico_OLED_242, audio, display, regions, ui
 from lib.button_interrupt import AsyncButton
-from lib.hardware_config import DOWN_PIN, MAKE_PIN, MISS_PIN, UP_PIN
+from lib.display_service import DisplayService
+from lib.frame_scheduler import FrameScheduler
+from lib.hardware_config import (
+    DOWN_PIN,
+    MAKE_PIN,
+    MISS_PIN,
+    OLED_CORE1_FLUSH,
+    OLED_FRAME_SCHEDULER,
+    STOPWATCH_FPS,
+    UP_PIN,
+)
 from lib.models import Game_Stats, State_Machine
+from lib.power import AWAKE, PowerManager
 
 # Global Initialization
 state_machine = State_Machine()
 game = Game_Stats()
-OLED = Pico_OLED_242.OLED_2inch42()
+PANEL = Pico_OLED_242.OLED_2inch42()
+# Flushes asked for while drawing are sent as one frame per loop turn
+frame_scheduler = FrameScheduler(PANEL) if OLED_FRAME_SCHEDULER else None
+OLED = PANEL if frame_scheduler is None else frame_scheduler
+display_service = DisplayService(PANEL) if OLED_CORE1_FLUSH else None
+power = PowerManager(OLED)
 inactivity_check = utime.ticks_ms()
+# True while stopwatch_worker() runs
+stopwatch_active = False
+STOPWATCH_FRAME_US = 1_000_000 // STOPWATCH_FPS
 
 
 # Background Timer Helpers
 
 
-def _update_clock_display(curr_val, new_val):
-    """Handles the selective clearing and updating of the countdown digits."""
-    if game.selected_profile == "Ultimate Pool":
-        # Always refresh both timers for Ultimate Pool to keep them in sync.
-        # display.update_timer_display handles optimized clearing/drawing.
-        asyncio.create_task(ui.update_timer_display(state_machine, game, OLED))
-        return
-
-    if new_val < 0:
-        return
-
-    curr_tens, curr_units = curr_val // 10, curr_val % 10
-    new_tens, new_units = new_val // 10, new_val % 10
-    if curr_tens != new_tens and curr_units != new_units:
-        timer_str = display.process_timer_duration(new_val)
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_1",
-            timer_str[0],
-            display.TextOptions(font_size=8, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_2",
-            timer_str[1],
-            display.TextOptions(font_size=8, align="center", send_payload=True),
-        )
-    elif curr_tens != new_tens:
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_1",
-            str(new_tens),
-            display.TextOptions(font_size=8, align="center", send_payload=True),
-        )
-    elif curr_units != new_units:
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_2",
-            str(new_units),
-            display.TextOptions(font_size=8, align="center", send_payload=True),
-        )
+def _start_beep():
+    """Plays the beep on Core 1, through the display service when it owns it."""
+    if display_service is not None:
+        display_service.post(audio.shot_clock_beep_chunks())
+    else:
+        _thread.start_new_thread(audio.shot_clock_beep, ())
 
 
-def _handle_countdown_tick():
+async def _handle_countdown_tick():
     """Logic executed every 1 second during active countdown."""
     global inactivity_check
     inactivity_check = utime.ticks_ms()
-    old_val = game.countdown
     game.countdown -= 1
     new_val = game.countdown
 
-    # Audio trigger
-    if 0 <= new_val < 5 and not game.speaker_muted:
-        _thread.start_new_thread(audio.shot_clock_beep, ())
+    # Only the widgets whose values changed repaint: the shot clock digits
+    # that ticked, and for Ultimate Pool the match clock
+    ui.draw_timer_display(state_machine, game, OLED)
+    await hw_wrapper.flush()
 
-    _update_clock_display(old_val, new_val)
+    # Audio trigger (after the flush so the frame is not queued behind it)
+    if 0 <= new_val < 5 and not game.speaker_muted:
+        _start_beep()
 
     if new_val == 0:
         state_machine.update_state(State_Machine.COUNTDOWN_COMPLETE)
@@ -84,70 +70,87 @@ def _handle_countdown_tick():
             game.extension_available, game.extension_used = True, False
 
 
-def _handle_expired_flash(flash_off):
-    """Toggle the '00' display when time has expired."""
-    if flash_off:
-        timer_str = display.process_timer_duration(game.countdown)
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_1",
-            timer_str[0],
-            display.TextOptions(font_size=8, align="center", send_payload=False),
-        )
-        display.draw_text_in_region(
-            OLED,
-            "shot_clock_digit_2",
-            timer_str[1],
-            display.TextOptions(font_size=8, align="center", send_payload=True),
-        )
-    else:
-        display.display_clear(OLED, "shot_clock_digit_1", "shot_clock_digit_2")
+async def _handle_expired_flash(flash_off):
+    """Toggle the '00' display when time has expired.
+
+    The digits stay in the buffer: the off phase sends them as blank and the
+    next flush restores them, so nothing is redrawn.
+    """
+    if not flash_off:
+        display.display_blank(OLED, regions.SHOT_CLOCK_FULL, send_payload=False)
+    await hw_wrapper.flush()
     return not flash_off
 
 
 async def _handle_ui_blink(blink_off):
-    """Manages blinking for menu cursor and profile selection."""
+    """Manages blinking for menu cursor, profile selection and full-screen
+    messages. Only the menu cursor is redrawn; the rest blank the panel or a
+    region for one flush and let the next flush bring it back."""
     if (
         state_machine.profile_selection
         and utime.ticks_diff(utime.ticks_ms(), inactivity_check) > 500
     ):
         if blink_off:
-            display.display_clear(OLED, "profile_selection")
-
-        else:
-            await ui.render_profile_selection(state_machine, game, OLED)
+            display.display_blank(OLED, regions.PROFILE_SELECTION, send_payload=False)
+        await hw_wrapper.flush()
 
     elif state_machine.menu or state_machine.editing_value:
         if blink_off:
-            display.display_clear(OLED, "menu_selector")
+            display.display_clear(OLED, regions.MENU_SELECTOR, send_payload=False)
 
         else:
-            display.draw_rect_in_region(OLED, "menu_cursor", fill=True)
+            display.draw_rect_in_region(OLED, regions.MENU_CURSOR, fill=True)
+        await hw_wrapper.flush()
 
-    elif state_machine.victory:
+    elif state_machine.victory or state_machine.shootout_announcement:
         if blink_off:
-            display.display_clear(OLED, "everything")
-        else:
-            await ui.render_victory(state_machine, game, OLED, game.winner)
-
-    elif state_machine.shootout_announcement:
-        if blink_off:
-            await hw_wrapper.render_shootout_announcement(
-                state_machine, game, visible=False
-            )
-        else:
-            await hw_wrapper.render_shootout_announcement(
-                state_machine, game, visible=True
-            )
+            OLED.blank()
+        await hw_wrapper.flush()
 
     return not blink_off
 
 
+def _stopwatch_running():
+    """True while a shooter's clock runs and their time is not in yet."""
+    if state_machine.shootout_p1_running:
+        return True
+    # The final P2 time stays up during the pause before the victory screen
+    return state_machine.shootout_p2_running and game.p2_shootout_time == 0
+
+
+async def stopwatch_worker():
+    """Draws the running shootout stopwatch at STOPWATCH_FPS.
+
+    Elapsed time comes from ticks_us, like the times the MAKE button
+    records, so the frame drawn when a shooter stops shows their time.
+    Frames are paced against a schedule rather than a fixed sleep, so the
+    time it takes to draw one does not slow the rate; a late frame moves
+    the schedule instead of being followed by a burst.
+    """
+    global stopwatch_active
+    try:
+        next_frame = utime.ticks_us()
+        while _stopwatch_running():
+            elapsed_us = utime.ticks_diff(utime.ticks_us(), game.shootout_start_tick)
+            await hw_wrapper.render_shootout_stopwatch(
+                state_machine, game, elapsed_us // 1000
+            )
+            next_frame = utime.ticks_add(next_frame, STOPWATCH_FRAME_US)
+            wait_us = utime.ticks_diff(next_frame, utime.ticks_us())
+            if wait_us < 0:
+                next_frame = utime.ticks_us()
+                wait_us = 0
+            await asyncio.sleep_ms(wait_us // 1000)
+    finally:
+        stopwatch_active = False
+
+
 # Background Timer Task
 async def timer_worker():
     """
     Main heartbeat loop. Dispatches to helpers based on timing and state.
     """
+    global stopwatch_active
     last_tick = utime.ticks_ms()
     flash_checker = utime.ticks_ms()
     blink_checker = utime.ticks_ms()
@@ -185,7 +188,7 @@ async def timer_worker():
 
                 # Refresh display
                 # If shot clock isn't running, we call update_timer_display here.
-                # If it IS running, _handle_countdown_tick -> _update_clock_display
+                # If it IS running, _handle_countdown_tick redraws the timers
                 # handles it.
                 if not state_machine.countdown_in_progress:
                     asyncio.create_task(
@@ -194,7 +197,7 @@ async def timer_worker():
 
             # Shot Clock Decrement
             if state_machine.countdown_in_progress:
-                _handle_countdown_tick()
+                await _handle_countdown_tick()
 
         # 2. Expired Flashing
         elif (
@@ -202,16 +205,12 @@ async def timer_worker():
             and utime.ticks_diff(now, flash_checker) > 330
         ):
             flash_checker = now
-            flash_off = _handle_expired_flash(flash_off)
+            flash_off = await _handle_expired_flash(flash_off)
 
-        # 3. Shootout Stopwatch Tick
-        elif state_machine.shootout_p1_running or state_machine.shootout_p2_running:
-            # Avoid overwriting the final time during the victory pause
-            if not (state_machine.shootout_p2_running and game.p2_shootout_time > 0):
-                current_ms = utime.ticks_diff(now, game.shootout_start_tick)
-                await hw_wrapper.render_shootout_stopwatch(
-                    state_machine, game, current_ms
-                )
+        # 3. Shootout Stopwatch: drawn by a paced task of its own
+        elif _stopwatch_running() and not stopwatch_active:
+            stopwatch_active = True
+            asyncio.create_task(stopwatch_worker())
 
         # 4. UI Blinking
         blink_states = (
@@ -225,35 +224,53 @@ async def timer_worker():
             blink_checker = now
             blink_off = await _handle_ui_blink(blink_off)
 
+        # 5. Dim / switch off the panel when idle (never while a clock runs)
+        clock_running = (
+            state_machine.countdown_in_progress
+            or game.match_timer_running
+            or state_machine.shootout_p1_running
+            or state_machine.shootout_p2_running
+        )
+        await power.update(utime.ticks_diff(now, inactivity_check), clock_running)
+
         await asyncio.sleep_ms(50)
 
 
 # --- Button Handlers (Bridge) ---
-# We need to update inactivity_check on any button press
+# We need to update inactivity_check on any button press.
+# A press that wakes a switched-off panel goes no further.
 
 
 async def on_make():
     global inactivity_check
     inactivity_check = utime.ticks_ms()
+    if await power.wake():
+        return
     await logic.handle_make(state_machine, game, hw_wrapper)
 
 
 async def on_up():
     global inactivity_check
     inactivity_check = utime.ticks_ms()
+    if await power.wake():
+        return
     await logic.handle_up(state_machine, game, hw_wrapper)
 
 
 async def on_down():
     global inactivity_check
     inactivity_check = utime.ticks_ms()
+    if await power.wake():
+        return
     await logic.handle_down(state_machine, game, hw_wrapper)
 
 
 async def on_miss():
     global inactivity_check
-    if not state_machine.profile_selection:
+    if power.level != AWAKE or not state_machine.profile_selection:
         inactivity_check = utime.ticks_ms()
+    if await power.wake():
+        return
     await logic.handle_miss(state_machine, game, hw_wrapper)
 
 
@@ -269,6 +286,10 @@ class HardwareWrapper:
     def __init__(self, oled):
         self.oled = oled
 
+    async def flush(self):
+        """Pushes pending drawing to the panel, yielding between pages."""
+        await self.oled.show_async()
+
     async def enter_idle_mode(self, sm, g):
         await ui.enter_idle_mode(sm, g, self.oled)
 
@@ -314,6 +335,12 @@ hw_wrapper = HardwareWrapper(OLED)
 
 # Main Entry Point
 async def main():
+    # 0. Hand display transfers to Core 1
+    if display_service is not None:
+        display_service.start()
+    if frame_scheduler is not None:
+        asyncio.create_task(frame_scheduler.run())
+
     # 1. Initialize Inputs
     AsyncButton(MAKE_PIN, on_make)
     AsyncButton(UP_PIN, on_up)
@@ -339,4 +366,6 @@ except (KeyboardInterrupt, SystemExit):
     pass
 finally:
     # Reset/Cleanup if needed
+    if display_service is not None:
+        display_service.stop()
     asyncio.new_event_loop()
@@ -0,0 +1,394 @@
+"""
+Host-side stand-ins for the MicroPython modules the OLED driver imports.
+
+``framebuf`` is replaced by a small pure-Python MONO_VLSB FrameBuffer so the
+driver's buffer contents can be checked byte for byte. ``machine`` exposes
+recording Pin/SPI/I2C classes, and ``_thread`` runs on real threads so the
+Core-1 display service can be exercised.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import sys
+import threading
+import time
+import types
+from unittest.mock import MagicMock, patch
+
+MONO_VLSB = 0
+
+
+def _glyph_column(ch, col):
+    """Deterministic 8x8 stand-in glyph; bottom and top rows stay blank."""
+    if ch == " ":
+        return 0
+    return ((ord(ch) * (col + 3)) ^ (col * 29)) & 0x7E
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, fmt, stride=None):
+        self._fb_buf = buffer
+        self._fb_w = width
+        self._fb_h = height
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._fb_w and 0 <= y < self._fb_h):
+            return None if c is None else 0
+        idx = (y >> 3) * self._fb_w + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self._fb_buf[idx] & bit else 0
+        if c:
+            self._fb_buf[idx] |= bit
+        else:
+            self._fb_buf[idx] &= ~bit & 0xFF
+        return None
+
+    def fill(self, c):
+        val = 0xFF if c else 0x00
+        for i in range(len(self._fb_buf)):
+            self._fb_buf[i] = val
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(0, y), min(self._fb_h, y + h)):
+            for xx in range(max(0, x), min(self._fb_w, x + w)):
+                self.pixel(xx, yy, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx, dy = abs(x2 - x1), -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        self.text_scaled(s, x, y, 1, c)
+
+    def text_scaled(self, s, x, y, scale, c=1):
+        for n, ch in enumerate(s):
+            cx = x + n * 8 * scale
+            for col in range(8):
+                bits = _glyph_column(ch, col)
+                for row in range(8):
+                    if bits & (1 << row):
+                        self.fill_rect(cx + col * scale, y + row * scale, scale, scale, c)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for yy in range(fbuf._fb_h):
+            for xx in range(fbuf._fb_w):
+                c = fbuf.pixel(xx, yy)
+                if c != key:
+                    self.pixel(x + xx, y + yy, c)
+
+
+class FakePin:
+    OUT = 1
+    IN = 0
+
+    def __init__(self, pin_id=None, mode=None, *args, **kwargs):
+        self.pin_id = pin_id
+        self._value = 0
+
+    def __call__(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+        return None
+
+    def value(self, value=None):
+        return self(value)
+
+
+class FakeSPI:
+    """Records every SPI burst as ``(dc_level, bytes)``."""
+
+    instances: list["FakeSPI"] = []
+
+    def __init__(self, *args, **kwargs):
+        self.writes = []
+        self.dc = None
+        FakeSPI.instances.append(self)
+
+    def write(self, data):
+        level = self.dc() if self.dc is not None else None
+        self.writes.append((level, bytes(data)))
+
+
+class FakeI2C:
+    """Records every I2C transaction as ``bytes``."""
+
+    def __init__(self, *args, **kwargs):
+        self.writes = []
+
+    def writeto(self, addr, data):
+        self.writes.append(bytes(data))
+
+    def writevto(self, addr, vector):
+        self.writes.append(b"".join(bytes(part) for part in vector))
+
+
+class FakeDMA:
+    """rp2.DMA stand-in feeding a FakeSPI.
+
+    A started transfer stays active for ``busy_polls`` calls to active(), or
+    until the running event loop gets a turn, then records its bytes exactly
+    as the read buffer holds them at that moment.
+    """
+
+    def __init__(self, busy_polls=3):
+        self.busy_polls = busy_polls
+        self.spi: FakeSPI | None = None
+        self.handler = None
+        self.transfer = None
+        self.polls = 0
+        self.configs = []
+
+    def pack_ctrl(self, **kwargs):
+        return kwargs
+
+    def irq(self, handler=None, hard=False):
+        self.handler = handler
+
+    def config(self, read=None, write=None, count=None, ctrl=None, trigger=False):
+        self.configs.append({"write": write, "count": count, "ctrl": ctrl})
+        self.transfer = (read, count)
+        self.polls = self.busy_polls
+        with contextlib.suppress(RuntimeError):
+            asyncio.get_running_loop().call_soon(self.finish)
+
+    def active(self):
+        if self.transfer is None:
+            return False
+        if self.polls > 0:
+            self.polls -= 1
+            return True
+        self.finish()
+        return False
+
+    def finish(self):
+        if self.transfer is None:
+            return
+        read, count = self.transfer
+        self.transfer = None
+        assert self.spi is not None and self.spi.dc is not None
+        self.spi.writes.append((self.spi.dc(), bytes(read[:count])))
+        if self.handler is not None:
+            self.handler(self)
+
+
+class FakeMem:
+    """machine.mem32 stand-in; every register reads as idle."""
+
+    def __getitem__(self, addr):
+        return 0
+
+
+class ThreadSafeFlag:
+    def __init__(self):
+        self._event = asyncio.Event()
+
+    def set(self):
+        self._event.set()
+
+    def clear(self):
+        self._event.clear()
+
+    async def wait(self):
+        await self._event.wait()
+        self._event.clear()
+
+
+class FakeClock:
+    """Monotonic microsecond clock advanced manually by the tests."""
+
+    def __init__(self):
+        self.now_us = 0
+
+    def ticks_us(self):
+        return self.now_us
+
+    def ticks_ms(self):
+        return self.now_us // 1000
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+    def sleep(self, seconds):
+        pass
+
+    def sleep_ms(self, ms):
+        pass
+
+    def sleep_us(self, us):
+        pass
+
+
+class ThreadClock:
+    """Real-time ``utime`` for tests that run the Core-1 loop on a thread."""
+
+    def ticks_us(self):
+        return time.perf_counter_ns() // 1000
+
+    def ticks_ms(self):
+        return time.perf_counter_ns() // 1_000_000
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+    def sleep_ms(self, ms):
+        time.sleep(ms / 1000)
+
+    def sleep_us(self, us):
+        time.sleep(us / 1_000_000)
+
+
+def make_thread_module():
+    """``_thread`` on top of threading; started threads are kept for join()."""
+    module = types.ModuleType("_thread")
+    module.threads = []  # type: ignore[attr-defined]
+
+    def start_new_thread(func, args):
+        thread = threading.Thread(target=func, args=args, daemon=True)
+        module.threads.append(thread)  # type: ignore[attr-defined]
+        thread.start()
+
+    module.allocate_lock = threading.Lock  # type: ignore[attr-defined]
+    module.start_new_thread = start_new_thread  # type: ignore[attr-defined]
+    return module
+
+
+def make_framebuf_module():
+    module = types.ModuleType("framebuf")
+    module.FrameBuffer = FrameBuffer  # type: ignore[attr-defined]
+    module.MONO_VLSB = MONO_VLSB  # type: ignore[attr-defined]
+    return module
+
+
+def make_uasyncio_module():
+    module = types.ModuleType("uasyncio")
+
+    async def sleep_ms(ms):
+        await asyncio.sleep(ms / 1000)
+
+    module.sleep_ms = sleep_ms  # type: ignore[attr-defined]
+    module.ThreadSafeFlag = ThreadSafeFlag  # type: ignore[attr-defined]
+    module.Event = asyncio.Event  # type: ignore[attr-defined]
+    return module
+
+
+def make_machine_module():
+    module = MagicMock()
+    module.Pin = FakePin
+    module.SPI = FakeSPI
+    module.I2C = FakeI2C
+    return module
+
+
+def load_module(name, modules):
+    """Imports a fresh copy of lib.<name> with the given modules faked."""
+    package = importlib.import_module("lib")
+    previous = package.__dict__.get(name)
+    with patch.dict(sys.modules, modules):
+        sys.modules.pop(f"lib.{name}", None)
+        module = importlib.import_module(f"lib.{name}")
+    # Leave the package attribute as other test modules expect to find it.
+    if previous is None:
+        package.__dict__.pop(name, None)
+    else:
+        package.__dict__[name] = previous
+    return module
+
+
+def load_driver(extra_modules=None):
+    """Imports a fresh copy of lib.Pico_OLED_242 against the fakes."""
+    clock = FakeClock()
+    modules = {
+        "framebuf": make_framebuf_module(),
+        "machine": make_machine_module(),
+        "utime": clock,
+        "uasyncio": make_uasyncio_module(),
+    }
+    if extra_modules:
+        modules.update(extra_modules)
+    driver = load_module("Pico_OLED_242", modules)
+    driver.test_clock = clock  # type: ignore[attr-defined]
+    return driver
+
+
+def load_display_service():
+    """Imports lib.display_service with a threading-backed ``_thread``."""
+    thread_module = make_thread_module()
+    module = load_module(
+        "display_service",
+        {
+            "_thread": thread_module,
+            "utime": ThreadClock(),
+            "uasyncio": make_uasyncio_module(),
+        },
+    )
+    module.test_threads = thread_module.threads  # type: ignore[attr-defined]
+    return module
+
+
+def load_frame_scheduler():
+    """Imports lib.frame_scheduler against asyncio and a fake clock."""
+    return load_module(
+        "frame_scheduler", {"uasyncio": make_uasyncio_module(), "utime": FakeClock()}
+    )
+
+
+def make_oled(driver, **kwargs):
+    """Builds an OLED_2inch42 and wires the SPI fake to its DC pin."""
+    FakeSPI.instances.clear()
+    oled = driver.OLED_2inch42(**kwargs)
+    if hasattr(oled, "spi"):
+        oled.spi.dc = oled.dc
+        oled.spi.writes.clear()
+    return oled
+
+
+def make_dma_oled(driver, **kwargs):
+    """Builds an OLED_2inch42 streaming through a FakeDMA."""
+    fake = FakeDMA()
+    spi_dma = load_module("spi_dma", {"uasyncio": make_uasyncio_module()})
+    dma = spi_dma.SpiDma(fake, FakeMem())
+    FakeSPI.instances.clear()
+    oled = driver.OLED_2inch42(dma=dma, **kwargs)
+    oled.spi.dc = oled.dc
+    fake.spi = oled.spi
+    oled.spi.writes.clear()
+    return oled, fake
+
+
+def data_bursts(spi):
+    return [data for level, data in spi.writes if level == 1]
+
+
+def command_bytes(spi):
+    return b"".join(data for level, data in spi.writes if level == 0)
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import unittest
+
+from oled_fakes import data_bursts, load_display_service, load_driver, make_oled
+
+FRAMES = 300
+
+
+class TestDisplayService(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver, shadow_frame=False)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+        self.module = load_display_service()
+        self.service = self.module.DisplayService(self.oled)
+
+    def tearDown(self):
+        self.service.stop()
+        for thread in self.module.test_threads:
+            thread.join(timeout=5)
+
+    def stamp(self, frame):
+        """Writes the frame number into pages 0 and 7 (two windows)."""
+        value = bytes([frame & 0xFF]) * 16
+        for page in (0, 7):
+            self.oled.buffer[page * 128 : page * 128 + 16] = value
+            self.oled.mark_dirty(0, page * 8, 16, 8)
+
+    def assert_frames_in_order(self, count):
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 2 * count)
+        for frame in range(count):
+            top, bottom = bursts[2 * frame], bursts[2 * frame + 1]
+            # A torn frame would mix two frame numbers
+            self.assertEqual(top, bytes([frame & 0xFF]) * 16)
+            self.assertEqual(bottom, top)
+
+    def test_every_frame_sent_once_in_order(self):
+        self.service.start()
+        for frame in range(FRAMES):
+            self.stamp(frame)
+            self.oled.show()
+        self.service.stop()
+
+        self.assert_frames_in_order(FRAMES)
+        self.assertEqual(self.service.frames_submitted, FRAMES)
+        self.assertEqual(self.service.frames_sent, FRAMES)
+        self.assertIsNone(self.oled.flusher)
+
+    def test_show_async_hands_over_without_loss(self):
+        async def producer():
+            for frame in range(FRAMES):
+                self.stamp(frame)
+                await self.oled.show_async()
+
+        self.service.start()
+        asyncio.run(producer())
+        self.service.stop()
+
+        self.assert_frames_in_order(FRAMES)
+
+    def test_clean_show_submits_nothing(self):
+        self.service.start()
+        self.oled.show()
+        self.service.stop()
+
+        self.assertEqual(self.service.frames_submitted, 0)
+        self.assertEqual(self.oled.spi.writes, [])
+
+    def test_blanking_travels_with_the_frame(self):
+        self.service.start()
+        self.oled.blank()
+        self.oled.show()  # nothing dirty, but the panel must go off
+        self.oled.show()  # and back on
+        self.service.stop()
+
+        self.assertEqual(self.service.frames_submitted, 2)
+        self.assertEqual(self.oled.spi.writes, [(0, b"\xae"), (0, b"\xaf")])
+
+    def test_posted_job_runs_on_service_thread(self):
+        done = threading.Event()
+        ran_on = []
+
+        def job():
+            ran_on.append(threading.get_ident())
+            yield
+            done.set()
+
+        self.service.start()
+        self.assertTrue(self.service.post(job()))
+        self.assertTrue(done.wait(timeout=5))
+
+        self.assertNotEqual(ran_on[0], threading.get_ident())
+
+    def test_frames_during_a_job_go_out_between_its_steps(self):
+        started = threading.Event()
+        submitted = threading.Event()
+        sent_at_step = []
+
+        def beep():
+            started.set()
+            # Audio chunks until both frames are handed over (at most ~5 s)
+            for _ in range(5000):
+                if submitted.wait(0.001):
+                    break
+                yield
+            # Two more chunks, noting what had been sent before each
+            for _ in range(2):
+                sent_at_step.append(self.service.frames_sent)
+                yield
+
+        self.service.start()
+        self.assertTrue(self.service.post(beep()))
+        self.assertTrue(started.wait(timeout=5))
+        for frame in range(2):  # the second waits for the slot
+            self.stamp(frame)
+            self.oled.show()
+        submitted.set()
+        self.service.stop()
+
+        # Both frames went out while the beep still had chunks to play
+        self.assertEqual(sent_at_step[-1], 2)
+        self.assert_frames_in_order(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from oled_fakes import load_driver, load_frame_scheduler, make_oled
+
+
+class TestFrameScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.oled = make_oled(load_driver())
+        self.oled.show()
+        self.oled.spi.writes.clear()
+        module = load_frame_scheduler()
+        self.frames = module.FrameScheduler(self.oled, interval_ms=0)
+        self.task = asyncio.create_task(self.frames.run())
+
+    async def asyncTearDown(self):
+        self.task.cancel()
+
+    async def test_requests_in_one_turn_make_one_flush(self):
+        async def draw(x):
+            self.frames.rect(x, 0, 8, 8, 1, True)
+            await self.frames.show_async()
+
+        self.frames.rect(0, 56, 8, 8, 1, True)
+        self.frames.show()
+        await asyncio.gather(draw(0), draw(16), draw(32))
+
+        self.assertEqual(self.frames.requests, 4)
+        self.assertEqual(self.frames.flushes, 1)
+        self.assertFalse(self.oled.needs_flush())
+
+    async def test_show_async_returns_once_the_frame_is_out(self):
+        self.frames.text_scaled("5", 0, 0, 2)
+        await self.frames.show_async()
+        self.assertFalse(self.oled.needs_flush())
+        self.assertTrue(self.oled.spi.writes)
+
+        # Drawing after that is the next frame
+        self.frames.rect(0, 56, 8, 8, 1, True)
+        await self.frames.show_async()
+        self.assertEqual(self.frames.flushes, 2)
+
+    async def test_nothing_drawn_sends_nothing(self):
+        await self.frames.show_async()
+        self.assertEqual(self.frames.requests, 1)
+        self.assertEqual(self.frames.flushes, 0)
+        self.assertEqual(self.oled.spi.writes, [])
+
+    async def test_other_attributes_reach_the_display(self):
+        self.assertIs(self.frames.buffer, self.oled.buffer)
+        self.assertEqual(self.frames.white, self.oled.white)
+
+
+if __name__ == "__main__":
+    unittest.main()
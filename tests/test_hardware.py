@@ -1,6 +1,6 @@
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # MOCKS
 # We must mock machine and framebuf BEFORE importing display/audio
@@ -12,6 +12,7 @@ sys.modules["framebuf"].FrameBuffer = MagicMock  # type: ignore
 
 # Import libraries under test
 from lib import audio, display, ui
+from lib.fonts import SEVEN_SEGMENT
 from lib.models import Game_Stats, State_Machine
 
 
@@ -20,6 +21,7 @@ class TestDisplay(unittest.IsolatedAsyncioTestCase):
         self.sm = State_Machine()
         self.game = Game_Stats()
         self.oled = MagicMock()
+        self.oled.show_async = AsyncMock()
 
     # Low Level
     def test_display_clear(self):
@@ -41,10 +43,11 @@ class TestDisplay(unittest.IsolatedAsyncioTestCase):
         await ui.enter_idle_mode(self.sm, self.game, self.oled)
 
         # Standard scoreline is deprecated, so only shot clock "00" is drawn.
-        # Digit 1: (0, 0, 64, 56). Center "0" (size 8, 64px). x=0, y=-4.
-        self.oled.text_scaled.assert_any_call("0", 0, -4, 8)
-        # Digit 2: (64, 0, 64, 56). Center "0". x=64, y=-4.
-        self.oled.text_scaled.assert_any_call("0", 64, -4, 8)
+        # Digit 1: (0, 0, 64, 56). Center "0" (32px seven-segment). x=16, page 0.
+        zero = SEVEN_SEGMENT.glyph("0")
+        self.oled.blit_pages.assert_any_call(zero, 16, 0, 32)
+        # Digit 2: (64, 0, 64, 56). Center "0". x=80, page 0.
+        self.oled.blit_pages.assert_any_call(zero, 80, 0, 32)
 
     async def test_enter_idle_mode_apa(self):
         self.game.selected_profile = "APA"
@@ -142,6 +145,22 @@ class TestAudio(unittest.TestCase):
             file_handle.seek.assert_called_with(80)
             file_handle.readinto.assert_called()
 
+    @patch(
+        "builtins.open",
+        new_callable=unittest.mock.mock_open,
+        read_data=b"HEADER" + b"\x00" * 2048,
+    )
+    def test_shot_clock_beep_chunks_yield_per_write(self, mock_file):
+        with patch("lib.audio.I2S") as MockI2S, patch("lib.audio.Pin"):
+            mock_file.return_value.readinto.side_effect = [1024, 1024, 0]
+            audio_out = MockI2S.return_value
+            writes = []
+            for _ in audio.shot_clock_beep_chunks():
+                writes.append(audio_out.write.call_count)
+
+            self.assertEqual(writes, [1, 2])
+            audio_out.deinit.assert_called_once()
+
     def test_shot_clock_beep_error_handling(self):
         # Simulate file not found
         with (
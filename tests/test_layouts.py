@@ -0,0 +1,53 @@
+import unittest
+from pathlib import Path
+
+from oled_fakes import load_driver, make_oled
+
+from lib import display, layouts, ui_screens
+from lib.models import Game_Stats
+from tools import compile_layouts
+
+
+class TestLayouts(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+
+    def test_generated_module_is_up_to_date(self):
+        # Run `python tools/compile_layouts.py` if this fails
+        self.assertEqual(compile_layouts.generate(), Path(layouts.__file__).read_text())
+
+    def test_steps_are_one_flat_array(self):
+        self.assertEqual(len(layouts.STEPS), layouts.FIELDS * len(layouts.TEXTS))
+        self.assertEqual(layouts.FIRST[-1], len(layouts.TEXTS))
+
+    def test_texts_draw_like_draw_text_in_region(self):
+        for name, lines in compile_layouts.TEXTS.items():
+            expected = make_oled(self.driver)
+            expected.fill(1)  # so the clears show
+            for region, text, font_size, align, y_offset in lines:
+                options = display.TextOptions(
+                    font_size=font_size, align=align, y_offset=y_offset
+                )
+                display.draw_text_in_region(expected, region, text, options)
+
+            oled = make_oled(self.driver)
+            oled.fill(1)
+            display.draw_layout(oled, getattr(layouts, name))
+            self.assertEqual(bytes(oled.buffer), bytes(expected.buffer), name)
+
+    def test_messages_draw_like_render_message(self):
+        for name, (message, font_size) in compile_layouts.MESSAGES.items():
+            expected = make_oled(self.driver)
+            ui_screens._draw_message_lines(expected, message, font_size)
+
+            oled = make_oled(self.driver)
+            display.draw_layout(oled, layouts.MESSAGES[(message, font_size)])
+            self.assertEqual(bytes(oled.buffer), bytes(expected.buffer), name)
+
+    def test_every_profile_has_a_layout(self):
+        for name in Game_Stats().profile_names:
+            self.assertIn(name, layouts.PROFILE_NAMES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import asyncio
 import sys
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 # --- Global Mocks ---
 # These must be in place before importing main
@@ -31,6 +31,11 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
         main.display.draw_text_in_region = MagicMock()
         main.display.display_clear = MagicMock()
         main.display.process_timer_duration = MagicMock(return_value="10")
+        main.hw_wrapper.oled.show_async = AsyncMock()
+        main.power = MagicMock()
+        main.power.level = main.AWAKE
+        main.power.update = AsyncMock()
+        main.power.wake = AsyncMock(return_value=False)
 
         # Async methods need AsyncMock or MagicMock(side_effect=coro)
         # Using side_effect with an async function silences "never awaited" warnings.
@@ -68,8 +73,12 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
 
         # Check if countdown decreased (1500 - 0 > 1000, so yes)
         self.assertEqual(main.game.countdown, 9)
-        # Check display update
-        main.display.draw_text_in_region.assert_called()  # type: ignore
+        # Check display update (the widgets repaint what changed)
+        main.ui.draw_timer_display.assert_called_once_with(  # type: ignore
+            main.state_machine, main.game, main.OLED
+        )
+        # The panel is never dimmed while the shot clock runs
+        self.assertTrue(main.power.update.await_args.args[1])  # type: ignore
 
     async def test_timer_worker_ultimate_pool_match_timer(self):
         # Setup state: Match timer running but SHOT CLOCK IDLE
@@ -110,9 +119,12 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
         ):
             await main.timer_worker()
 
-        self.assertTrue(
-            main.display.draw_text_in_region.called or main.display.display_clear.called  # type: ignore
+        # The first phase blanks the digits on the panel without redrawing
+        main.display.display_blank.assert_called_once_with(  # type: ignore
+            main.OLED, main.regions.SHOT_CLOCK_FULL, send_payload=False
         )
+        main.display.draw_text_in_region.assert_not_called()  # type: ignore
+        main.hw_wrapper.oled.show_async.assert_awaited_once()
 
     async def test_timer_worker_blink(self):
         main.state_machine.update_state(main.State_Machine.PROFILE_SELECTION)
@@ -127,11 +139,52 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
         ):
             await main.timer_worker()
 
-        # Should call display logic
-        self.assertTrue(
-            main.display.display_clear.called  # type: ignore
-            or main.ui.render_profile_selection.called  # type: ignore
+        # The visible phase only flushes; the selection is not re-rendered
+        main.ui.render_profile_selection.assert_not_called()  # type: ignore
+        main.hw_wrapper.oled.show_async.assert_awaited_once()
+
+    async def test_ui_blink_victory_uses_panel_off(self):
+        main.state_machine.update_state(main.State_Machine.VICTORY)
+        main.OLED.blank.reset_mock()  # type: ignore
+
+        self.assertFalse(await main._handle_ui_blink(True))
+        main.OLED.blank.assert_called_once()  # type: ignore
+        main.ui.render_victory.assert_not_called()  # type: ignore
+
+        main.OLED.blank.reset_mock()  # type: ignore
+        self.assertTrue(await main._handle_ui_blink(False))
+        main.OLED.blank.assert_not_called()  # type: ignore
+        self.assertEqual(main.hw_wrapper.oled.show_async.await_count, 2)
+
+    async def test_stopwatch_worker_paces_frames_from_ticks_us(self):
+        main.state_machine.update_state(main.State_Machine.SHOOTOUT_P1_RUNNING)
+        main.game.shootout_start_tick = 1_000_000
+        main.ui.render_shootout_stopwatch = AsyncMock()
+        sleeps = []
+
+        async def sleep_ms(ms):
+            sleeps.append(ms)
+            if len(sleeps) == 2:  # P1 stops
+                main.state_machine.update_state(main.State_Machine.SHOOTOUT_P2_WAIT)
+
+        # Start; frame 1 is drawn late, frame 2 on time
+        ticks = [1_000_000, 1_234_567, 1_240_000, 1_260_000, 1_265_000, 1_270_000]
+        with (
+            patch("main.utime.ticks_us", side_effect=ticks),
+            patch("main.utime.ticks_diff", side_effect=lambda a, b: a - b),
+            patch("main.utime.ticks_add", side_effect=lambda a, b: a + b),
+            patch("main.asyncio.sleep_ms", side_effect=sleep_ms),
+        ):
+            main.stopwatch_active = True
+            await main.stopwatch_worker()
+
+        sm, g, oled = main.state_machine, main.game, main.hw_wrapper.oled
+        main.ui.render_shootout_stopwatch.assert_has_awaits(
+            [call(sm, g, oled, 234), call(sm, g, oled, 265)]
         )
+        # The late frame restarts the schedule rather than rushing the next one
+        self.assertEqual(sleeps, [0, 10])
+        self.assertFalse(main.stopwatch_active)
 
     async def test_main_function(self):
         import contextlib
@@ -140,12 +193,15 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
             patch("main.asyncio.sleep", side_effect=asyncio.CancelledError),
             patch("main.asyncio.create_task") as mock_task,
             patch("main.timer_worker") as mock_worker,
+            patch("main.frame_scheduler") as mock_frames,
             contextlib.suppress(asyncio.CancelledError),
         ):
             await main.main()
 
         main.ui.render_profile_selection.assert_called_once()  # type: ignore
-        mock_task.assert_called_once()
+        # The frame scheduler's flush task and the timer worker
+        self.assertEqual(mock_task.call_count, 2)
+        mock_frames.run.assert_called_once()
         mock_worker.assert_called_once()
 
     async def test_callbacks(self):
@@ -175,6 +231,14 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
             # Inactivity check should update
             self.assertIsNotNone(main.inactivity_check)
 
+    async def test_press_that_wakes_the_panel_is_swallowed(self):
+        main.power.wake = AsyncMock(return_value=True)  # type: ignore
+        with patch("lib.button_logic.handle_make", new_callable=AsyncMock) as mock_make:
+            await main.on_make()
+
+        main.power.wake.assert_awaited_once()
+        mock_make.assert_not_called()
+
         async def test_on_make_simultaneous(self):
             with (
                 patch(
@@ -216,6 +280,9 @@ class TestMain(unittest.IsolatedAsyncioTestCase):
         await wrapper.render_menu(sm, g)
         main.ui.render_menu.assert_called_once()  # type: ignore
 
+        await wrapper.flush()
+        wrapper.oled.show_async.assert_awaited_once()
+
 
 if __name__ == "__main__":
     unittest.main()
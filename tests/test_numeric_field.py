@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import MagicMock
+
+from oled_fakes import load_driver, make_oled
+
+from lib import display, regions
+from lib.numeric_field import NumericField, number_places, region_layout, text_layout
+
+CLOCK = region_layout(
+    (
+        regions.MATCH_CLOCK_DIGIT_1,
+        regions.MATCH_CLOCK_DIGIT_2,
+        regions.MATCH_CLOCK_COLON,
+        regions.MATCH_CLOCK_DIGIT_3,
+        regions.MATCH_CLOCK_DIGIT_4,
+    ),
+    "00:00",
+    ((600, 10), (60, 10), None, (10, 6), (1, 10)),
+    regions.MATCH_CLOCK_FULL,
+)
+
+
+class TestNumericField(unittest.TestCase):
+    def setUp(self):
+        self.oled = MagicMock()
+        self.oled.black, self.oled.white = 0, 1
+        self.field = NumericField(5)
+
+    def test_first_draw_clears_area_and_draws_everything(self):
+        self.assertTrue(self.field.draw(self.oled, CLOCK, 1799))
+        self.oled.rect.assert_any_call(41, 56, 46, 8, 0, True)
+        texts = [c.args[0] for c in self.oled.text_scaled.call_args_list]
+        self.assertEqual(texts, ["2", "9", ":", "5", "9"])
+
+    def test_only_changed_digits_are_redrawn(self):
+        self.field.draw(self.oled, CLOCK, 1799)
+        self.oled.reset_mock()
+
+        self.assertFalse(self.field.draw(self.oled, CLOCK, 1798))
+        self.oled.text_scaled.assert_called_once_with("8", 77, 56, 1)
+        self.assertEqual(self.oled.rect.call_count, 1)
+
+        self.oled.reset_mock()
+        self.field.draw(self.oled, CLOCK, 1798)
+        self.oled.text_scaled.assert_not_called()
+
+    def test_sync_records_digits_without_drawing(self):
+        self.field.sync(CLOCK, 1800)
+        self.oled.rect.assert_not_called()
+
+        self.field.draw(self.oled, CLOCK, 1799)  # 30:00 -> 29:59
+        self.assertEqual(self.oled.rect.call_count, 4)
+
+    def test_number_places(self):
+        self.assertEqual(number_places(1), ((1, 10),))
+        self.assertEqual(number_places(3), ((100, 10), (10, 10), (1, 10)))
+
+
+class TestTextLayout(unittest.TestCase):
+    def test_cells_match_draw_text_in_region(self):
+        driver = load_driver()
+        big = display.TextOptions(font_size=2, align="center")
+        stopwatch = ((10000, 10), (1000, 10), None, (100, 10), (10, 10))
+        for region, options, x_offset, text, chars, places, value in (
+            ("up_shootout_stop_watch", big, 0, "12.34", "00.00", stopwatch, 12340),
+            ("p2_score", display.TEXT_RIGHT, 8, "17", "00", number_places(2), 17),
+            ("p1_score", display.TEXT_LEFT, 0, "5", "0", number_places(1), 5),
+        ):
+            expected = make_oled(driver)
+            display.draw_text_in_region(expected, region, text, options, x_offset)
+            drawn = make_oled(driver)
+            layout = text_layout(region, chars, places, options, x_offset)
+            NumericField(len(chars)).draw(drawn, layout, value)
+            self.assertEqual(drawn.buffer, expected.buffer, region)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,617 @@
+import unittest
+from unittest.mock import patch
+
+from oled_fakes import (
+    command_bytes,
+    data_bursts,
+    load_driver,
+    make_dma_oled,
+    make_oled,
+)
+
+from lib import display
+from lib.fonts import SEVEN_SEGMENT
+
+
+class TestOledTransfer(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        for i in range(len(self.oled.buffer)):
+            self.oled.buffer[i] = i & 0xFF
+        self.oled.invalidate()
+
+    def test_frame_mode_single_burst(self):
+        self.oled.transfer_mode = self.driver.TRANSFER_FRAME
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 1)
+        self.assertEqual(bursts[0], bytes(self.oled.buffer))
+        # Window covers every column and page, addressed in one command batch
+        self.assertEqual(self.oled.spi.writes[0], (0, bytes([0x21, 0, 127, 0x22, 0, 7])))
+
+    def test_page_mode_one_burst_per_page(self):
+        self.oled.transfer_mode = self.driver.TRANSFER_PAGE
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 8)
+        self.assertEqual(b"".join(bursts), bytes(self.oled.buffer))
+
+    def test_byte_mode_matches_legacy_output(self):
+        self.oled.transfer_mode = self.driver.TRANSFER_BYTE
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 1024)
+        self.assertEqual(b"".join(bursts), bytes(self.oled.buffer))
+
+    def test_measure_show_restores_mode(self):
+        clock = self.driver.test_clock
+        original_write = self.oled.spi.write
+
+        def timed_write(data):
+            clock.now_us += len(data)
+            original_write(data)
+
+        self.oled.spi.write = timed_write
+        self.oled.transfer_mode = self.driver.TRANSFER_FRAME
+
+        per_frame = self.oled.measure_show(frames=4, mode=self.driver.TRANSFER_BYTE)
+
+        # 1024 data bytes + 3 commands per page, one byte per write
+        self.assertEqual(per_frame, 1024 + 24)
+        self.assertEqual(self.oled.transfer_mode, self.driver.TRANSFER_FRAME)
+
+
+class TestOledCommands(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+
+    def test_init_is_one_command_batch(self):
+        clock = self.driver.test_clock
+        original_write = self.oled.spi.write
+
+        def timed_write(data):
+            clock.now_us += len(data)
+            original_write(data)
+
+        self.oled.spi.write = timed_write
+        self.oled.init_display()
+
+        self.assertEqual(self.oled.spi.writes, [(0, self.driver.INIT_CMDS)])
+        self.assertEqual(self.oled.init_us, len(self.driver.INIT_CMDS))
+
+    def test_set_contrast(self):
+        self.oled.set_contrast(0x10)
+
+        self.assertEqual(self.oled.spi.writes, [(0, bytes([0x81, 0x10]))])
+
+
+class TestOledDirtyPages(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver, shadow_frame=False)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+    def test_nothing_sent_when_clean(self):
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [])
+
+    def test_match_timer_row_sends_one_page(self):
+        # match_clock_digit_4 lives entirely in page 7
+        self.oled.rect(77, 56, 8, 8, 0, True)
+        self.oled.text_scaled("8", 77, 56, 1)
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 1)
+        self.assertEqual(bursts[0], bytes(self.oled.buffer[7 * 128 + 77 : 7 * 128 + 85]))
+        self.assertIn(bytes([0x21, 77, 84, 0x22, 7, 7]), command_bytes(self.oled.spi))
+
+    def test_adjacent_pages_share_one_burst(self):
+        self.oled.line(0, 17, 127, 30, 1)
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 1)
+        self.assertEqual(len(bursts[0]), 256)
+
+    def test_separate_runs_and_page_mode(self):
+        self.oled.transfer_mode = self.driver.TRANSFER_PAGE
+        self.oled.rect(0, 0, 4, 4, 1, True)
+        self.oled.rect(0, 40, 4, 10, 1, True)
+        self.oled.show()
+
+        # page 0, then pages 5 and 6 individually, four columns each
+        self.assertEqual([len(b) for b in data_bursts(self.oled.spi)], [4] * 3)
+
+    def test_timeout_pip_moves_a_handful_of_bytes(self):
+        # p1_timeout_counter_1 (40, 58, 4, 4)
+        self.oled.rect(40, 58, 4, 4, 1, True)
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(bursts, [bytes(self.oled.buffer[7 * 128 + 40 : 7 * 128 + 44])])
+
+    def test_narrow_pages_merge_when_columns_line_up(self):
+        # Same columns on pages 2 and 3 -> one window, gathered row by row
+        self.oled.rect(10, 16, 6, 16, 1, True)
+        self.oled.show()
+
+        bursts = data_bursts(self.oled.spi)
+        self.assertEqual(len(bursts), 1)
+        expected = bytes(self.oled.buffer[2 * 128 + 10 : 2 * 128 + 16]) + bytes(
+            self.oled.buffer[3 * 128 + 10 : 3 * 128 + 16]
+        )
+        self.assertEqual(bursts[0], expected)
+
+    def test_distant_columns_stay_separate(self):
+        self.oled.rect(0, 16, 4, 4, 1, True)
+        self.oled.rect(120, 24, 4, 4, 1, True)
+        self.oled.show()
+
+        self.assertEqual([len(b) for b in data_bursts(self.oled.spi)], [4, 4])
+
+    def test_copy_page_span_moves_bytes_and_marks_destination(self):
+        self.oled.text_scaled("Rack:1", 24, 40, 1)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+        self.oled.copy_page_span(5, 3, 24, 104)
+
+        self.assertEqual(self.oled.dirty_pages, 1 << 3)
+        self.assertEqual(
+            bytes(self.oled.buffer[3 * 128 + 24 : 3 * 128 + 104]),
+            bytes(self.oled.buffer[5 * 128 + 24 : 5 * 128 + 104]),
+        )
+
+    def test_restore_buffer_puts_saved_pixels_back(self):
+        self.oled.text_scaled("30", 0, 0, 4)
+        saved = bytearray(len(self.oled.buffer))
+        self.oled.save_buffer(saved)
+        self.assertEqual(self.oled.dirty_pages, 1 | 2 | 4 | 8)  # nothing new marked
+
+        self.oled.fill(0)
+        self.oled.show()
+        self.oled.restore_buffer(saved)
+
+        self.assertEqual(bytes(self.oled.buffer), bytes(saved))
+        self.assertEqual(self.oled.dirty_pages, 0xFF)
+
+    def test_read_pages_copies_whole_pages(self):
+        self.oled.text_scaled("7", 8, 16, 2)  # pages 2-3
+        pages = bytearray(2 * 128)
+        self.oled.read_pages(pages, 2)
+        self.assertEqual(bytes(pages), bytes(self.oled.buffer[256:512]))
+
+        self.oled.fill(0)
+        self.oled.blit_pages(pages, 0, 2, 128)
+        self.assertEqual(bytes(self.oled.buffer[256:512]), bytes(pages))
+
+    def test_fill_and_offscreen_marks(self):
+        self.oled.text_scaled("0", 0, -4, 8)  # reaches row 59 -> pages 0-7
+        self.assertEqual(self.oled.dirty_pages, 0xFF)
+        self.oled.show()
+
+        self.oled.rect(0, 70, 8, 8, 1, True)
+        self.assertEqual(self.oled.dirty_pages, 0)
+
+        self.oled.fill(0)
+        self.assertEqual(self.oled.dirty_pages, 0xFF)
+
+
+class TestOledShadowFrame(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.oled.text_scaled("Select Game:", 16, 6, 1)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+    def test_first_show_sends_everything(self):
+        oled = make_oled(self.driver)
+        oled.show()
+        self.assertEqual(b"".join(data_bursts(oled.spi)), bytes(oled.buffer))
+
+    def test_identical_redraw_sends_nothing(self):
+        self.oled.rect(0, 0, 128, 20, 0, True)
+        self.oled.text_scaled("Select Game:", 16, 6, 1)
+        self.oled.show()
+
+        self.assertEqual(self.oled.spi.writes, [])
+
+    def test_only_changed_runs_are_sent(self):
+        self.oled.buffer[3 * 128 + 10] = 0xFF
+        self.oled.buffer[3 * 128 + 12] = 0xFF
+        self.oled.buffer[3 * 128 + 100] = 0xFF
+        self.oled.mark_dirty(0, 24, 128, 8)
+        self.oled.show()
+
+        # Columns 10 and 12 share a window (gap < WINDOW_COST), 100 is alone
+        self.assertEqual(
+            data_bursts(self.oled.spi), [bytes([0xFF, 0x00, 0xFF]), bytes([0xFF])]
+        )
+
+        self.oled.spi.writes.clear()
+        self.oled.mark_dirty(0, 24, 128, 8)
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [])
+
+    def test_resync_resends_frame(self):
+        self.oled.resync()
+        self.oled.show()
+        self.assertEqual(b"".join(data_bursts(self.oled.spi)), bytes(self.oled.buffer))
+
+
+class TestOledBlanking(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.oled.text_scaled("00", 0, 0, 4)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+        self.pixels = bytes(self.oled.buffer)
+
+    def test_panel_off_for_one_show(self):
+        self.oled.blank()
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [(0, b"\xae")])
+
+        self.oled.spi.writes.clear()
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [(0, b"\xaf")])
+        self.assertEqual(bytes(self.oled.buffer), self.pixels)
+
+    def test_drawing_while_off_appears_before_panel_on(self):
+        self.oled.blank()
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+        self.oled.rect(0, 56, 4, 8, 1, True)
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes[-1], (0, b"\xaf"))
+        self.assertEqual(len(data_bursts(self.oled.spi)), 1)
+
+    def test_region_blank_sends_only_lit_bytes_then_restores(self):
+        lit = sum(1 for b in self.pixels[: 4 * 128] if b)
+        self.oled.blank_region(0, 0, 128, 32)
+        self.oled.show()
+
+        blanked = b"".join(data_bursts(self.oled.spi))
+        self.assertEqual(blanked.count(0), len(blanked))
+        self.assertLessEqual(len(blanked), 4 * 128)
+        self.assertGreaterEqual(len(blanked), lit)
+        self.assertEqual(bytes(self.oled.shadow[: 4 * 128]), bytes(4 * 128))
+        self.assertEqual(bytes(self.oled.buffer), self.pixels)
+
+        self.oled.spi.writes.clear()
+        self.oled.show()
+        self.assertEqual(bytes(self.oled.shadow), self.pixels)
+        self.assertGreater(len(data_bursts(self.oled.spi)), 0)
+
+    def test_region_blank_masks_partial_pages(self):
+        self.oled.buffer[2 * 128 + 5] = 0xFF
+        self.oled.mark_dirty(5, 16, 1, 8)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+        # profile_selection starts at row 20: only rows 4-7 of page 2 go dark
+        self.oled.blank_region(0, 20, 128, 44)
+        self.oled.show()
+
+        self.assertEqual(self.oled.shadow[2 * 128 + 5], 0x0F)
+        self.assertEqual(self.oled.buffer[2 * 128 + 5], 0xFF)
+
+    def test_region_blank_without_shadow_sends_masked_region(self):
+        oled = make_oled(self.driver, shadow_frame=False)
+        oled.fill(1)
+        oled.show()
+        oled.spi.writes.clear()
+
+        oled.blank_region(0, 56, 8, 8)
+        oled.show()
+        self.assertEqual(data_bursts(oled.spi), [bytes(8)])
+
+        oled.spi.writes.clear()
+        oled.show()
+        self.assertEqual(data_bursts(oled.spi), [b"\xff" * 8])
+
+
+class TestOledPower(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.oled.text_scaled("00", 0, 0, 4)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+    def test_sleep_keeps_panel_off_until_wake(self):
+        self.oled.sleep()
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [(0, b"\xae")])
+
+        # Later frames (and blinks) still reach the RAM but not the glass
+        self.oled.spi.writes.clear()
+        self.oled.show()
+        self.oled.rect(0, 56, 4, 8, 1, True)
+        self.oled.show()
+        self.assertNotIn((0, b"\xaf"), self.oled.spi.writes)
+        self.assertFalse(self.oled.needs_flush())
+
+        self.oled.spi.writes.clear()
+        self.oled.wake()
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [(0, b"\xaf")])
+
+    def test_dim_is_sent_once_with_the_next_frame(self):
+        self.oled.dim(0x08)
+        self.assertTrue(self.oled.needs_flush())
+        self.oled.show()
+        self.oled.show()
+        self.assertEqual(self.oled.spi.writes, [(0, b"\x81\x08")])
+
+
+class TestOledGlyphCache(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.cached = make_oled(self.driver)
+        self.plain = make_oled(self.driver, glyph_cache=False)
+
+    def test_blitted_digits_match_scaled_text(self):
+        for oled in (self.cached, self.plain):
+            oled.show()
+            oled.text_scaled("30", 0, 0, 3)
+            oled.text_scaled("1:05", 0, 40, 3)
+            oled.text_scaled("Race 7", 0, 56, 2)
+        self.assertEqual(self.cached.buffer, self.plain.buffer)
+        self.assertEqual(self.cached.dirty_pages, self.plain.dirty_pages)
+        self.assertEqual(self.cached.dirty_x1, self.plain.dirty_x1)
+
+    def test_cached_digits_are_not_scaled(self):
+        base = self.driver.framebuf.FrameBuffer
+        with patch.object(base, "text_scaled") as scaled:
+            self.cached.text_scaled("42", 64, 0, 3)
+            scaled.assert_not_called()
+            self.cached.text_scaled("42", 64, 0, 8)
+            scaled.assert_called_once_with("42", 64, 0, 8)
+
+    def test_budget_skips_scales_that_do_not_fit(self):
+        cache = self.driver.GlyphCache(scales=(8, 3, 2), budget=1500)
+        self.assertIsNone(cache.get(8))
+        self.assertEqual(len(cache.get(3)), 10)
+        self.assertEqual(len(cache.get(2)), 10)
+        self.assertEqual(cache.size_bytes, 720 + 320)
+
+
+class TestOledBitmapFont(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.oled.show()
+
+    def test_blit_pages_copies_whole_page_rows(self):
+        glyph = SEVEN_SEGMENT.glyph("8")
+        self.oled.blit_pages(glyph, 16, 0, 32)
+
+        for page in range(7):
+            row = bytes(glyph[page * 32 : page * 32 + 32])
+            self.assertEqual(
+                bytes(self.oled.buffer[page * 128 + 16 : page * 128 + 48]), row
+            )
+        self.assertEqual(self.oled.dirty_pages, 0x7F)
+        self.assertEqual(self.oled.dirty_x0[0], 16)
+        self.assertEqual(self.oled.dirty_x1[6], 48)
+
+    def test_blit_pages_clips_at_the_edges(self):
+        glyph = SEVEN_SEGMENT.glyph("8")
+        self.oled.blit_pages(glyph, 112, 2, 32)
+
+        self.assertEqual(
+            bytes(self.oled.buffer[2 * 128 + 112 : 3 * 128]), bytes(glyph[:16])
+        )
+        self.assertEqual(self.oled.dirty_pages, 0xFC)  # page 8 falls off the panel
+        self.assertEqual(self.oled.dirty_x1[2], 128)
+
+    def test_region_text_with_font(self):
+        options = display.TextOptions(font=SEVEN_SEGMENT, send_payload=False)
+        display.draw_text_in_region(self.oled, "shot_clock_digit_2", "7", options)
+
+        seven = SEVEN_SEGMENT.glyph("7")
+        # (64, 0, 64, 56): 32 px centered -> column 80, page 0
+        self.assertEqual(bytes(self.oled.buffer[80:112]), bytes(seven[:32]))
+        self.assertEqual(
+            bytes(self.oled.buffer[6 * 128 + 80 : 6 * 128 + 112]), bytes(seven[192:])
+        )
+        self.assertEqual(SEVEN_SEGMENT.glyph(":"), SEVEN_SEGMENT.blank)
+
+
+class TestOledShowAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.oled.show()
+        self.oled.spi.writes.clear()
+
+    async def test_yields_after_every_page(self):
+        yields = []
+
+        async def fake_sleep_ms(ms):
+            yields.append(len(data_bursts(self.oled.spi)))
+
+        self.driver.asyncio.sleep_ms = fake_sleep_ms
+        self.oled.fill(1)
+        await self.oled.show_async()
+
+        # One page per burst, with a yield after each
+        self.assertEqual(yields, list(range(1, 9)))
+        self.assertEqual(b"".join(data_bursts(self.oled.spi)), bytes(self.oled.buffer))
+
+    async def test_drawing_during_flush_is_not_lost(self):
+        async def draw_while_suspended(ms):
+            self.oled.rect(0, 56, 2, 8, 0, True)
+
+        self.driver.asyncio.sleep_ms = draw_while_suspended
+        self.oled.fill(1)
+        await self.oled.show_async()
+        self.oled.show()
+
+        self.assertEqual(bytes(self.oled.shadow), bytes(self.oled.buffer))
+
+    async def test_sends_from_the_reused_frame(self):
+        taken = []
+        take_frame = self.oled.take_frame
+
+        def record(frame):
+            taken.append(frame)
+            take_frame(frame)
+
+        self.oled.take_frame = record
+        for _ in range(2):
+            self.oled.fill(1)
+            await self.oled.show_async()
+            self.oled.fill(0)
+            await self.oled.show_async()
+
+        self.assertEqual(taken, [self.oled.snapshot] * 4)
+        self.assertFalse(self.oled.snapshot_busy)
+
+    async def test_drawing_while_suspended_does_not_tear_the_frame(self):
+        async def draw_while_suspended(ms):
+            self.driver.asyncio.sleep_ms = fake_sleep_ms
+            self.oled.rect(0, 56, 128, 8, 0, True)  # page 7, not sent yet
+
+        async def fake_sleep_ms(ms):
+            pass
+
+        self.driver.asyncio.sleep_ms = draw_while_suspended
+        self.oled.fill(1)
+        await self.oled.show_async()
+
+        # The frame went out whole, as it was when show_async() was called
+        self.assertEqual(b"".join(data_bursts(self.oled.spi)), b"\xff" * 1024)
+        self.assertEqual(self.oled.dirty_pages, 1 << 7)
+
+    async def test_show_while_suspended_keeps_the_frame_in_flight(self):
+        async def show_while_suspended(ms):
+            self.driver.asyncio.sleep_ms = fake_sleep_ms
+            self.oled.rect(0, 0, 2, 8, 0, True)
+            self.oled.rect(0, 56, 2, 8, 0, True)
+            self.oled.show()
+
+        async def fake_sleep_ms(ms):
+            pass
+
+        self.driver.asyncio.sleep_ms = show_while_suspended
+        self.oled.fill(1)
+        await self.oled.show_async()
+
+        # All eight pages still went out from the copy. Page 7 went out
+        # after the show() sent it newer, so it is sent again next time.
+        self.assertEqual(self.oled.snapshot.dirty, 0xFF)
+        self.assertEqual(self.oled.dirty_pages, 1 | 1 << 7)
+        self.oled.show()
+        self.assertEqual(bytes(self.oled.shadow), bytes(self.oled.buffer))
+
+
+class TestOledI2C(unittest.TestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.driver.Device = self.driver.Device_I2C
+        self.oled = make_oled(self.driver, shadow_frame=False)
+        self.oled.show()
+        self.i2c = self.oled.i2c
+        self.i2c.writes.clear()
+
+    def test_frame_is_one_data_transaction(self):
+        self.oled.fill(1)
+        self.oled.show()
+
+        self.assertEqual(
+            self.i2c.writes,
+            [bytes([0x00, 0x21, 0, 127, 0x22, 0, 7]), b"\x40" + bytes(self.oled.buffer)],
+        )
+
+    def test_page_mode_one_transaction_per_page(self):
+        self.oled.transfer_mode = self.driver.TRANSFER_PAGE
+        self.oled.fill(1)
+        self.oled.show()
+
+        data = [w for w in self.i2c.writes if w[0] == 0x40]
+        self.assertEqual([len(w) for w in data], [129] * 8)
+
+    def test_small_window_addresses_in_one_transaction(self):
+        self.oled.rect(40, 58, 4, 4, 1, True)
+        self.oled.show()
+
+        self.assertEqual(
+            self.i2c.writes,
+            [
+                bytes([0x00, 0x21, 40, 43, 0x22, 7, 7]),
+                b"\x40" + bytes(self.oled.buffer[7 * 128 + 40 : 7 * 128 + 44]),
+            ],
+        )
+
+
+class TestOledSpiDma(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled, self.fake_dma = make_dma_oled(self.driver, shadow_frame=False)
+        self.oled.show()
+        self.oled.wait_dma()
+        self.oled.spi.writes.clear()
+
+    def test_show_returns_while_transfer_runs(self):
+        self.oled.rect(0, 0, 128, 8, 1, True)
+        self.oled.show()
+
+        self.assertIsNotNone(self.fake_dma.transfer)
+        self.assertEqual(data_bursts(self.oled.spi), [])
+        # Redrawing straight away must not change what goes out
+        self.oled.fill(0)
+        self.oled.wait_dma()
+        self.assertEqual(data_bursts(self.oled.spi), [b"\xff" * 128])
+
+    def test_commands_wait_for_previous_burst(self):
+        self.oled.rect(0, 0, 4, 4, 1, True)
+        self.oled.rect(0, 56, 4, 4, 1, True)
+        self.oled.show()
+        self.oled.wait_dma()
+
+        levels = [level for level, _ in self.oled.spi.writes]
+        # window commands, data, window commands, data - never interleaved
+        self.assertEqual(levels, [0, 1, 0, 1])
+
+    def test_transfer_targets_spi_fifo(self):
+        self.oled.rect(0, 0, 4, 4, 1, True)
+        self.oled.show()
+
+        config = self.fake_dma.configs[-1]
+        self.assertEqual(config["write"], 0x40080000 + 0x008)
+        self.assertEqual(config["count"], 4)
+        self.assertEqual(config["ctrl"]["treq_sel"], 24)
+
+    async def test_show_async_waits_on_completion_flag(self):
+        self.fake_dma.busy_polls = 1000  # only the event loop completes it
+        self.oled.fill(1)
+        await self.oled.show_async()
+
+        self.assertIsNone(self.fake_dma.transfer)
+        self.assertEqual(b"".join(data_bursts(self.oled.spi)), bytes(self.oled.buffer))
+
+    async def test_flag_left_by_a_waited_transfer_does_not_end_the_next_wait(self):
+        # setUp's show() completed by polling, leaving the completion flag set
+        self.fake_dma.busy_polls = 1000
+        self.oled.fill(1)
+        await self.oled.show_async()
+
+        # The event loop finished every page; none fell back to polling
+        self.assertEqual(self.fake_dma.polls, 1000 - 1)
+        self.assertEqual(b"".join(data_bursts(self.oled.spi)), bytes(self.oled.buffer))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from lib.hardware_config import OLED_CONTRAST, OLED_DIM_CONTRAST
+from lib.power import ASLEEP, AWAKE, DIMMED, PowerManager
+
+
+class TestPowerManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.oled = MagicMock()
+        self.oled.show_async = AsyncMock()
+        self.power = PowerManager(self.oled, dim_ms=1000, off_ms=5000)
+
+    async def test_steps_down_with_idle_time(self):
+        await self.power.update(500)
+        self.assertEqual(self.power.level, AWAKE)
+        self.oled.show_async.assert_not_awaited()
+
+        await self.power.update(1000)
+        self.assertEqual(self.power.level, DIMMED)
+        self.oled.dim.assert_called_once_with(OLED_DIM_CONTRAST)
+
+        # Staying dimmed costs nothing per heartbeat
+        await self.power.update(2000)
+        self.assertEqual(self.oled.show_async.await_count, 1)
+
+        await self.power.update(5000)
+        self.assertEqual(self.power.level, ASLEEP)
+        self.oled.sleep.assert_called_once()
+        self.assertEqual(self.oled.show_async.await_count, 2)
+
+    async def test_hold_keeps_panel_bright(self):
+        await self.power.update(60000, hold=True)
+        self.assertEqual(self.power.level, AWAKE)
+        self.oled.sleep.assert_not_called()
+
+    async def test_wake_reports_whether_panel_was_off(self):
+        self.assertFalse(await self.power.wake())
+        self.oled.show_async.assert_not_awaited()
+
+        await self.power.update(1000)
+        self.assertFalse(await self.power.wake())
+        self.oled.dim.assert_called_with(OLED_CONTRAST)
+
+        await self.power.update(5000)
+        self.assertTrue(await self.power.wake())
+        self.oled.wake.assert_called()
+        self.assertEqual(self.power.level, AWAKE)
+        # Waking never redraws; it only flushes the power state
+        self.oled.fill.assert_not_called()
+        self.oled.text_scaled.assert_not_called()
+
+    async def test_zero_timeout_disables_step(self):
+        power = PowerManager(self.oled, dim_ms=0, off_ms=0)
+        await power.update(10**9)
+        self.assertEqual(power.level, AWAKE)
+
+
+if __name__ == "__main__":
+    unittest.main()
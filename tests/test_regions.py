@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock
+
+from lib import display, regions
+from lib.hardware_config import DISPLAY_REGIONS
+
+
+class TestRegionTable(unittest.TestCase):
+    def test_handles_match_display_regions(self):
+        self.assertEqual(regions.NAMES, tuple(DISPLAY_REGIONS))
+        for handle, name in enumerate(regions.NAMES):
+            self.assertEqual(getattr(regions, name.upper()), handle, name)
+            self.assertEqual(regions.get_rect(handle), DISPLAY_REGIONS[name], name)
+
+    def test_groups_follow_their_names(self):
+        for i, handle in enumerate(regions.MATCH_CLOCK_DIGITS):
+            self.assertEqual(regions.NAMES[handle], f"match_clock_digit_{i + 1}")
+        for i, handle in enumerate(regions.MATCH_CLOCK_DIGITS_S[1:], start=2):
+            self.assertEqual(regions.NAMES[handle], f"match_clock_digit_{i}_s")
+        for prefix, group in (("", regions.SCORELINE), ("up_", regions.UP_SCORELINE)):
+            names = [regions.NAMES[handle] for handle in group]
+            self.assertEqual(
+                names,
+                [
+                    f"{prefix}{player}_{part}"
+                    for player in ("p1", "p2")
+                    for part in ("score", "separator", "target")
+                ],
+            )
+
+    def test_helpers_accept_handles_and_names(self):
+        by_name, by_handle = MagicMock(), MagicMock()
+        for oled in (by_name, by_handle):
+            oled.black, oled.white = 0, 1
+        for oled, region in (
+            (by_name, "match_clock_digit_3"),
+            (by_handle, regions.MATCH_CLOCK_DIGIT_3),
+        ):
+            display.display_clear(oled, region, send_payload=False)
+            display.draw_text_in_region(oled, region, "7")
+            display.draw_rect_in_region(oled, region, fill=False)
+            display.display_blank(oled, region, send_payload=False)
+        self.assertEqual(by_name.mock_calls, by_handle.mock_calls)
+
+    def test_unknown_name_is_ignored(self):
+        oled = MagicMock()
+        display.display_clear(oled, "no_such_region", send_payload=False)
+        display.display_blank(oled, "no_such_region", send_payload=False)
+        oled.rect.assert_not_called()
+        oled.blank_region.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
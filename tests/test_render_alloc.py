@@ -0,0 +1,158 @@
+"""
+Heap checks for the steady-state render path.
+
+tracemalloc stands in for MicroPython's gc.mem_alloc(). CPython also puts
+its loop iterators on the heap, so each tick is compared with one that runs
+the same loops with nothing to draw: any allocation while drawing raises
+the peak above it.
+"""
+
+import sys
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+from oled_fakes import FakeClock, make_thread_module, make_uasyncio_module
+
+from lib.models import Game_Stats, State_Machine
+from lib.ui_widgets import gameplay_screen
+
+TICKS = 1000
+# Made up front, so the ticks do not allocate the ints past the small-int cache
+COUNTS = tuple(range(TICKS))
+
+
+class NullOled:
+    """Accepts the drawing calls and does nothing, so only the render
+    code's own allocations are measured."""
+
+    black = 0
+    white = 1
+    width = 128
+    height = 64
+
+    def rect(self, x, y, w, h, c, f=False):
+        pass
+
+    def line(self, x1, y1, x2, y2, c):
+        pass
+
+    def fill(self, c):
+        pass
+
+    def text_scaled(self, s, x, y, scale):
+        pass
+
+    def blit_pages(self, data, x, page, width):
+        pass
+
+    def new_frame(self):
+        return None
+
+    async def show_async(self):
+        pass
+
+
+def load_main():
+    """Imports a fresh main.py with the panel and the MicroPython modules
+    faked, without starting the program it runs on import."""
+    uasyncio = make_uasyncio_module()
+    uasyncio.run = lambda coro: coro.close()  # type: ignore[attr-defined]
+    uasyncio.new_event_loop = lambda: None  # type: ignore[attr-defined]
+    panel = MagicMock(OLED_2inch42=NullOled)
+    modules = {
+        "_thread": make_thread_module(),
+        "uasyncio": uasyncio,
+        "utime": FakeClock(),
+        "machine": MagicMock(),
+        "lib.Pico_OLED_242": panel,
+    }
+    import lib
+
+    previous = lib.__dict__.get("Pico_OLED_242")
+    with patch.dict(sys.modules, modules):
+        sys.modules.pop("main", None)
+        lib.Pico_OLED_242 = panel  # type: ignore[attr-defined]
+        try:
+            import main
+        finally:
+            lib.__dict__.pop("Pico_OLED_242", None)
+            if previous is not None:
+                lib.Pico_OLED_242 = previous  # type: ignore[attr-defined]
+    return main
+
+
+def run(coro):
+    """Runs a coroutine that never suspends."""
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+
+
+class TestRenderAllocations(unittest.TestCase):
+    def setUp(self):
+        self.oled = NullOled()
+        self.sm = State_Machine()
+        self.sm.update_state(State_Machine.COUNTDOWN_IN_PROGRESS)
+        self.game = Game_Stats()
+        self.screen = gameplay_screen(self.game)
+        self.screen.mount()
+
+    def allocated(self, tick):
+        """Bytes allocated by TICKS calls of tick, after a warm-up call."""
+        tick(0)  # Warm up anything created on first use
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            for n in COUNTS:
+                tick(n)
+            return tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+
+    def unchanged(self, n):
+        """A render with nothing to repaint."""
+        self.screen.render(self.oled, self.sm, self.game)
+
+    def test_gameplay_render_allocates_nothing(self):
+        def tick(n):
+            self.game.countdown = 30 - n % 31
+            self.screen.render(self.oled, self.sm, self.game)
+
+        self.assertEqual(self.allocated(tick), self.allocated(self.unchanged))
+
+    def test_ultimate_pool_render_allocates_nothing(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.screen.mount()
+        matches = tuple(1800 - n for n in COUNTS)
+
+        def tick(n):
+            self.game.countdown = 30 - n % 31
+            self.game.match_countdown = matches[n]
+            self.screen.render(self.oled, self.sm, self.game)
+
+        self.assertEqual(self.allocated(tick), self.allocated(self.unchanged))
+
+    def test_countdown_tick_allocates_only_its_coroutines(self):
+        main = load_main()
+        main.OLED = main.hw_wrapper.oled = self.oled
+        main.state_machine, main.game = self.sm, self.game
+
+        def tick(n):
+            # 35..6: no beep and no expiry, just the tick
+            self.game.countdown = 36 - n % 30
+            run(main._handle_countdown_tick())
+
+        def tick_unchanged(n):
+            # The same coroutines with nothing to redraw
+            self.game.countdown += 1
+            run(main._handle_countdown_tick())
+
+        # Each call creates its coroutine objects; drawing adds nothing
+        self.assertEqual(self.allocated(tick), self.allocated(tick_unchanged))
+
+
+if __name__ == "__main__":
+    unittest.main()
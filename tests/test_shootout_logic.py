@@ -10,7 +10,7 @@ class TestShootoutLogic(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         # Mock utime and uasyncio
         self.mock_utime = MagicMock()
-        self.mock_utime.ticks_ms.return_value = 1000
+        self.mock_utime.ticks_us.return_value = 1_000_000
         self.mock_utime.ticks_diff.side_effect = lambda a, b: a - b
 
         self.mock_asyncio = AsyncMock()
@@ -37,33 +37,33 @@ class TestShootoutLogic(unittest.IsolatedAsyncioTestCase):
         self.sm.update_state(State_Machine.SHOOTOUT_ANNOUNCEMENT)
 
         # Press MAKE -> P1 WAIT
-        self.mock_utime.ticks_ms.return_value = 2000
+        self.mock_utime.ticks_us.return_value = 2_000_000
         await button_logic.handle_make(self.sm, self.game, self.hw)
         self.assertEqual(self.sm.state, State_Machine.SHOOTOUT_P1_WAIT)
         self.hw.render_shootout_stopwatch.assert_called_with(self.sm, self.game, 0)
 
         # Press MAKE -> P1 RUNNING
-        self.mock_utime.ticks_ms.return_value = 3000
+        self.mock_utime.ticks_us.return_value = 3_000_000
         await button_logic.handle_make(self.sm, self.game, self.hw)
         self.assertEqual(self.sm.state, State_Machine.SHOOTOUT_P1_RUNNING)
-        self.assertEqual(self.game.shootout_start_tick, 3000)
+        self.assertEqual(self.game.shootout_start_tick, 3_000_000)
 
         # Wait a bit and press MAKE -> P2 WAIT
-        self.mock_utime.ticks_ms.return_value = 10000  # 7 seconds later
+        self.mock_utime.ticks_us.return_value = 10_004_567  # 7.004567 s later
         await button_logic.handle_make(self.sm, self.game, self.hw)
         self.assertEqual(self.sm.state, State_Machine.SHOOTOUT_P2_WAIT)
-        self.assertEqual(self.game.p1_shootout_time, 7000)
+        self.assertEqual(self.game.p1_shootout_time, 7004)  # ms
         self.hw.render_shootout_stopwatch.assert_called_with(self.sm, self.game, 0)
 
         # Press MAKE -> P2 RUNNING
-        self.mock_utime.ticks_ms.return_value = 11000
+        self.mock_utime.ticks_us.return_value = 11_000_000
         await button_logic.handle_make(self.sm, self.game, self.hw)
         self.assertEqual(self.sm.state, State_Machine.SHOOTOUT_P2_RUNNING)
-        self.assertEqual(self.game.shootout_start_tick, 11000)
+        self.assertEqual(self.game.shootout_start_tick, 11_000_000)
 
         # Press MAKE -> VICTORY
         self.game.p1_shootout_time = 10000  # 10s
-        self.mock_utime.ticks_ms.return_value = 23000  # 12 seconds later (11000 to 23000)
+        self.mock_utime.ticks_us.return_value = 23_000_000  # 12 seconds later
 
         await button_logic.handle_make(self.sm, self.game, self.hw)
         self.assertEqual(self.sm.state, State_Machine.VICTORY)
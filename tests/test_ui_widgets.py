@@ -0,0 +1,424 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call
+
+from oled_fakes import load_driver, make_oled
+
+from lib import ui
+from lib.fonts import SEVEN_SEGMENT
+from lib.models import Game_Stats, State_Machine
+from lib.ui_widgets import ALL, MATCH_ROW, Widget, gameplay_screen
+
+
+class TestGameplayScreen(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.sm = State_Machine()
+        self.game = Game_Stats()
+        self.game.selected_profile = "APA"
+        self.game.profile_based_countdown = 20
+        self.game.extension_duration = 25
+        self.oled = MagicMock()
+        self.oled.show_async = AsyncMock()
+        self.oled.black = 0
+        self.oled.white = 1
+        self.screen = gameplay_screen(self.game)
+
+    def render(self):
+        self.oled.reset_mock()
+        ui.draw_timer_display(self.sm, self.game, self.oled)
+
+    def test_screen_belongs_to_the_game(self):
+        self.assertIs(gameplay_screen(self.game), self.screen)
+        self.game.reset()
+        self.assertIsNot(gameplay_screen(self.game), self.screen)
+
+    def test_nothing_drawn_until_mounted(self):
+        self.render()
+        self.assertEqual(self.oled.method_calls, [])
+
+    async def test_idle_mode_paints_everything_once(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.oled.text_scaled.assert_any_call("0", 0, 56, 1)  # P1 score
+        self.oled.rect.assert_any_call(55, 56, 8, 8, self.oled.white, True)  # shooter
+        self.assertEqual(self.oled.blit_pages.call_count, 2)  # shot clock
+
+        # Nothing changed since: the next frame draws nothing
+        self.render()
+        self.assertEqual(self.oled.method_calls, [])
+
+    async def test_tick_repaints_only_the_shot_clock(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.game.countdown -= 1  # 45 -> 44
+        self.render()
+        self.oled.blit_pages.assert_called_once()
+        self.oled.text_scaled.assert_not_called()
+        self.oled.line.assert_not_called()
+
+    async def test_score_change_repaints_scores_only(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.game.add_score(2)
+        self.render()
+        self.oled.text_scaled.assert_any_call("1", 97, 56, 1)
+        self.oled.blit_pages.assert_not_called()
+        self.oled.line.assert_not_called()  # the shooter indicator stays
+
+    async def test_turn_change_repaints_the_indicator(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.game.inning_counter += 0.5
+        self.render()
+        self.oled.rect.assert_any_call(65, 56, 8, 8, self.oled.white, True)
+        self.oled.text_scaled.assert_not_called()
+
+    async def test_covering_screen_stops_ticks(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.sm.update_state(State_Machine.MENU)
+        await ui.render_menu(self.sm, self.game, self.oled)
+        self.assertEqual(self.screen.mounted, 0)
+
+        self.game.countdown -= 1
+        self.render()
+        self.assertEqual(self.oled.method_calls, [])
+
+    async def test_message_keeps_the_match_row_live(self):
+        self.game.selected_profile = "Ultimate Pool"
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        await ui.render_message(self.sm, self.game, self.oled, "Confirm Win?")
+        self.assertEqual(self.screen.mounted, MATCH_ROW)
+
+        self.game.countdown -= 1
+        self.game.match_countdown -= 1  # 30:00 -> 29:59
+        self.render()
+        self.oled.blit_pages.assert_not_called()  # shot clock stays covered
+        self.oled.text_scaled.assert_any_call("9", 77, 56, 1)
+
+    def test_match_clock_strip_clear_repaints_indicators(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.game.match_countdown = 601
+        self.screen.mount(ALL)
+        ui.draw_timer_display(self.sm, self.game, self.oled)
+
+        # Crossing 10:00 clears the whole strip; the indicators come back shifted
+        self.game.match_countdown = 599
+        self.render()
+        self.oled.rect.assert_any_call(41, 56, 46, 8, self.oled.black, True)
+        self.oled.rect.assert_any_call(39, 56, 8, 8, self.oled.white, True)
+        # No minutes-tens digit below 10:00
+        x_positions = [c.args[1] for c in self.oled.text_scaled.call_args_list]
+        self.assertNotIn(43, x_positions)
+
+    def test_base_widget_paints_nothing(self):
+        widget = Widget(1, ("countdown",))
+        widget.update(self.oled, self.sm, self.game)
+        self.assertFalse(widget.paint(self.oled, self.sm, self.game, True))
+        self.assertEqual(self.oled.method_calls, [])
+
+
+class TestGameplayWidgets(unittest.TestCase):
+    """What each widget draws, painted fresh and then on a change."""
+
+    def setUp(self):
+        self.sm = State_Machine()
+        self.game = Game_Stats()
+        self.game.selected_profile = "APA"
+        self.oled = MagicMock()
+        self.oled.black = 0
+        self.oled.white = 1
+        self.screen = gameplay_screen(self.game)
+        self.screen.mount()
+
+    def render(self):
+        self.oled.reset_mock()
+        self.screen.render(self.oled, self.sm, self.game)
+
+    def set_scores(self, p1, p1_target, p2, p2_target):
+        self.game.player_1_score = p1
+        self.game.player_1_target = p1_target
+        self.game.player_2_score = p2
+        self.game.player_2_target = p2_target
+
+    def test_scoreline_apa_alignment(self):
+        self.set_scores(10, 38, 5, 14)
+        self.render()
+
+        # P1 score 10 (region 0, 14). Right align -> 1 + 14 - 16 = -1.
+        self.oled.text_scaled.assert_any_call("10", -1, 56, 1)
+        # P1 sep (region 14, 8). Center align -> 15 + (8-8)//2 = 15.
+        self.oled.text_scaled.assert_any_call("/", 15, 56, 1)
+        # P1 target 38 (region 22, 14). Left align -> 23.
+        self.oled.text_scaled.assert_any_call("38", 23, 56, 1)
+        # P2 score 5 (region 91, 14). Right align -> 91 + 14 - 8 = 97.
+        self.oled.text_scaled.assert_any_call("5", 97, 56, 1)
+        # P2 sep (region 105, 8). Center -> 105.
+        self.oled.text_scaled.assert_any_call("/", 105, 56, 1)
+        # P2 target 14 (region 113, 14). Left align -> 113.
+        self.oled.text_scaled.assert_any_call("14", 113, 56, 1)
+
+    def test_scoreline_ultimate_pool_alignment(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.set_scores(10, 38, 5, 14)
+        self.render()
+
+        # UP P1 score 10 (region 0, 8). Right align -> 8-16 = -8.
+        self.oled.text_scaled.assert_any_call("10", -8, 56, 1)
+        self.oled.text_scaled.assert_any_call("/", 8, 56, 1)
+        self.oled.text_scaled.assert_any_call("38", 16, 56, 1)
+        # UP P2 score 5 (region 104, 8). Right align -> 104 + 8 - 8 = 104.
+        self.oled.text_scaled.assert_any_call("5", 104, 56, 1)
+        self.oled.text_scaled.assert_any_call("/", 112, 56, 1)
+        self.oled.text_scaled.assert_any_call("14", 120, 56, 1)
+
+    def test_scoreline_p1_single_digit_pulls_target_in(self):
+        self.set_scores(0, 0, 10, 5)
+        self.render()
+
+        # P1 score 0 left-aligned; separator and target shift left by 6
+        self.oled.text_scaled.assert_any_call("0", 0, 56, 1)
+        self.oled.text_scaled.assert_any_call("/", 8, 56, 1)
+        self.oled.text_scaled.assert_any_call("0", 16, 56, 1)
+        # P2 score 10 (region 91, 14). Right align -> 91 + 14 - 16 = 89.
+        self.oled.text_scaled.assert_any_call("10", 89, 56, 1)
+        self.oled.text_scaled.assert_any_call("/", 105, 56, 1)
+        self.oled.text_scaled.assert_any_call("5", 113, 56, 1)
+
+    def test_shooter_indicator_follows_the_turn(self):
+        self.render()
+        self.oled.rect.assert_any_call(55, 56, 8, 8, self.oled.white, True)
+
+        self.game.inning_counter = 1.5  # P2 turn
+        self.render()
+        # shooter_indicator_2 (65, 56, 8, 8), filled
+        self.oled.rect.assert_any_call(65, 56, 8, 8, self.oled.white, True)
+
+    def test_ultimate_pool_indicators(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.game.match_countdown = 1800  # Not shifted
+        self.render()
+
+        self.oled.rect.assert_any_call(33, 56, 8, 8, self.oled.black, True)
+        self.oled.rect.assert_any_call(87, 56, 8, 8, self.oled.black, True)
+        # The shifted slots overlap the clock digits, so they stay untouched
+        calls = self.oled.rect.call_args_list
+        self.assertFalse(any(c.args == (39, 56, 8, 8, 0, True) for c in calls))
+        self.assertFalse(any(c.args == (81, 56, 8, 8, 0, True) for c in calls))
+        # P1 indicator (filled) at x=33
+        self.oled.rect.assert_any_call(33, 56, 8, 8, self.oled.white, True)
+
+    def test_ultimate_pool_indicators_shifted(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.game.match_countdown = 500  # Shifted
+        self.render()
+
+        # Both sets of slots are cleared
+        self.oled.rect.assert_any_call(33, 56, 8, 8, self.oled.black, True)
+        self.oled.rect.assert_any_call(87, 56, 8, 8, self.oled.black, True)
+        self.oled.rect.assert_any_call(39, 56, 8, 8, self.oled.black, True)
+        self.oled.rect.assert_any_call(81, 56, 8, 8, self.oled.black, True)
+        # P1 indicator (filled) at the shifted x=39
+        self.oled.rect.assert_any_call(39, 56, 8, 8, self.oled.white, True)
+
+    def test_timeout_pips(self):
+        self.game.player_1_timeouts_remaining = 2
+        self.game.player_2_timeouts_remaining = 2
+        self.render()
+        # P1 region starts at 40, P2 at 76
+        self.oled.rect.assert_any_call(40, 58, 4, 4, self.oled.white, True)
+        self.oled.rect.assert_any_call(48, 58, 4, 4, self.oled.white, True)
+        self.oled.rect.assert_any_call(76, 58, 4, 4, self.oled.white, True)
+        self.oled.rect.assert_any_call(84, 58, 4, 4, self.oled.white, True)
+
+        self.game.player_1_timeouts_remaining = 1
+        self.game.player_2_timeouts_remaining = 1
+        self.render()
+        # P1: 40+4 = 44. P2: 76+4 = 80.
+        self.oled.rect.assert_any_call(44, 58, 4, 4, self.oled.white, True)
+        self.oled.rect.assert_any_call(80, 58, 4, 4, self.oled.white, True)
+
+    def test_shot_clock_redraws_only_changed_digits(self):
+        glyph = SEVEN_SEGMENT.glyph
+        self.game.countdown = 25
+        self.render()
+        self.assertEqual(self.oled.blit_pages.call_count, 2)
+
+        self.game.countdown = 24
+        self.render()
+        self.oled.blit_pages.assert_called_once_with(glyph("4"), 80, 0, 32)
+
+        self.game.countdown = 10
+        self.render()
+        self.game.countdown = 9
+        self.render()
+        self.oled.blit_pages.assert_has_calls(
+            [call(glyph("0"), 16, 0, 32), call(glyph("9"), 80, 0, 32)]
+        )
+
+    def test_match_clock_redraws_only_changed_digits(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.game.match_countdown = 1800  # 30:00
+        self.render()
+
+        self.game.match_countdown = 1799  # 29:59: four digit cells
+        self.render()
+        self.assertEqual(self.oled.rect.call_count, 4)
+
+        self.game.match_countdown = 1798  # 29:58: the last digit only
+        self.render()
+        self.assertEqual(self.oled.rect.call_count, 1)
+        self.oled.text_scaled.assert_called_once_with("8", 77, 56, 1)
+
+    def test_match_clock_drops_the_minutes_tens_below_10_minutes(self):
+        self.game.selected_profile = "Ultimate Pool"
+        self.game.match_countdown = 540  # 9:00
+        self.render()
+
+        x_positions = [c.args[1] for c in self.oled.text_scaled.call_args_list]
+        self.assertNotIn(43, x_positions)
+        self.assertIn(48, x_positions)  # 9
+        self.assertIn(56, x_positions)  # :
+        self.assertIn(63, x_positions)  # 0
+        self.assertIn(72, x_positions)  # 0
+
+
+class TestOverlayRestore(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+        self.sm = State_Machine()
+        self.game = self.new_game()
+
+    def new_game(self, profile="APA"):
+        game = Game_Stats()
+        game.selected_profile = profile
+        game.profile_based_countdown = 20
+        game.extension_duration = 25
+        return game
+
+    async def open_menu(self):
+        self.sm.update_state(State_Machine.MENU)
+        await ui.render_menu(self.sm, self.game, self.oled)
+
+    async def test_closing_the_menu_restores_the_gameplay_pixels(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        gameplay = bytes(self.oled.buffer)
+
+        await self.open_menu()
+        self.assertNotEqual(bytes(self.oled.buffer), gameplay)
+
+        self.oled.text_scaled = MagicMock(wraps=self.oled.text_scaled)
+        self.oled.blit_pages = MagicMock(wraps=self.oled.blit_pages)
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.assertEqual(bytes(self.oled.buffer), gameplay)
+        # Nothing on the gameplay screen changed, so nothing was redrawn
+        self.oled.text_scaled.assert_not_called()
+        self.oled.blit_pages.assert_not_called()
+
+    async def test_changes_underneath_are_caught_up(self):
+        self.game = self.new_game("Ultimate Pool")
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        await ui.render_message(self.sm, self.game, self.oled, "Confirm Win?")
+        self.sm.update_state(State_Machine.CONFIRM_RACK_END)
+        await self.open_menu()
+
+        self.game.match_countdown -= 61  # 30:00 -> 28:59
+        self.game.add_score(1)
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+
+        # Same pixels as drawing that state from scratch
+        fresh = make_oled(self.driver)
+        game = self.new_game("Ultimate Pool")
+        game.match_countdown = self.game.match_countdown
+        game.add_score(1)
+        await ui.enter_idle_mode(State_Machine(), game, fresh)
+        self.assertEqual(bytes(self.oled.buffer), bytes(fresh.buffer))
+
+    async def test_shot_updates_the_screen_in_place(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.sm.update_state(State_Machine.COUNTDOWN_IN_PROGRESS)
+        self.game.countdown = 7
+        self.game.add_score(1)
+        self.game.inning_counter += 0.5
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+
+        fresh = make_oled(self.driver)
+        game = self.new_game()
+        game.add_score(1)
+        game.inning_counter += 0.5
+        await ui.enter_idle_mode(State_Machine(), game, fresh)
+        self.assertEqual(bytes(self.oled.buffer), bytes(fresh.buffer))
+
+    async def test_replacing_screen_drops_the_saved_base(self):
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        await self.open_menu()
+        await ui.render_victory(self.sm, self.game, self.oled, 1)
+
+        screen = gameplay_screen(self.game)
+        self.assertFalse(screen.restore(self.oled))
+
+
+class TestScorelineDigits(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.driver = load_driver()
+        self.oled = make_oled(self.driver)
+
+    def new_game(self, profile, p1_target=7):
+        game = Game_Stats()
+        game.selected_profile = profile
+        game.player_1_target = p1_target
+        game.player_2_target = 12
+        return game
+
+    async def assert_like_fresh(self, profile, scores, p1_target=7):
+        sm, game = State_Machine(), self.new_game(profile, p1_target)
+        await ui.enter_idle_mode(sm, game, self.oled)
+        for p1, p2 in scores:
+            game.set_score(1, p1)
+            game.set_score(2, p2)
+            ui.draw_timer_display(sm, game, self.oled)
+
+            fresh = make_oled(self.driver)
+            expected = self.new_game(profile, p1_target)
+            expected.set_score(1, p1)
+            expected.set_score(2, p2)
+            await ui.enter_idle_mode(State_Machine(), expected, fresh)
+            self.assertEqual(bytes(self.oled.buffer), bytes(fresh.buffer), (p1, p2))
+
+    async def test_score_changes_draw_the_same_pixels(self):
+        scores = ((1, 0), (1, 9), (9, 10), (10, 11), (12, 11), (8, 11), (8, 9))
+        for profile in ("APA", "WNT", "Ultimate Pool"):
+            await self.assert_like_fresh(profile, scores)
+
+    async def test_score_decreases_draw_the_same_pixels(self):
+        # A two-digit P1 target moves with the score's offset
+        scores = ((12, 3), (9, 3), (10, 3), (1, 3))
+        for profile in ("APA", "BCA", "WNT", "Ultimate Pool"):
+            await self.assert_like_fresh(profile, scores, p1_target=15)
+
+    async def test_timeout_changes_draw_the_same_pixels(self):
+        for profile in ("APA", "WNT"):
+            sm, game = State_Machine(), self.new_game(profile)
+            await ui.enter_idle_mode(sm, game, self.oled)
+            for left in (2, 1, 0):
+                game.player_1_timeouts_remaining = left
+                game.player_2_timeouts_remaining = left
+                ui.draw_timer_display(sm, game, self.oled)
+
+                fresh = make_oled(self.driver)
+                expected = self.new_game(profile)
+                expected.player_1_timeouts_remaining = left
+                expected.player_2_timeouts_remaining = left
+                await ui.enter_idle_mode(State_Machine(), expected, fresh)
+                self.assertEqual(
+                    bytes(self.oled.buffer), bytes(fresh.buffer), (profile, left)
+                )
+
+    async def test_score_change_redraws_one_digit(self):
+        sm, game = State_Machine(), self.new_game("WNT")
+        game.set_score(2, 10)
+        await ui.enter_idle_mode(sm, game, self.oled)
+
+        self.oled.text_scaled = MagicMock(wraps=self.oled.text_scaled)
+        game.add_score(2)
+        ui.draw_timer_display(sm, game, self.oled)
+        self.oled.text_scaled.assert_called_once_with("1", 97, 56, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
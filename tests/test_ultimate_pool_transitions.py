@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from lib import ui
 from lib.models import Game_Stats, State_Machine
@@ -10,6 +10,7 @@ class TestUltimatePoolTransitions(unittest.IsolatedAsyncioTestCase):
         self.sm = State_Machine()
         self.game = Game_Stats()
         self.oled = MagicMock()
+        self.oled.show_async = AsyncMock()
         self.oled.black = 0
         self.oled.white = 1
         self.game.selected_profile = "Ultimate Pool"
@@ -51,6 +52,21 @@ class TestUltimatePoolTransitions(unittest.IsolatedAsyncioTestCase):
         # ASSERT: "everything" cleared regardless of prev state
         self.oled.rect.assert_any_call(0, 0, 128, 64, 0, True)
 
+    async def test_enter_idle_after_a_shot_updates_in_place(self):
+        self.game.selected_profile = "APA"
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+        self.sm.update_state(State_Machine.COUNTDOWN_IN_PROGRESS)
+        self.game.add_score(1)
+        self.oled.reset_mock()
+
+        await ui.enter_idle_mode(self.sm, self.game, self.oled)
+
+        # No blank frame: only the changed score is drawn, in a single flush
+        calls = self.oled.rect.call_args_list
+        self.assertNotIn((0, 0, 128, 64, 0, True), [c.args for c in calls])
+        self.oled.text_scaled.assert_called_once_with("1", 0, 56, 1)
+        self.oled.show_async.assert_awaited_once()
+
 
 if __name__ == "__main__":
     unittest.main()
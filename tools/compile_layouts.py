@@ -0,0 +1,203 @@
+"""
+Offline layout compiler for the static text.
+
+Reads hardware_config.DISPLAY_REGIONS and the static strings below and
+writes lib/layouts.py: for every piece of static text, the clear rectangle
+and text position draw_text_in_region() (or render_message(), for the
+messages) would work out at runtime. display.draw_layout() then draws it
+with no measuring, aligning or splitting on the device.
+
+Run from the repository root after changing a region or a string:
+
+    python tools/compile_layouts.py          # rewrite lib/layouts.py
+    python tools/compile_layouts.py --check  # exit 1 if it is out of date
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "lib" / "layouts.py"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from lib.hardware_config import DISPLAY_REGIONS  # noqa: E402
+
+# Handle name -> lines as (region, text, font_size, align, y_offset), drawn
+# like draw_text_in_region() with its region cleared first
+TEXTS = {
+    "PROFILE_TITLE": (("profile_title_selection", "Select Game:", 1, "center", 0),),
+    "PROFILE_APA": (("profile_selection_value", "APA", 3, "center", 0),),
+    "PROFILE_BCA": (("profile_selection_value", "BCA", 3, "center", 0),),
+    "PROFILE_WNT": (("profile_selection_value", "WNT", 3, "center", 0),),
+    "PROFILE_ULTIMATE_POOL": (
+        ("profile_selection_alt_value", "Ultimate", 2, "center", 0),
+        ("profile_selection_alt_value_2", "Pool", 2, "center", 0),
+    ),
+    "PROFILE_TIMEOUTS_MODE": (
+        ("profile_selection_alt_value", "Timeouts", 2, "center", 0),
+        ("profile_selection_alt_value_2", "Mode", 2, "center", 0),
+    ),
+    "SKILL_LEVEL_PLAYER_1": (("skill_level_player", "Player 1", 1, "center", 0),),
+    "SKILL_LEVEL_PLAYER_2": (("skill_level_player", "Player 2", 1, "center", 0),),
+    "SKILL_LEVEL_LABEL": (("skill_level_label", "Skill Level:", 1, "center", 0),),
+    "GAME_TYPE_TITLE": (("game_type_title", "Select Game:", 1, "center", 0),),
+    "GAME_TYPE_8_BALL": (("game_type_value", "8-Ball", 2, "center", 0),),
+    "GAME_TYPE_9_BALL": (("game_type_value", "9-Ball", 2, "center", 0),),
+    "WNT_TARGET_TITLE": (("wnt_target_title", "Race to", 1, "center", 0),),
+    "VICTORY_TITLE": (("victory_title", "VICTORY!", 2, "center", 0),),
+    "VICTORY_WINNER_1": (("victory_winner", "Player 1", 2, "center", 0),),
+    "VICTORY_WINNER_2": (("victory_winner", "Player 2", 2, "center", 0),),
+    "MENU_HEADER": (
+        ("menu_header_left", "Game", 2, "left", 0),
+        ("menu_header_right", "Menu", 2, "left", 0),
+    ),
+    "EXIT_CONFIRMATION": (("confirmation_message", "Are you sure?", 1, "center", 0),),
+    "TIMEOUTS_MODE_TITLE": (("timeouts_mode_title", "Timeouts Mode", 1, "left", 0),),
+    "SHOOTOUT_PLAYER_1": (("up_shootout_current_shooter", "Player 1", 2, "center", -2),),
+    "SHOOTOUT_PLAYER_2": (("up_shootout_current_shooter", "Player 2", 2, "center", -2),),
+    "TIME_TO_BEAT": (("up_shootout_p1_title", "Time to beat", 1, "center", 0),),
+}
+
+# Handle name -> (message, font_size), laid out like render_message() on a
+# panel it has already cleared
+MESSAGES = {
+    "CONFIRM_WIN": ("Confirm Win?", 1),
+    "CONFIRM_LOSS": ("Confirm Loss?", 1),
+    "SHOOTOUT_ANNOUNCEMENT": ("6 Ball\nShootout", 2),
+}
+
+# Lookups emitted as dicts: the key -> a handle name
+PROFILE_NAMES = {
+    "APA": "PROFILE_APA",
+    "BCA": "PROFILE_BCA",
+    "Timeouts Mode": "PROFILE_TIMEOUTS_MODE",
+    "Ultimate Pool": "PROFILE_ULTIMATE_POOL",
+    "WNT": "PROFILE_WNT",
+}
+
+# Handles emitted as tuples, e.g. indexed by player number - 1
+GROUPS = {
+    "SKILL_LEVEL_PLAYERS": ("SKILL_LEVEL_PLAYER_1", "SKILL_LEVEL_PLAYER_2"),
+    # Indexed by temp_setting_value: 0 for 8-Ball, 1 for 9-Ball
+    "GAME_TYPES": ("GAME_TYPE_8_BALL", "GAME_TYPE_9_BALL"),
+    "VICTORY_WINNERS": ("VICTORY_WINNER_1", "VICTORY_WINNER_2"),
+    "SHOOTOUT_PLAYERS": ("SHOOTOUT_PLAYER_1", "SHOOTOUT_PLAYER_2"),
+}
+
+HEADER = '''"""
+Precomputed placement of the static text.
+
+Generated by tools/compile_layouts.py from hardware_config.DISPLAY_REGIONS;
+do not edit. Each handle is a run of steps, one per line of text: the rect
+to clear (no clear when its width is 0), then the text's position and scale.
+See display.draw_layout().
+"""
+
+from array import array
+
+FIELDS = 7  # per step: clear x, y, w, h, then text x, y, scale
+'''
+
+
+def text_step(region, text, font_size, align, y_offset):
+    """One line as draw_text_in_region() places it with TextOptions of this
+    font size, alignment and y offset."""
+    x, y, w, h = DISPLAY_REGIONS[region]
+    y += y_offset
+    size = 8 * font_size
+    text_w = len(text) * size
+    if align == "center":
+        draw_x = x + (w - text_w) // 2
+    elif align == "right":
+        draw_x = x + w - text_w
+    else:
+        draw_x = x
+    return (x, y, w, h, draw_x, y + (h - size) // 2, font_size, text)
+
+
+def message_steps(message, font_size):
+    """The lines of a message as render_message() places them."""
+    rx, ry, rw, rh = DISPLAY_REGIONS["confirmation_message"]
+    lines = message.split("\n")
+    line_height = 8 * font_size + 4
+    y_pos = max(ry + (rh - len(lines) * line_height) // 2, ry)
+    steps = []
+    for line in lines:
+        x_pos = max(rx + (rw - len(line) * 8 * font_size) // 2, rx)
+        steps.append((0, 0, 0, 0, x_pos, y_pos, font_size, line))
+        y_pos += line_height
+    return steps
+
+
+def literal(value):
+    """value as ruff format would write it: strings in double quotes."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, tuple):
+        return "(" + ", ".join(literal(v) for v in value) + ")"
+    return repr(value)
+
+
+def compile_handles():
+    """(handle name, steps) in handle order."""
+    handles = [
+        (name, [text_step(*line) for line in lines]) for name, lines in TEXTS.items()
+    ]
+    handles += [(name, message_steps(*spec)) for name, spec in MESSAGES.items()]
+    return handles
+
+
+def generate():
+    """The source of lib/layouts.py."""
+    handles = compile_handles()
+    out = [HEADER, "# Handles, in step order"]
+    out += [f"{name} = {i}" for i, (name, _) in enumerate(handles)]
+
+    out.append("\n# First step of each handle; the last entry ends the last handle")
+    out.append('FIRST = array(\n    "h",\n    [')
+    first = 0
+    for _, steps in handles:
+        out.append(f"        {first},")
+        first += len(steps)
+    out.append(f"        {first},\n    ],\n)")
+
+    # One step per line, which ruff format would split into one value per line
+    out.append("\n# FIELDS values per step, the steps in handle order\n# fmt: off")
+    out.append('STEPS = array("h", [')
+    for name, steps in handles:
+        out.append(f"    # {name}")
+        out += ["    " + ", ".join(str(v) for v in step[:-1]) + "," for step in steps]
+    out.append("])\n# fmt: on")
+    out.append("# The text of each step")
+    out.append("TEXTS = (")
+    for name, steps in handles:
+        out.append(f"    # {name}")
+        out += [f"    {literal(step[-1])}," for step in steps]
+    out.append(")")
+
+    out.append("\nPROFILE_NAMES = {")
+    out += [f"    {literal(key)}: {name}," for key, name in PROFILE_NAMES.items()]
+    out.append("}")
+    out.append("MESSAGES = {")
+    out += [f"    {literal(spec)}: {name}," for name, spec in MESSAGES.items()]
+    out.append("}")
+    for group, names in GROUPS.items():
+        out.append(f"{group} = ({', '.join(names)})")
+    return "\n".join(out) + "\n"
+
+
+def main(argv):
+    source = generate()
+    if "--check" in argv:
+        if OUTPUT.read_text() != source:
+            print(f"{OUTPUT.relative_to(ROOT)} is out of date; run {argv[0]}")
+            return 1
+        return 0
+    OUTPUT.write_text(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))